@@ -1,109 +1,246 @@
 import atexit
 import click
+import itertools
+import json
 import logging
 import orrb
 import orrb.utils as utils
-import os
+import platform
 import sys
 import time
 
 import numpy as np
 
 from mpi4py import MPI
-from queue import Queue
+from threading import Lock
+
+_MODALITIES = ['depth', 'normals', 'segmentation']
 
 
 def _load_states():
     return np.loadtxt(utils.package_relative_path('assets/states/qpos.csv'), delimiter=',')
 
 
-def _build_renderer(num_gpus, num_workers, base_port, mpi_rank, mpi_size,
-                    render_depth, render_segmentation, render_normals):
+def _parse_list(value, parse=int):
+    return [parse(item) for item in value.split(',') if item]
+
+
+def _parse_resolution(value):
+    width, height = value.split('x')
+    return int(width), int(height)
+
+
+def _parse_modalities(value):
+    # rgb is always rendered, e.g.: 'rgb', 'rgb+depth', 'rgb+depth+normals+segmentation'.
+    modalities = [modality for modality in value.split('+') if modality != 'rgb']
+    for modality in modalities:
+        if modality not in _MODALITIES:
+            raise click.BadParameter(f'Unknown modality: {modality}.')
+    return modalities
+
+
+def _point_key(point):
+    return (f'batch={point["batch_size"]} res={point["width"]}x{point["height"]} '
+            f'cams={point["cameras"]} mod={point["modalities"]} '
+            f'workers={point["workers_per_gpu"]} depth={point["pipeline_depth"]}')
+
+
+def _build_renderer(num_gpus, workers_per_gpu, pipeline_depth, base_port, mpi_rank, mpi_size,
+                    fake_servers, fake_frame_latency):
     config = orrb.RemoteRendererConfig()
     config.camera_names = ['vision_cam_left', 'vision_cam_top', 'vision_cam_right']
-    config.image_width = 200
-    config.image_height = 200
     config.renderer_version = orrb.get_renderer_version()
     config.model_xml_path = 'dactyl.xml'
     config.model_mapping_path = 'dactyl.mapping'
     config.renderer_config_path = 'dactyl.renderer_config.json'
     config.asset_basedir = utils.package_relative_path('assets')
-    config.render_depth = render_depth
-    config.render_normals = render_normals
-    config.render_segmentation = render_segmentation
+    config.pipeline_depth = pipeline_depth
+    config.max_queued_batches = 2 * num_gpus * workers_per_gpu * pipeline_depth
+    config.fake_servers = fake_servers
+    config.fake_frame_latency = fake_frame_latency
 
-    server_configs = utils.build_server_configs(num_gpus, num_workers, base_port, mpi_rank,
+    server_configs = utils.build_server_configs(num_gpus, workers_per_gpu, base_port, mpi_rank,
                                                 mpi_size)
 
     return config, orrb.RemoteRenderer('OrrbRenderer0', server_configs, config)
 
 
+def _build_workload(states, seed, point, camera_names):
+    # The resolution, cameras and modalities are per batch options, no restarts needed.
+    workload = utils.build_batch(np.resize(states, (point['batch_size'], states.shape[1])), seed)
+    workload['image_width'] = point['width']
+    workload['image_height'] = point['height']
+    workload['camera_names'] = camera_names[:point['cameras']]
+    for modality in _MODALITIES:
+        workload['render_' + modality] = modality in point['modalities'].split('+')
+    return workload
+
+
+def _run_point(renderer, states, point, camera_names, warmup_batches, batches, window,
+               mpi_comm, seed):
+    """Renders warmup_batches, and then measures batches, keeping window batches in flight.
+    Returns the point with the measurements, aggregated over the MPI processes."""
+    latencies = []
+    latencies_lock = Lock()
+
+    def _submit(seed):
+        submit_time = time.time()
+        future = renderer.submit(_build_workload(states, seed, point, camera_names))
+
+        def _on_done(_):
+            with latencies_lock:
+                latencies.append(time.time() - submit_time)
+        future.add_done_callback(_on_done)
+        return future
+
+    def _render(count, seed):
+        in_flight = []
+        for _ in range(count):
+            if len(in_flight) == window:
+                in_flight.pop(0).result()
+            in_flight.append(_submit(seed))
+            seed += point['batch_size']
+        for future in in_flight:
+            future.result()
+        return seed
+
+    seed = _render(warmup_batches, seed)
+    with latencies_lock:
+        latencies.clear()
+    mpi_comm.Barrier()
+
+    start_time = time.time()
+    start_cpu_time = time.process_time()
+    _render(batches, seed)
+    cpu_time = time.process_time() - start_cpu_time
+    delta_time = time.time() - start_time
+    mpi_comm.Barrier()
+
+    frames = batches * point['batch_size'] * point['cameras']
+    total_frames = mpi_comm.allreduce(frames)
+    total_cpu_time = mpi_comm.allreduce(cpu_time)
+    delta_time = mpi_comm.allreduce(delta_time, op=MPI.MAX)
+    with latencies_lock:
+        all_latencies = np.concatenate(mpi_comm.allgather(np.array(latencies)))
+
+    p50, p90, p99 = np.percentile(all_latencies, [50, 90, 99])
+    return dict(point, frames=total_frames, seconds=delta_time,
+                fps=total_frames / delta_time, batches_per_second=len(all_latencies) / delta_time,
+                p50_latency=p50, p90_latency=p90, p99_latency=p99,
+                cpu_time_per_frame=total_cpu_time / total_frames)
+
+
+def _compare(points, baseline_points, tolerance):
+    """Returns the regressions: points slower than the baseline by more than the tolerance."""
+    baseline = {_point_key(point): point for point in baseline_points}
+    regressions = []
+    for point in points:
+        baseline_point = baseline.get(_point_key(point))
+        if baseline_point is None:
+            continue
+        checks = [('fps', point['fps'] < baseline_point['fps'] * (1.0 - tolerance)),
+                  ('p99_latency',
+                   point['p99_latency'] > baseline_point['p99_latency'] * (1.0 + tolerance)),
+                  ('cpu_time_per_frame', point['cpu_time_per_frame'] >
+                   baseline_point['cpu_time_per_frame'] * (1.0 + tolerance))]
+        for metric, regressed in checks:
+            if regressed:
+                regressions.append(f'{_point_key(point)}: {metric} {point[metric]:.4g}, '
+                                   f'baseline: {baseline_point[metric]:.4g}')
+    return regressions
+
+
 @click.command()
 @click.option('--num-gpus', type=int, default=1)
-@click.option('--workers-per-gpu', type=int, default=1)
-@click.option('--iterations', type=int, default=20)
 @click.option('--base-port', type=int, default=7000)
-@click.option('--render-depth', type=bool, default=False)
-@click.option('--render-normals', type=bool, default=False)
-@click.option('--render-segmentation', type=bool, default=False)
-def main(num_gpus, workers_per_gpu, iterations, base_port,
-         render_depth, render_normals, render_segmentation):
+@click.option('--batches', type=int, default=20, help='Measured batches per worker and point.')
+@click.option('--warmup-batches', type=int, default=1, help='Per worker and point.')
+@click.option('--batch-sizes', type=str, default='64')
+@click.option('--resolutions', type=str, default='200x200')
+@click.option('--cameras', type=str, default='3', help='Camera counts.')
+@click.option('--modalities', type=str, default='rgb',
+              help='Modality mixes, e.g.: rgb,rgb+depth+normals+segmentation')
+@click.option('--workers-per-gpu', type=str, default='1')
+@click.option('--pipeline-depths', type=str, default='1')
+@click.option('--camera-names', type=str, default='vision_cam_left,vision_cam_top,vision_cam_right')
+@click.option('--fake-servers', is_flag=True, help='Use orrb.fake_render_server, no GPU needed.')
+@click.option('--fake-frame-latency', type=float, default=0.0)
+@click.option('--output', type=str, default=None, help='Write the results as json.')
+@click.option('--baseline', type=str, default=None, help='Compare with a previous --output.')
+@click.option('--tolerance', type=float, default=0.1, help='Relative regression threshold.')
+def main(num_gpus, base_port, batches, warmup_batches, batch_sizes, resolutions, cameras,
+         modalities, workers_per_gpu, pipeline_depths, camera_names, fake_servers,
+         fake_frame_latency, output, baseline, tolerance):
+    """Sweeps the batch sizes, resolutions, camera counts, modality mixes, workers per gpu and
+    pipeline depths (comma separated lists), and measures the throughput, batch latency
+    percentiles and client cpu time per frame at every point."""
     mpi_comm = MPI.COMM_WORLD
 
     mpi_rank = mpi_comm.Get_rank()
     mpi_size = mpi_comm.Get_size()
 
-    config, renderer = _build_renderer(num_gpus, workers_per_gpu, base_port, mpi_rank, mpi_size,
-                                       render_depth, render_normals, render_segmentation)
-
     states = _load_states()
-    queue = Queue()
-
-    cameras_count = len(config.camera_names)
-    batch_size = len(states)
-    seed = mpi_rank * 11713
-
-    all_workers = num_gpus * workers_per_gpu
-    assert all_workers % mpi_size == 0
-    local_workers = all_workers // mpi_size
-
-    renderer.start()
-
-    atexit.register(utils.renderer_closer, renderer)
-
-    sleep_time = 5.0 + all_workers * 0.5
-    logging.info(f'Sleeping for: {sleep_time}s.')
-    time.sleep(sleep_time)
-
-    logging.info(f'Queueing {iterations} iterations + 1 warmup, on {local_workers} local workers.')
-    for _ in range((iterations + 1) * local_workers):
-        renderer.render_batch_async(utils.build_batch(states, seed), queue)
-        seed += batch_size
-
-    logging.info('Warmup pass.')
-
-    for _ in range(local_workers):
-        result = queue.get()
-        queue.task_done()
-
-    logging.info('Warmup done. Waiting on a barrier.')
-    mpi_comm.Barrier()
-
-    logging.info('Starting benchmark.')
-    start_time = time.time()
-
-    for _ in range(iterations * local_workers):
-        result = queue.get()
-        queue.task_done()
-
-    logging.info('Done. Waiting on a barrier.')
-    mpi_comm.Barrier()
-
-    delta_time = time.time() - start_time
-    total_frames = all_workers * iterations * batch_size * cameras_count
-    fps = float(total_frames) / delta_time
-    if mpi_rank is 0:
-        logging.info(f'{total_frames} frames in {delta_time}s : {fps} fps.')
+    camera_names = _parse_list(camera_names, str)
+    for modality_mix in _parse_list(modalities, str):
+        _parse_modalities(modality_mix)
+    if max(_parse_list(cameras)) > len(camera_names):
+        raise click.BadParameter(f'At most {len(camera_names)} cameras, see --camera-names.')
+
+    points = []
+    # The renderer is restarted for every workers and pipeline depth combination only.
+    for workers, pipeline_depth in itertools.product(_parse_list(workers_per_gpu),
+                                                     _parse_list(pipeline_depths)):
+        all_workers = num_gpus * workers
+        assert all_workers % mpi_size == 0
+        local_workers = all_workers // mpi_size
+
+        config, renderer = _build_renderer(num_gpus, workers, pipeline_depth, base_port,
+                                           mpi_rank, mpi_size, fake_servers,
+                                           fake_frame_latency)
+        time_to_ready = renderer.start()
+        atexit.register(utils.renderer_closer, renderer)
+        logging.info(f'{local_workers} render servers ready in: {time_to_ready:.2f}s.')
+
+        window = 2 * local_workers * pipeline_depth
+        for batch_size, resolution, cameras_count, modality_mix in itertools.product(
+                _parse_list(batch_sizes), _parse_list(resolutions, _parse_resolution),
+                _parse_list(cameras), _parse_list(modalities, str)):
+            point = {'batch_size': batch_size, 'width': resolution[0], 'height': resolution[1],
+                     'cameras': cameras_count, 'modalities': modality_mix,
+                     'workers_per_gpu': workers, 'pipeline_depth': pipeline_depth,
+                     'time_to_ready': time_to_ready}
+            point = _run_point(renderer, states, point, camera_names,
+                               warmup_batches * local_workers, batches * local_workers, window,
+                               mpi_comm, mpi_rank * 11713 + len(points) * 1000003)
+            points.append(point)
+            if mpi_rank == 0:
+                logging.info(f'{_point_key(point)}: {point["fps"]:.1f} fps, latency p50/p90/p99: '
+                             f'{point["p50_latency"] * 1000:.1f}/{point["p90_latency"] * 1000:.1f}'
+                             f'/{point["p99_latency"] * 1000:.1f}ms, cpu per frame: '
+                             f'{point["cpu_time_per_frame"] * 1e6:.1f}us.')
+
+        atexit.unregister(utils.renderer_closer)
+        renderer.shutdown()
+
+    if mpi_rank != 0:
+        return
+
+    if output is not None:
+        with open(output, 'w') as f:
+            json.dump({'num_gpus': num_gpus, 'mpi_size': mpi_size, 'fake_servers': fake_servers,
+                       'fake_frame_latency': fake_frame_latency, 'host': platform.node(),
+                       'orrb_version': orrb.__version__, 'time': time.time(), 'points': points},
+                      f, indent=2)
+        logging.info(f'Results written to: {output}.')
+
+    if baseline is not None:
+        with open(baseline, 'r') as f:
+            regressions = _compare(points, json.load(f)['points'], tolerance)
+        for regression in regressions:
+            logging.warning(f'Regression: {regression}')
+        if regressions:
+            sys.exit(1)
+        logging.info(f'No regressions against: {baseline}.')
 
 
 if __name__ == '__main__':
@@ -48,6 +48,8 @@ def _build_renderer(num_gpus, num_workers, base_port):
     config.render_depth = False
     config.render_normals = False
     config.render_segmentation = False
+    # The evaluation pass renders all the base states in one batch, spread it over all servers.
+    config.shard_workloads = True
 
     server_configs = orrb.utils.build_server_configs(num_gpus, num_workers, base_port, mpi_rank=0,
                                                      mpi_size=1)
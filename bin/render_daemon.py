@@ -0,0 +1,87 @@
+import click
+import logging
+import orrb
+import orrb.utils as utils
+import signal
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue
+
+from orrb.remote_renderer import _RemoteRendererWorker, _build_local_config
+from orrb.server_registry import server_config_hash
+
+
+@click.group()
+def cli():
+    pass
+
+
+@cli.command()
+@click.option('--num-gpus', type=int, default=1)
+@click.option('--workers-per-gpu', type=int, default=1)
+@click.option('--base-port', type=int, default=7500)
+@click.option('--model-xml-path', type=str, default='dactyl.xml')
+@click.option('--model-mapping-path', type=str, default='dactyl.mapping')
+@click.option('--renderer-config-path', type=str, default='dactyl.renderer_config.json')
+@click.option('--asset-basedir', type=str, default=utils.package_relative_path('assets'))
+@click.option('--registry-path', type=str, default=None)
+def start(num_gpus, workers_per_gpu, base_port, model_xml_path, model_mapping_path,
+          renderer_config_path, asset_basedir, registry_path):
+    """Starts long lived render servers, and registers them till interrupted.
+
+    Renderers with attach_servers set, and the same model and renderer config, lease them.
+    """
+    config = orrb.RemoteRendererConfig()
+    config.renderer_version = orrb.get_renderer_version()
+    config.model_xml_path = model_xml_path
+    config.model_mapping_path = model_mapping_path
+    config.renderer_config_path = renderer_config_path
+    config.asset_basedir = asset_basedir
+    config = _build_local_config(config)
+
+    registry = orrb.ServerRegistry(registry_path)
+    config_hash = server_config_hash(config)
+
+    # The workers are used just to spawn, warm up, and restart their servers.
+    workers = [_RemoteRendererWorker(Queue(), device, port, config)
+               for device, port in utils.build_server_configs(num_gpus, workers_per_gpu,
+                                                              base_port, 0, 1)]
+    should_stop = []
+    signal.signal(signal.SIGTERM, lambda *_: should_stop.append(True))
+
+    try:
+        # Start all the servers at once, on_run blocks till the server is ready.
+        with ThreadPoolExecutor(max_workers=len(workers)) as pool:
+            list(pool.map(lambda worker: worker.on_run(), workers))
+        for worker in workers:
+            registry.register(worker.server.host, worker.port, worker.device, model_xml_path,
+                              config_hash)
+            logging.info(f'Registered render server at port {worker.port}.')
+
+        while not should_stop:
+            time.sleep(1.0)
+            for worker in workers:
+                if not worker.server.is_running():
+                    worker.restart_server()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for worker in workers:
+            registry.unregister(worker.port)
+            worker.on_shutdown()
+
+
+@cli.command(name='list')
+@click.option('--registry-path', type=str, default=None)
+def list_servers(registry_path):
+    """Lists the registered render servers, and their leases."""
+    for entry in orrb.ServerRegistry(registry_path).servers():
+        lease = f'leased by {entry["lease"]["pid"]}' if entry['lease'] else 'idle'
+        print(f'{entry["host"]}:{entry["port"]} device: {entry["device"]} '
+              f'model: {entry["model"]} config: {entry["config_hash"][:8]} {lease}')
+
+
+if __name__ == '__main__':
+    utils.setup_logging()
+    cli()
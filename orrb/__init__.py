@@ -1,5 +1,12 @@
-from orrb.remote_renderer import RemoteRenderer, RemoteRendererConfig, get_renderer_executable
+from orrb import utils
+from orrb.async_remote_renderer import AsyncRemoteRenderer
+from orrb.buffer_pool import BufferPool
+from orrb.coalescer import RenderCoalescer
+from orrb.remote_renderer import (RemoteRenderer, RemoteRendererConfig, RendererError,
+                                  get_renderer_executable)
+from orrb.server_registry import ServerRegistry
 from orrb.version import __version__, get_renderer_version
 
-__all__ = ['RemoteRenderer', 'RemoteRendererConfig', 'get_renderer_executable', '__version__',
-           'get_renderer_version']
+__all__ = ['AsyncRemoteRenderer', 'BufferPool', 'RemoteRenderer', 'RemoteRendererConfig',
+           'RenderCoalescer', 'RendererError', 'ServerRegistry', 'get_renderer_executable',
+           '__version__', 'get_renderer_version']
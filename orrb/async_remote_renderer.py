@@ -0,0 +1,270 @@
+import asyncio
+import grpc
+import time
+
+from copy import deepcopy
+
+from grpc import aio
+
+from orrb.remote_renderer import (DEFAULT_GRPC_MESSAGE_SIZE, RendererError, _BatchDecoder,
+                                  _ConfigVersions, _RenderServer, _WorkloadWithConfig,
+                                  _build_local_config, _build_render_batch_request,
+                                  _build_warmup_request, _convert_render_batch_response,
+                                  _create_raw_update_method, _effective_config,
+                                  _get_server_bind_host, _is_serving, _load_renderer_config,
+                                  _merge_shards, _render_server_error, _select_server_configs,
+                                  _shards_count, _split_workload)
+
+import orrb.protos.RenderService_pb2 as render_service_pb2
+import orrb.protos.RenderService_pb2_grpc as render_service_pb2_grpc
+
+
+def _create_async_render_service_channel(port, message_size=DEFAULT_GRPC_MESSAGE_SIZE):
+    return aio.insecure_channel('%s:%d' % (_get_server_bind_host(), port),
+                                [('grpc.max_receive_message_length', message_size)])
+
+
+class _AsyncRemoteRendererWorker:
+
+    def __init__(self, device, port, base_config, buffer_pool=None):
+        self.device = device
+        self.port = port
+        self.base_config = base_config
+        self.buffer_pool = buffer_pool
+        self.server = _RenderServer(device, port, base_config)
+        self.channel = None
+        self.client_stub = None
+        self.raw_update = None
+        self.time_to_ready = None
+        # Guards the renders in flight, an update waits for them so that no batch renders
+        # with a config other than its own, and no batch overtakes the update it depends on.
+        self.condition = asyncio.Condition()
+        self.in_flight = 0
+
+    async def start(self):
+        started = time.time()
+        self.server.spawn()
+        self.channel = _create_async_render_service_channel(self.port)
+        self.client_stub = render_service_pb2_grpc.RenderServiceStub(self.channel)
+        self.raw_update = _create_raw_update_method(self.channel)
+        if not await self._wait_until_ready(self.base_config.server_start_timeout):
+            raise RendererError(f'Render server at port {self.port} is not ready, check '
+                                f'/tmp/StandaloneRenderer.{self.port}.log.')
+        if self.base_config.warmup_render:
+            try:
+                await self.client_stub.RenderBatch(_build_warmup_request(self.base_config),
+                                                   timeout=self.base_config.server_start_timeout)
+            except grpc.RpcError as error:
+                raise _render_server_error(self.port, error) from error
+        self.time_to_ready = time.time() - started
+
+    async def _wait_until_ready(self, timeout):
+        deadline = time.time() + timeout
+        while time.time() < deadline and self.server.is_running():
+            try:
+                await self.client_stub.Health(render_service_pb2.HealthRequest(),
+                                              timeout=min(1.0, deadline - time.time()),
+                                              wait_for_ready=True)
+                return True
+            except grpc.RpcError as error:
+                if _is_serving(error):
+                    return True
+        return False
+
+    async def shutdown(self):
+        if self.channel is not None:
+            await self.channel.close()
+            self.channel = None
+        await asyncio.get_running_loop().run_in_executor(
+            None, self.server.kill, self.base_config.shutdown_grace_period)
+
+    async def _update(self, workload_with_config):
+        # Has to hold the condition.
+        await self.condition.wait_for(
+            lambda: self.in_flight == 0 or (self.server.renderer_config_stamp ==
+                                            workload_with_config.renderer_config_stamp))
+        update_request = self.server.update_request(workload_with_config)
+        if update_request is None:
+            return
+        # The server is up to date once it acknowledges the update. If the call fails, or is
+        # cancelled, the next batch sends the full config.
+        self.server.renderer_config_stamp = -1
+        try:
+            await self.raw_update(update_request)
+        except grpc.RpcError as error:
+            raise _render_server_error(self.port, error) from error
+        self.server.renderer_config_stamp = workload_with_config.renderer_config_stamp
+
+    async def update(self, workload_with_config):
+        """Sends the config to the server, once the batches in flight are rendered."""
+        async with self.condition:
+            await self._update(workload_with_config)
+
+    async def _begin_render(self, workload_with_config):
+        async with self.condition:
+            await self._update(workload_with_config)
+            self.in_flight += 1
+
+    async def _end_render(self):
+        async with self.condition:
+            self.in_flight -= 1
+            self.condition.notify_all()
+
+    async def render(self, workload_with_config):
+        await self._begin_render(workload_with_config)
+        try:
+            return await self._render(workload_with_config)
+        finally:
+            await self._end_render()
+
+    async def _render(self, workload_with_config):
+        actual_workload = workload_with_config.workload
+        config = _effective_config(self.base_config, actual_workload)
+        request, batch_size = _build_render_batch_request(actual_workload, config)
+        try:
+            if config.stream_chunk_size > 0:
+                decoder = _BatchDecoder(config, batch_size, self.buffer_pool)
+                async for response in self.client_stub.RenderBatchStream(request):
+                    decoder.decode(response, response.entries_offset)
+                actual_workload.update(decoder.result())
+            else:
+                response = await self.client_stub.RenderBatch(request)
+                actual_workload.update(
+                    _convert_render_batch_response(response, config, batch_size,
+                                                   self.buffer_pool))
+        except grpc.RpcError as error:
+            raise _render_server_error(self.port, error) from error
+        return actual_workload
+
+    async def render_stream(self, workload_with_config):
+        await self._begin_render(workload_with_config)
+        try:
+            config = _effective_config(self.base_config, workload_with_config.workload)
+            request, batch_size = _build_render_batch_request(workload_with_config.workload,
+                                                              config)
+            try:
+                async for response in self.client_stub.RenderBatchStream(request):
+                    count = response.entries_count or batch_size
+                    chunk = _convert_render_batch_response(response, config, count,
+                                                           self.buffer_pool)
+                    chunk['entries_offset'] = response.entries_offset
+                    chunk['entries_count'] = count
+                    yield chunk
+            except grpc.RpcError as error:
+                raise _render_server_error(self.port, error) from error
+        finally:
+            await self._end_render()
+
+
+class AsyncRemoteRenderer:
+
+    def __init__(self, name, server_configs, base_config, buffer_pool=None):
+        """An asyncio version of the orrb.RemoteRenderer, that uses no threads.
+
+        :param name: A name for this renderer in str.
+        :param server_configs: A list of (device, port), where device could be the GPU id.
+        :param base_config: A orrb.RemoteRendererConfig object.
+        :param buffer_pool: An optional orrb.BufferPool, the result tensors are allocated from it.
+        """
+        self.name = name
+        self.renderer_config_stamp = 0
+        self.renderer_config = _load_renderer_config(base_config.asset_basedir,
+                                                     base_config.renderer_config_path)
+        self.local_config = _build_local_config(base_config)
+        self.buffer_pool = buffer_pool
+        self.config_versions = _ConfigVersions(self.renderer_config)
+        self.workers = [
+            _AsyncRemoteRendererWorker(device, port, self.local_config, buffer_pool)
+            for (device, port) in _select_server_configs(server_configs)]
+        # One entry per request slot, every worker has pipeline_depth of them.
+        self.idle_workers = None
+
+    async def start(self):
+        """Starts all the render servers concurrently, and waits till they are ready.
+
+        Returns the time it took, in seconds. Raises orrb.RendererError naming the servers
+        that failed to start.
+        """
+        started = time.time()
+        results = await asyncio.gather(*[worker.start() for worker in self.workers],
+                                       return_exceptions=True)
+        failed = [(worker, result) for worker, result in zip(self.workers, results)
+                  if isinstance(result, Exception)]
+        if failed:
+            raise RendererError('Render servers failed to start: %s.' % ', '.join(
+                'port %d (%s)' % (worker.port, error) for worker, error in failed))
+        self.idle_workers = asyncio.Queue()
+        for _ in range(self.local_config.pipeline_depth):
+            for worker in self.workers:
+                self.idle_workers.put_nowait(worker)
+        return time.time() - started
+
+    async def shutdown(self):
+        await asyncio.gather(*[worker.shutdown() for worker in self.workers])
+
+    def mutable_renderer_config(self):
+        return self.renderer_config
+
+    def update(self, renderer_config, broadcast=False):
+        """Sets a new renderer config, for all the batches rendered from now on.
+
+        With broadcast the config is sent to all the servers concurrently right away, and an
+        asyncio future is returned, that resolves to the config stamp once every server has
+        acknowledged it. Has to be called from the event loop then.
+        """
+        self.renderer_config_stamp += 1
+        self.renderer_config = deepcopy(renderer_config)
+        self.config_versions.add(self.renderer_config_stamp, self.renderer_config)
+        if not broadcast:
+            return None
+
+        workload_with_config = self._workload_with_config(None)
+
+        async def broadcast_update():
+            # Every server waits for its batches in flight, and the new batches wait for the
+            # update, so none of them overtakes it.
+            await asyncio.gather(*[worker.update(workload_with_config)
+                                   for worker in self.workers])
+            return workload_with_config.renderer_config_stamp
+
+        return asyncio.ensure_future(broadcast_update())
+
+    def _workload_with_config(self, workload):
+        return _WorkloadWithConfig(self.renderer_config_stamp, self.renderer_config, workload,
+                                   self.config_versions)
+
+    async def _idle_worker(self):
+        if self.idle_workers is None:
+            raise RuntimeError('AsyncRemoteRenderer: %s has not been started.' % self.name)
+        return await self.idle_workers.get()
+
+    async def _render(self, workload_with_config):
+        worker = await self._idle_worker()
+        try:
+            return await worker.render(workload_with_config)
+        finally:
+            self.idle_workers.put_nowait(worker)
+
+    async def render_batch(self, workload):
+        shards_count = _shards_count(self.local_config, len(workload['qpos']), len(self.workers))
+        if shards_count == 1:
+            return await self._render(self._workload_with_config(workload))
+
+        shards = _split_workload(workload, shards_count)
+        results = await asyncio.gather(
+            *[self._render(self._workload_with_config(shard)) for shard in shards])
+        return _merge_shards(workload, results, self.buffer_pool)
+
+    async def render_batch_stream(self, workload):
+        """Yields the batch in chunks of stream_chunk_size frames, as soon as they are rendered.
+
+        Every chunk is a dictionary with the rendered tensors of the frames in the
+        [entries_offset, entries_offset + entries_count) range of the batch.
+        """
+        workload_with_config = self._workload_with_config(workload)
+        worker = await self._idle_worker()
+        try:
+            async for chunk in worker.render_stream(workload_with_config):
+                yield chunk
+        finally:
+            self.idle_workers.put_nowait(worker)
@@ -0,0 +1,56 @@
+import threading
+import weakref
+
+import numpy as np
+
+from collections import defaultdict
+
+
+def _root_array(array):
+    while isinstance(array.base, np.ndarray):
+        array = array.base
+    return array
+
+
+class BufferPool:
+    """A thread safe pool of reusable numpy buffers, keyed by shape and dtype.
+
+    The decoded render batches are big, allocating them anew for every response is a
+    significant cost. Pass a pool to the orrb.RemoteRenderer and release the result
+    tensors back to it, once they have been consumed, in order to recycle the memory.
+    """
+
+    def __init__(self, max_free_buffers=8):
+        self.max_free_buffers = max_free_buffers
+        self._lock = threading.Lock()
+        self._free = defaultdict(list)
+        # Weak references, buffers dropped by the user are simply not recycled.
+        self._leased = weakref.WeakValueDictionary()
+
+    def acquire(self, shape, dtype):
+        key = (tuple(shape), np.dtype(dtype).str)
+        with self._lock:
+            free = self._free[key]
+            buffer = free.pop() if free else None
+        if buffer is None:
+            buffer = np.empty(shape, dtype=dtype)
+        with self._lock:
+            self._leased[id(buffer)] = buffer
+        return buffer
+
+    def release(self, array):
+        """Return a buffer (or any view of it) to the pool. Releasing twice is a no-op."""
+        buffer = _root_array(array)
+        key = (buffer.shape, buffer.dtype.str)
+        with self._lock:
+            if self._leased.pop(id(buffer), None) is None:
+                return
+            free = self._free[key]
+            if len(free) < self.max_free_buffers:
+                free.append(buffer)
+
+    def release_batch(self, batch):
+        """Release all the pooled tensors in a render result dictionary."""
+        for value in batch.values():
+            if isinstance(value, np.ndarray):
+                self.release(value)
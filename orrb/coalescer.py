@@ -0,0 +1,165 @@
+import logging
+import time
+
+import numpy as np
+
+from collections import deque
+from concurrent.futures import Future
+from threading import Condition, Thread
+
+from orrb.remote_renderer import (_BATCH_KEYS, _RENDER_OPTIONS, _REQUEST_KEYS, _TIMINGS_KEY,
+                                  _entry_seeds)
+
+
+class _PendingWorkload:
+
+    def __init__(self, workload, config_snapshot):
+        self.workload = workload
+        self.config_snapshot = config_snapshot
+        # Only the workloads rendered with the same config, overrides and render options, can
+        # be merged.
+        overrides = b''.join(component.SerializeToString()
+                             for component in workload.get('config_overrides', []))
+        options = [workload.get(option) for option in _RENDER_OPTIONS]
+        self.config_key = (config_snapshot[0], overrides, options)
+        self.batch_size = len(workload['qpos'])
+        self.arrival_time = time.time()
+        self.future = Future()
+
+
+def _merge_workloads(pending):
+    merged = {'qpos': np.concatenate([p.workload['qpos'] for p in pending]),
+              'seeds': np.concatenate([_entry_seeds(p.workload) for p in pending])}
+    merged.update({key: value for key, value in pending[0].workload.items()
+                   if key in _BATCH_KEYS})
+    return merged
+
+
+def _split_result(result, pending, buffer_pool=None):
+    start = 0
+    for p in pending:
+        end = start + p.batch_size
+        for key, value in result.items():
+            if key in _REQUEST_KEYS:
+                continue
+            if key == _TIMINGS_KEY:
+                # The timings of the whole merged batch.
+                p.workload[key] = dict(value)
+                continue
+            if buffer_pool is not None:
+                # The callers release their results independently, they need own buffers.
+                part = buffer_pool.acquire(value[start:end].shape, value.dtype)
+                part[...] = value[start:end]
+            else:
+                part = value[start:end]
+            p.workload[key] = part
+        p.future.set_result(p.workload)
+        start = end
+    if buffer_pool is not None:
+        buffer_pool.release_batch(result)
+
+
+def _fail_group(group, exception):
+    for p in group:
+        if not p.future.done():
+            p.future.set_exception(exception)
+
+
+class RenderCoalescer:
+    """Merges small render requests into bigger batches, in front of a orrb.RemoteRenderer.
+
+    Every RenderBatch request has a fixed cost on the server, that dominates when the batches
+    are just a few frames. The coalescer waits up to max_wait seconds for more requests, rendered
+    with the same config, and sends them as one batch of up to max_batch_size frames. Each caller
+    gets back its own part of the result, rendered with its own seeds.
+    """
+
+    def __init__(self, renderer, max_batch_size=64, max_wait=0.005):
+        self.renderer = renderer
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.pending = deque()
+        self.pending_size = 0
+        self.condition = Condition()
+        self.should_shutdown = False
+        self.thread = Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def submit(self, workload):
+        """Queue the workload for rendering, returns a concurrent.futures.Future."""
+        config_snapshot = self.renderer.config_snapshot()
+        if len(workload['qpos']) >= self.max_batch_size:
+            return self.renderer.submit(workload, config_snapshot)
+
+        pending = _PendingWorkload(workload, config_snapshot)
+        with self.condition:
+            if self.should_shutdown:
+                raise RuntimeError('The coalescer has been shut down.')
+            self.pending.append(pending)
+            self.pending_size += pending.batch_size
+            self.condition.notify()
+        return pending.future
+
+    def render_batch(self, workload):
+        return self.submit(workload).result()
+
+    def shutdown(self):
+        """Sends the pending requests and stops the coalescer, the renderer is left running."""
+        with self.condition:
+            self.should_shutdown = True
+            self.condition.notify()
+        self.thread.join()
+
+    def _take_group(self):
+        # Only requests with the same config (and options) as the oldest one go into the batch.
+        group = []
+        group_size = 0
+        remaining = deque()
+        config_key = self.pending[0].config_key
+        for pending in self.pending:
+            fits = not group or group_size + pending.batch_size <= self.max_batch_size
+            if pending.config_key == config_key and fits:
+                group.append(pending)
+                group_size += pending.batch_size
+            else:
+                remaining.append(pending)
+        self.pending = remaining
+        self.pending_size -= group_size
+        return group
+
+    def _run(self):
+        while True:
+            with self.condition:
+                while not self.pending and not self.should_shutdown:
+                    self.condition.wait()
+                if not self.pending:
+                    return
+                deadline = self.pending[0].arrival_time + self.max_wait
+                while (self.pending_size < self.max_batch_size and not self.should_shutdown and
+                       time.time() < deadline):
+                    self.condition.wait(deadline - time.time())
+                group = self._take_group()
+            self._send(group)
+
+    def _send(self, group):
+        group = [p for p in group if p.future.set_running_or_notify_cancel()]
+        if not group:
+            return
+
+        try:
+            merged = _merge_workloads(group)
+            logging.debug('Coalesced %d requests into a batch of %d.' % (len(group),
+                                                                         len(merged['qpos'])))
+            future = self.renderer.submit(merged, group[0].config_snapshot)
+        except Exception as exception:
+            # E.g. queue.Full, or the renderer has been shut down, the coalescer carries on.
+            _fail_group(group, exception)
+            return
+
+        def on_done(_):
+            try:
+                _split_result(future.result(), group, self.renderer.buffer_pool)
+            except Exception as exception:
+                _fail_group(group, exception)
+
+        future.add_done_callback(on_done)
@@ -0,0 +1,242 @@
+"""A pure python stand in for the StandaloneRenderer render server.
+
+It answers the RenderService calls with synthetic images, and tracker streams, of the requested
+shapes, after a configurable per frame latency. There is no GPU, nor Unity involved, so the
+client side (request building, transfer, decoding, queueing) can be benchmarked and tested
+anywhere. RemoteRenderer spawns it, in place of the real server, with fake_servers set:
+
+    python -m orrb.fake_render_server --render_server.port=7000 --fake.frame_latency=0.002
+
+It accepts (and mostly ignores) the StandaloneRenderer commandline flags.
+"""
+
+import grpc
+import logging
+import os
+import random
+import sys
+import threading
+import time
+
+import numpy as np
+
+from concurrent.futures import ThreadPoolExecutor
+
+import orrb.protos.RenderService_pb2 as render_service_pb2
+import orrb.protos.RenderService_pb2_grpc as render_service_pb2_grpc
+
+from orrb.remote_renderer import DEFAULT_GRPC_MESSAGE_SIZE, _get_server_bind_host
+
+
+def _synthetic_pattern(shape, dtype, seed):
+    # A fixed noise pattern per shape, the frames are cheap shifts of it.
+    rng = np.random.RandomState(seed)
+    if dtype == np.uint8:
+        return rng.randint(0, 256, size=shape, dtype=np.uint8)
+    return rng.rand(*shape).astype(dtype)
+
+
+class FakeRenderService(render_service_pb2_grpc.RenderServiceServicer):
+    """Renders synthetic frames: every camera, seed and modality gets a distinct, deterministic
+    image. The frames of a batch take frame_latency (plus uniform +-latency_jitter) seconds each,
+    and the batches are rendered one at a time, like in the single threaded Unity main loop.
+
+    Every camera has 'tracker_<tracked_object>_X_<camera>' (2 floats per frame) and
+    'tracker_<tracked_object>_X_<camera>_bbox' (4 floats per frame) auxiliary streams, as the
+    Tracker component outputs.
+    """
+
+    def __init__(self, frame_latency=0.0, latency_jitter=0.0, tracked_object='object'):
+        self.frame_latency = frame_latency
+        self.latency_jitter = latency_jitter
+        self.tracked_object = tracked_object
+        self.components = dict()
+        self.profiling = False
+        self.patterns = dict()
+        # The render loop, and the number of workloads waiting for it.
+        self.render_lock = threading.Lock()
+        self.queued_workloads = 0
+        self.counter_lock = threading.Lock()
+
+    def _pattern(self, shape, dtype):
+        key = (shape, np.dtype(dtype).str)
+        pattern = self.patterns.get(key)
+        if pattern is None:
+            pattern = self.patterns[key] = _synthetic_pattern(shape, dtype, len(self.patterns))
+        return pattern
+
+    def _render(self, frames_count, arrival=None):
+        """Simulates rendering the frames, returns the ServerTimings so far, and the start time.
+        The queue wait is measured from the arrival, if given."""
+        with self.counter_lock:
+            self.queued_workloads += 1
+        with self.render_lock:
+            start = time.perf_counter()
+            with self.counter_lock:
+                self.queued_workloads -= 1
+            latency = frames_count * self.frame_latency
+            if self.latency_jitter > 0:
+                latency += frames_count * random.uniform(-self.latency_jitter,
+                                                         self.latency_jitter)
+            if latency > 0:
+                time.sleep(latency)
+        queue_wait = start - arrival if arrival is not None else 0.0
+        return render_service_pb2.ServerTimings(queue_wait=queue_wait, capture=latency), start
+
+    def _images(self, seeds, camera_index, shape, dtype):
+        pattern = self._pattern(shape, dtype)
+        shifts = (seeds + camera_index * 31) % 256
+        if dtype == np.uint8:
+            return pattern[np.newaxis] + shifts.astype(np.uint8).reshape((-1,) + (1,) * len(shape))
+        return pattern[np.newaxis] + (shifts / 256.0).astype(dtype).reshape(
+            (-1,) + (1,) * len(shape))
+
+    def _build_response(self, request, seeds, offset, timings, start):
+        build_start = time.perf_counter()
+        response = render_service_pb2.RenderBatchResponse()
+        response.entries_offset = offset
+        response.entries_count = len(seeds)
+        width, height = request.width, request.height
+        modalities = [('image_data', (height, width, 4 if request.render_alpha else 3),
+                       np.uint8, True),
+                      ('depth_data', (height, width), np.float32, request.render_depth),
+                      ('normals_data', (height, width, 3), np.float32, request.render_normals),
+                      ('segmentation_data', (height, width), np.uint8,
+                       request.render_segmentation)]
+
+        for camera_index, camera_name in enumerate(request.camera_names):
+            stream = response.streams.add()
+            stream.name = camera_name
+            entries = ([stream.entries.add() for _ in seeds] if not request.packed_images
+                       else None)
+            for field, shape, dtype, enabled in modalities:
+                if not enabled:
+                    continue
+                images = self._images(seeds, camera_index, shape, dtype)
+                if request.packed_images:
+                    packed = getattr(stream, 'packed_' + field)
+                    packed.data = images.tobytes()
+                    packed.shape[:] = images.shape
+                else:
+                    for entry, image in zip(entries, images):
+                        setattr(entry, field, image.tobytes())
+
+            positions = (seeds[:, np.newaxis] % 1000 / 1000.0 + np.zeros((1, 2))).ravel()
+            tracker = response.auxiliary_float_streams.add()
+            tracker.name = 'tracker_%s_X_%s' % (self.tracked_object, camera_name)
+            tracker.data[:] = positions
+            bbox = response.auxiliary_float_streams.add()
+            bbox.name = tracker.name + '_bbox'
+            bbox.data[:] = np.repeat(positions, 2)
+
+        end = time.perf_counter()
+        timings.build_response = end - build_start
+        timings.total = end - start
+        timings.frames = len(seeds)
+        response.server_timings.CopyFrom(timings)
+        return response
+
+    def _seeds(self, request):
+        if request.packed_qpos:
+            batch_size = request.packed_qpos_shape[0]
+        else:
+            batch_size = len(request.entries)
+        if not request.use_entry_seeds:
+            return request.batch_seed + np.arange(batch_size, dtype=np.int64)
+        if request.packed_qpos:
+            return np.frombuffer(request.packed_seeds, dtype='<i4').astype(np.int64)
+        return np.array([entry.seed for entry in request.entries], dtype=np.int64)
+
+    def RenderBatch(self, request, context):
+        arrival = time.perf_counter()
+        seeds = self._seeds(request)
+        timings, start = self._render(len(seeds), arrival)
+        return self._build_response(request, seeds, 0, timings, start)
+
+    def RenderBatchStream(self, request, context):
+        arrival = time.perf_counter()
+        seeds = self._seeds(request)
+        chunk_size = request.stream_chunk_size or 1
+        for offset in range(0, len(seeds), chunk_size):
+            chunk_seeds = seeds[offset:offset + chunk_size]
+            # Like in the render server, only the first chunk waits in the queue.
+            timings, start = self._render(len(chunk_seeds), arrival if offset == 0 else None)
+            yield self._build_response(request, chunk_seeds, offset, timings, start)
+
+    def Update(self, request, context):
+        with self.render_lock:
+            for component in request.components:
+                self.components[component.name] = component
+        return render_service_pb2.UpdateResponse()
+
+    def ComponentStats(self, request, context):
+        # There are no renderer components to profile here.
+        if request.set_profiling:
+            self.profiling = request.profiling
+        return render_service_pb2.ComponentStatsResponse(profiling=self.profiling)
+
+    def Health(self, request, context):
+        return render_service_pb2.HealthResponse(serving=True,
+                                                 queued_workloads=self.queued_workloads)
+
+
+def _parse_flags(argv):
+    # The StandaloneRenderer style flags: --<group>.<name>=<value>, and -logFile <path>.
+    flags = dict()
+    for i, arg in enumerate(argv):
+        if arg.startswith('--') and '=' in arg:
+            name, value = arg[2:].split('=', 1)
+            flags[name] = value
+        elif arg == '-logFile' and i + 1 < len(argv):
+            flags['logFile'] = argv[i + 1]
+    return flags
+
+
+def _watch_parent(parent_pid, server):
+    # Like the StandaloneRenderer, exit when the process that spawned the server dies.
+    while True:
+        time.sleep(1.0)
+        try:
+            os.kill(parent_pid, 0)
+        except ProcessLookupError:
+            logging.info('Parent process %d is gone, exiting.' % parent_pid)
+            server.stop(None)
+            return
+        except PermissionError:
+            pass
+
+
+def serve(port, host=None, frame_latency=0.0, latency_jitter=0.0, max_workers=4):
+    """Starts a FakeRenderService server, returns the grpc server."""
+    server = grpc.server(ThreadPoolExecutor(max_workers=max_workers),
+                         options=[('grpc.max_send_message_length', DEFAULT_GRPC_MESSAGE_SIZE),
+                                  ('grpc.max_receive_message_length',
+                                   DEFAULT_GRPC_MESSAGE_SIZE)])
+    render_service_pb2_grpc.add_RenderServiceServicer_to_server(
+        FakeRenderService(frame_latency, latency_jitter), server)
+    server.add_insecure_port('%s:%d' % (host if host is not None else _get_server_bind_host(),
+                                        port))
+    server.start()
+    return server
+
+
+def main(argv):
+    flags = _parse_flags(argv)
+    logging.basicConfig(filename=flags.get('logFile'), level=logging.INFO,
+                        format='%(asctime)s %(levelname)s %(message)s')
+    port = int(flags.get('render_server.port', 7000))
+    server = serve(port, flags.get('render_server.host'),
+                   float(flags.get('fake.frame_latency', 0.0)),
+                   float(flags.get('fake.latency_jitter', 0.0)),
+                   # One grpc thread per workload stream, and a few for the updates.
+                   int(flags.get('render_server.streams_count', 4)) + 2)
+    logging.info('Fake render server listening at port %d.' % port)
+
+    parent_pid = int(flags.get('main.parent_pid', -1))
+    if parent_pid != -1:
+        threading.Thread(target=_watch_parent, args=(parent_pid, server), daemon=True).start()
+    server.wait_for_termination()
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -20,7 +20,7 @@ DESCRIPTOR = _descriptor.FileDescriptor(
   package='orrb',
   syntax='proto3',
   serialized_options=None,
-  serialized_pb=_b('\n\x1forrb/protos/RenderService.proto\x12\x04orrb\x1a orrb/protos/RendererConfig.proto\"\xd7\x02\n\x12RenderBatchRequest\x12;\n\x07\x65ntries\x18\x01 \x03(\x0b\x32*.orrb.RenderBatchRequest.BatchRequestEntry\x12\r\n\x05width\x18\x02 \x01(\x05\x12\x0e\n\x06height\x18\x03 \x01(\x05\x12\x10\n\x08scene_id\x18\x04 \x01(\x05\x12\x14\n\x0c\x63\x61mera_names\x18\x05 \x03(\t\x12\x12\n\nbatch_seed\x18\x06 \x01(\x05\x12\x17\n\x0fuse_entry_seeds\x18\x07 \x01(\x08\x12\x14\n\x0crender_alpha\x18\x08 \x01(\x08\x12\x14\n\x0crender_depth\x18\t \x01(\x08\x12\x16\n\x0erender_normals\x18\n \x01(\x08\x12\x1b\n\x13render_segmentation\x18\x0b \x01(\x08\x1a/\n\x11\x42\x61tchRequestEntry\x12\x0c\n\x04qpos\x18\x01 \x03(\x02\x12\x0c\n\x04seed\x18\x02 \x01(\x05\"\xc9\x05\n\x13RenderBatchResponse\x12\x36\n\x07streams\x18\x01 \x03(\x0b\x32%.orrb.RenderBatchResponse.StreamEntry\x12R\n\x16\x61uxiliary_bool_streams\x18\x02 \x03(\x0b\x32\x32.orrb.RenderBatchResponse.AuxiliaryBoolStreamEntry\x12P\n\x15\x61uxiliary_int_streams\x18\x03 \x03(\x0b\x32\x31.orrb.RenderBatchResponse.AuxiliaryIntStreamEntry\x12T\n\x17\x61uxiliary_float_streams\x18\x04 \x03(\x0b\x32\x33.orrb.RenderBatchResponse.AuxiliaryFloatStreamEntry\x1a\xd5\x01\n\x0bStreamEntry\x12\x0c\n\x04name\x18\x01 \x01(\t\x12I\n\x07\x65ntries\x18\x02 \x03(\x0b\x32\x38.orrb.RenderBatchResponse.StreamEntry.BatchResponseEntry\x1am\n\x12\x42\x61tchResponseEntry\x12\x12\n\nimage_data\x18\x01 \x01(\x0c\x12\x12\n\ndepth_data\x18\x02 \x01(\x0c\x12\x14\n\x0cnormals_data\x18\x03 \x01(\x0c\x12\x19\n\x11segmentation_data\x18\x04 \x01(\x0c\x1a\x36\n\x18\x41uxiliaryBoolStreamEntry\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x02 \x03(\x08\x1a\x35\n\x17\x41uxiliaryIntStreamEntry\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x02 \x03(\x05\x1a\x37\n\x19\x41uxiliaryFloatStreamEntry\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x02 \x03(\x02\"<\n\rUpdateRequest\x12+\n\ncomponents\x18\x01 \x03(\x0b\x32\x17.orrb.RendererComponent\" \n\x0eUpdateResponse\x12\x0e\n\x06\x65rrors\x18\x01 \x03(\t2\x8c\x01\n\rRenderService\x12\x44\n\x0bRenderBatch\x12\x18.orrb.RenderBatchRequest\x1a\x19.orrb.RenderBatchResponse\"\x00\x12\x35\n\x06Update\x12\x13.orrb.UpdateRequest\x1a\x14.orrb.UpdateResponse\"\x00\x62\x06proto3')
+  serialized_pb=_b('\n\x1forrb/protos/RenderService.proto\x12\x04orrb\x1a orrb/protos/RendererConfig.proto\"\x82\x04\n\x12RenderBatchRequest\x12;\n\x07\x65ntries\x18\x01 \x03(\x0b\x32*.orrb.RenderBatchRequest.BatchRequestEntry\x12\r\n\x05width\x18\x02 \x01(\x05\x12\x0e\n\x06height\x18\x03 \x01(\x05\x12\x10\n\x08scene_id\x18\x04 \x01(\x05\x12\x14\n\x0c\x63\x61mera_names\x18\x05 \x03(\t\x12\x12\n\nbatch_seed\x18\x06 \x01(\x05\x12\x17\n\x0fuse_entry_seeds\x18\x07 \x01(\x08\x12\x14\n\x0crender_alpha\x18\x08 \x01(\x08\x12\x14\n\x0crender_depth\x18\t \x01(\x08\x12\x16\n\x0erender_normals\x18\n \x01(\x08\x12\x1b\n\x13render_segmentation\x18\x0b \x01(\x08\x12\x15\n\rpacked_images\x18\x0c \x01(\x08\x12\x13\n\x0bpacked_qpos\x18\r \x01(\x0c\x12\x19\n\x11packed_qpos_shape\x18\x0e \x03(\x05\x12\x14\n\x0cpacked_seeds\x18\x0f \x01(\x0c\x12\x19\n\x11stream_chunk_size\x18\x10 \x01(\x05\x12\x31\n\x10\x63onfig_overrides\x18\x11 \x03(\x0b\x32\x17.orrb.RendererComponent\x1a/\n\x11\x42\x61tchRequestEntry\x12\x0c\n\x04qpos\x18\x01 \x03(\x02\x12\x0c\n\x04seed\x18\x02 \x01(\x05\"\x8d\t\n\x13RenderBatchResponse\x12\x36\n\x07streams\x18\x01 \x03(\x0b\x32%.orrb.RenderBatchResponse.StreamEntry\x12R\n\x16\x61uxiliary_bool_streams\x18\x02 \x03(\x0b\x32\x32.orrb.RenderBatchResponse.AuxiliaryBoolStreamEntry\x12P\n\x15\x61uxiliary_int_streams\x18\x03 \x03(\x0b\x32\x31.orrb.RenderBatchResponse.AuxiliaryIntStreamEntry\x12T\n\x17\x61uxiliary_float_streams\x18\x04 \x03(\x0b\x32\x33.orrb.RenderBatchResponse.AuxiliaryFloatStreamEntry\x12\x16\n\x0e\x65ntries_offset\x18\x05 \x01(\x05\x12\x15\n\rentries_count\x18\x06 \x01(\x05\x12+\n\x0eserver_timings\x18\x07 \x01(\x0b\x32\x13.orrb.ServerTimings\x1a\xbd\x04\n\x0bStreamEntry\x12\x0c\n\x04name\x18\x01 \x01(\t\x12I\n\x07\x65ntries\x18\x02 \x03(\x0b\x32\x38.orrb.RenderBatchResponse.StreamEntry.BatchResponseEntry\x12K\n\x11packed_image_data\x18\x03 \x01(\x0b\x32\x30.orrb.RenderBatchResponse.StreamEntry.PackedData\x12K\n\x11packed_depth_data\x18\x04 \x01(\x0b\x32\x30.orrb.RenderBatchResponse.StreamEntry.PackedData\x12M\n\x13packed_normals_data\x18\x05 \x01(\x0b\x32\x30.orrb.RenderBatchResponse.StreamEntry.PackedData\x12R\n\x18packed_segmentation_data\x18\x06 \x01(\x0b\x32\x30.orrb.RenderBatchResponse.StreamEntry.PackedData\x1am\n\x12\x42\x61tchResponseEntry\x12\x12\n\nimage_data\x18\x01 \x01(\x0c\x12\x12\n\ndepth_data\x18\x02 \x01(\x0c\x12\x14\n\x0cnormals_data\x18\x03 \x01(\x0c\x12\x19\n\x11segmentation_data\x18\x04 \x01(\x0c\x1a)\n\nPackedData\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\x0c\x12\r\n\x05shape\x18\x02 \x03(\x05\x1a\x36\n\x18\x41uxiliaryBoolStreamEntry\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x02 \x03(\x08\x1a\x35\n\x17\x41uxiliaryIntStreamEntry\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x02 \x03(\x05\x1a\x37\n\x19\x41uxiliaryFloatStreamEntry\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x02 \x03(\x02\"\xab\x01\n\rServerTimings\x12\x12\n\nqueue_wait\x18\x01 \x01(\x02\x12\x14\n\x0cupdate_state\x18\x02 \x01(\x02\x12\x16\n\x0erun_components\x18\x03 \x01(\x02\x12\x0f\n\x07\x63\x61pture\x18\x04 \x01(\x02\x12\x10\n\x08readback\x18\x05 \x01(\x02\x12\x16\n\x0e\x62uild_response\x18\x06 \x01(\x02\x12\r\n\x05total\x18\x07 \x01(\x02\x12\x0e\n\x06\x66rames\x18\x08 \x01(\x05\"<\n\rUpdateRequest\x12+\n\ncomponents\x18\x01 \x03(\x0b\x32\x17.orrb.RendererComponent\" \n\x0eUpdateResponse\x12\x0e\n\x06\x65rrors\x18\x01 \x03(\t\"\x0f\n\rHealthRequest\";\n\x0eHealthResponse\x12\x0f\n\x07serving\x18\x01 \x01(\x08\x12\x18\n\x10queued_workloads\x18\x02 \x01(\x05\"P\n\x15\x43omponentStatsRequest\x12\x15\n\rset_profiling\x18\x01 \x01(\x08\x12\x11\n\tprofiling\x18\x02 \x01(\x08\x12\r\n\x05reset\x18\x03 \x01(\x08\"\xd5\x01\n\x16\x43omponentStatsResponse\x12\x11\n\tprofiling\x18\x01 \x01(\x08\x12?\n\ncomponents\x18\x02 \x03(\x0b\x32+.orrb.ComponentStatsResponse.ComponentStats\x1ag\n\x0e\x43omponentStats\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04type\x18\x02 \x01(\t\x12\r\n\x05\x63\x61lls\x18\x03 \x01(\x03\x12\x15\n\rtotal_seconds\x18\x04 \x01(\x01\x12\x13\n\x0bmax_seconds\x18\x05 \x01(\x01\x32\xe0\x02\n\rRenderService\x12\x44\n\x0bRenderBatch\x12\x18.orrb.RenderBatchRequest\x1a\x19.orrb.RenderBatchResponse\"\x00\x12L\n\x11RenderBatchStream\x12\x18.orrb.RenderBatchRequest\x1a\x19.orrb.RenderBatchResponse\"\x00\x30\x01\x12\x35\n\x06Update\x12\x13.orrb.UpdateRequest\x1a\x14.orrb.UpdateResponse\"\x00\x12\x35\n\x06Health\x12\x13.orrb.HealthRequest\x1a\x14.orrb.HealthResponse\"\x00\x12M\n\x0e\x43omponentStats\x12\x1b.orrb.ComponentStatsRequest\x1a\x1c.orrb.ComponentStatsResponse\"\x00\x62\x06proto3')
   ,
   dependencies=[orrb_dot_protos_dot_RendererConfig__pb2.DESCRIPTOR,])
 
@@ -60,8 +60,8 @@ _RENDERBATCHREQUEST_BATCHREQUESTENTRY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=372,
-  serialized_end=419,
+  serialized_start=543,
+  serialized_end=590,
 )
 
 _RENDERBATCHREQUEST = _descriptor.Descriptor(
@@ -148,6 +148,48 @@ _RENDERBATCHREQUEST = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='packed_images', full_name='orrb.RenderBatchRequest.packed_images', index=11,
+      number=12, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='packed_qpos', full_name='orrb.RenderBatchRequest.packed_qpos', index=12,
+      number=13, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='packed_qpos_shape', full_name='orrb.RenderBatchRequest.packed_qpos_shape', index=13,
+      number=14, type=5, cpp_type=1, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='packed_seeds', full_name='orrb.RenderBatchRequest.packed_seeds', index=14,
+      number=15, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='stream_chunk_size', full_name='orrb.RenderBatchRequest.stream_chunk_size', index=15,
+      number=16, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='config_overrides', full_name='orrb.RenderBatchRequest.config_overrides', index=16,
+      number=17, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
@@ -161,7 +203,7 @@ _RENDERBATCHREQUEST = _descriptor.Descriptor(
   oneofs=[
   ],
   serialized_start=76,
-  serialized_end=419,
+  serialized_end=590,
 )
 
 
@@ -212,8 +254,45 @@ _RENDERBATCHRESPONSE_STREAMENTRY_BATCHRESPONSEENTRY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=858,
-  serialized_end=967,
+  serialized_start=1438,
+  serialized_end=1547,
+)
+
+_RENDERBATCHRESPONSE_STREAMENTRY_PACKEDDATA = _descriptor.Descriptor(
+  name='PackedData',
+  full_name='orrb.RenderBatchResponse.StreamEntry.PackedData',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='data', full_name='orrb.RenderBatchResponse.StreamEntry.PackedData.data', index=0,
+      number=1, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='shape', full_name='orrb.RenderBatchResponse.StreamEntry.PackedData.shape', index=1,
+      number=2, type=5, cpp_type=1, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1549,
+  serialized_end=1590,
 )
 
 _RENDERBATCHRESPONSE_STREAMENTRY = _descriptor.Descriptor(
@@ -237,10 +316,38 @@ _RENDERBATCHRESPONSE_STREAMENTRY = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='packed_image_data', full_name='orrb.RenderBatchResponse.StreamEntry.packed_image_data', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='packed_depth_data', full_name='orrb.RenderBatchResponse.StreamEntry.packed_depth_data', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='packed_normals_data', full_name='orrb.RenderBatchResponse.StreamEntry.packed_normals_data', index=4,
+      number=5, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='packed_segmentation_data', full_name='orrb.RenderBatchResponse.StreamEntry.packed_segmentation_data', index=5,
+      number=6, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
-  nested_types=[_RENDERBATCHRESPONSE_STREAMENTRY_BATCHRESPONSEENTRY, ],
+  nested_types=[_RENDERBATCHRESPONSE_STREAMENTRY_BATCHRESPONSEENTRY, _RENDERBATCHRESPONSE_STREAMENTRY_PACKEDDATA, ],
   enum_types=[
   ],
   serialized_options=None,
@@ -249,8 +356,8 @@ _RENDERBATCHRESPONSE_STREAMENTRY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=754,
-  serialized_end=967,
+  serialized_start=1017,
+  serialized_end=1590,
 )
 
 _RENDERBATCHRESPONSE_AUXILIARYBOOLSTREAMENTRY = _descriptor.Descriptor(
@@ -286,8 +393,8 @@ _RENDERBATCHRESPONSE_AUXILIARYBOOLSTREAMENTRY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=969,
-  serialized_end=1023,
+  serialized_start=1592,
+  serialized_end=1646,
 )
 
 _RENDERBATCHRESPONSE_AUXILIARYINTSTREAMENTRY = _descriptor.Descriptor(
@@ -323,8 +430,8 @@ _RENDERBATCHRESPONSE_AUXILIARYINTSTREAMENTRY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1025,
-  serialized_end=1078,
+  serialized_start=1648,
+  serialized_end=1701,
 )
 
 _RENDERBATCHRESPONSE_AUXILIARYFLOATSTREAMENTRY = _descriptor.Descriptor(
@@ -360,8 +467,8 @@ _RENDERBATCHRESPONSE_AUXILIARYFLOATSTREAMENTRY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1080,
-  serialized_end=1135,
+  serialized_start=1703,
+  serialized_end=1758,
 )
 
 _RENDERBATCHRESPONSE = _descriptor.Descriptor(
@@ -399,6 +506,27 @@ _RENDERBATCHRESPONSE = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='entries_offset', full_name='orrb.RenderBatchResponse.entries_offset', index=4,
+      number=5, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='entries_count', full_name='orrb.RenderBatchResponse.entries_count', index=5,
+      number=6, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='server_timings', full_name='orrb.RenderBatchResponse.server_timings', index=6,
+      number=7, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
@@ -411,8 +539,88 @@ _RENDERBATCHRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=422,
-  serialized_end=1135,
+  serialized_start=593,
+  serialized_end=1758,
+)
+
+
+_SERVERTIMINGS = _descriptor.Descriptor(
+  name='ServerTimings',
+  full_name='orrb.ServerTimings',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='queue_wait', full_name='orrb.ServerTimings.queue_wait', index=0,
+      number=1, type=2, cpp_type=6, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='update_state', full_name='orrb.ServerTimings.update_state', index=1,
+      number=2, type=2, cpp_type=6, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='run_components', full_name='orrb.ServerTimings.run_components', index=2,
+      number=3, type=2, cpp_type=6, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='capture', full_name='orrb.ServerTimings.capture', index=3,
+      number=4, type=2, cpp_type=6, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='readback', full_name='orrb.ServerTimings.readback', index=4,
+      number=5, type=2, cpp_type=6, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='build_response', full_name='orrb.ServerTimings.build_response', index=5,
+      number=6, type=2, cpp_type=6, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='total', full_name='orrb.ServerTimings.total', index=6,
+      number=7, type=2, cpp_type=6, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='frames', full_name='orrb.ServerTimings.frames', index=7,
+      number=8, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1761,
+  serialized_end=1932,
 )
 
 
@@ -442,8 +650,8 @@ _UPDATEREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1137,
-  serialized_end=1197,
+  serialized_start=1934,
+  serialized_end=1994,
 )
 
 
@@ -473,14 +681,223 @@ _UPDATERESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1199,
-  serialized_end=1231,
+  serialized_start=1996,
+  serialized_end=2028,
+)
+
+
+_HEALTHREQUEST = _descriptor.Descriptor(
+  name='HealthRequest',
+  full_name='orrb.HealthRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2030,
+  serialized_end=2045,
+)
+
+
+_HEALTHRESPONSE = _descriptor.Descriptor(
+  name='HealthResponse',
+  full_name='orrb.HealthResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='serving', full_name='orrb.HealthResponse.serving', index=0,
+      number=1, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='queued_workloads', full_name='orrb.HealthResponse.queued_workloads', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2047,
+  serialized_end=2106,
+)
+
+
+_COMPONENTSTATSREQUEST = _descriptor.Descriptor(
+  name='ComponentStatsRequest',
+  full_name='orrb.ComponentStatsRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='set_profiling', full_name='orrb.ComponentStatsRequest.set_profiling', index=0,
+      number=1, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='profiling', full_name='orrb.ComponentStatsRequest.profiling', index=1,
+      number=2, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='reset', full_name='orrb.ComponentStatsRequest.reset', index=2,
+      number=3, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2108,
+  serialized_end=2188,
+)
+
+
+_COMPONENTSTATSRESPONSE_COMPONENTSTATS = _descriptor.Descriptor(
+  name='ComponentStats',
+  full_name='orrb.ComponentStatsResponse.ComponentStats',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='orrb.ComponentStatsResponse.ComponentStats.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='type', full_name='orrb.ComponentStatsResponse.ComponentStats.type', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='calls', full_name='orrb.ComponentStatsResponse.ComponentStats.calls', index=2,
+      number=3, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='total_seconds', full_name='orrb.ComponentStatsResponse.ComponentStats.total_seconds', index=3,
+      number=4, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='max_seconds', full_name='orrb.ComponentStatsResponse.ComponentStats.max_seconds', index=4,
+      number=5, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2301,
+  serialized_end=2404,
+)
+
+_COMPONENTSTATSRESPONSE = _descriptor.Descriptor(
+  name='ComponentStatsResponse',
+  full_name='orrb.ComponentStatsResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='profiling', full_name='orrb.ComponentStatsResponse.profiling', index=0,
+      number=1, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='components', full_name='orrb.ComponentStatsResponse.components', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_COMPONENTSTATSRESPONSE_COMPONENTSTATS, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2191,
+  serialized_end=2404,
 )
 
 _RENDERBATCHREQUEST_BATCHREQUESTENTRY.containing_type = _RENDERBATCHREQUEST
 _RENDERBATCHREQUEST.fields_by_name['entries'].message_type = _RENDERBATCHREQUEST_BATCHREQUESTENTRY
+_RENDERBATCHREQUEST.fields_by_name['config_overrides'].message_type = orrb_dot_protos_dot_RendererConfig__pb2._RENDERERCOMPONENT
 _RENDERBATCHRESPONSE_STREAMENTRY_BATCHRESPONSEENTRY.containing_type = _RENDERBATCHRESPONSE_STREAMENTRY
+_RENDERBATCHRESPONSE_STREAMENTRY_PACKEDDATA.containing_type = _RENDERBATCHRESPONSE_STREAMENTRY
 _RENDERBATCHRESPONSE_STREAMENTRY.fields_by_name['entries'].message_type = _RENDERBATCHRESPONSE_STREAMENTRY_BATCHRESPONSEENTRY
+_RENDERBATCHRESPONSE_STREAMENTRY.fields_by_name['packed_image_data'].message_type = _RENDERBATCHRESPONSE_STREAMENTRY_PACKEDDATA
+_RENDERBATCHRESPONSE_STREAMENTRY.fields_by_name['packed_depth_data'].message_type = _RENDERBATCHRESPONSE_STREAMENTRY_PACKEDDATA
+_RENDERBATCHRESPONSE_STREAMENTRY.fields_by_name['packed_normals_data'].message_type = _RENDERBATCHRESPONSE_STREAMENTRY_PACKEDDATA
+_RENDERBATCHRESPONSE_STREAMENTRY.fields_by_name['packed_segmentation_data'].message_type = _RENDERBATCHRESPONSE_STREAMENTRY_PACKEDDATA
 _RENDERBATCHRESPONSE_STREAMENTRY.containing_type = _RENDERBATCHRESPONSE
 _RENDERBATCHRESPONSE_AUXILIARYBOOLSTREAMENTRY.containing_type = _RENDERBATCHRESPONSE
 _RENDERBATCHRESPONSE_AUXILIARYINTSTREAMENTRY.containing_type = _RENDERBATCHRESPONSE
@@ -489,11 +906,19 @@ _RENDERBATCHRESPONSE.fields_by_name['streams'].message_type = _RENDERBATCHRESPON
 _RENDERBATCHRESPONSE.fields_by_name['auxiliary_bool_streams'].message_type = _RENDERBATCHRESPONSE_AUXILIARYBOOLSTREAMENTRY
 _RENDERBATCHRESPONSE.fields_by_name['auxiliary_int_streams'].message_type = _RENDERBATCHRESPONSE_AUXILIARYINTSTREAMENTRY
 _RENDERBATCHRESPONSE.fields_by_name['auxiliary_float_streams'].message_type = _RENDERBATCHRESPONSE_AUXILIARYFLOATSTREAMENTRY
+_RENDERBATCHRESPONSE.fields_by_name['server_timings'].message_type = _SERVERTIMINGS
 _UPDATEREQUEST.fields_by_name['components'].message_type = orrb_dot_protos_dot_RendererConfig__pb2._RENDERERCOMPONENT
+_COMPONENTSTATSRESPONSE_COMPONENTSTATS.containing_type = _COMPONENTSTATSRESPONSE
+_COMPONENTSTATSRESPONSE.fields_by_name['components'].message_type = _COMPONENTSTATSRESPONSE_COMPONENTSTATS
 DESCRIPTOR.message_types_by_name['RenderBatchRequest'] = _RENDERBATCHREQUEST
 DESCRIPTOR.message_types_by_name['RenderBatchResponse'] = _RENDERBATCHRESPONSE
+DESCRIPTOR.message_types_by_name['ServerTimings'] = _SERVERTIMINGS
 DESCRIPTOR.message_types_by_name['UpdateRequest'] = _UPDATEREQUEST
 DESCRIPTOR.message_types_by_name['UpdateResponse'] = _UPDATERESPONSE
+DESCRIPTOR.message_types_by_name['HealthRequest'] = _HEALTHREQUEST
+DESCRIPTOR.message_types_by_name['HealthResponse'] = _HEALTHRESPONSE
+DESCRIPTOR.message_types_by_name['ComponentStatsRequest'] = _COMPONENTSTATSREQUEST
+DESCRIPTOR.message_types_by_name['ComponentStatsResponse'] = _COMPONENTSTATSRESPONSE
 _sym_db.RegisterFileDescriptor(DESCRIPTOR)
 
 RenderBatchRequest = _reflection.GeneratedProtocolMessageType('RenderBatchRequest', (_message.Message,), dict(
@@ -521,6 +946,13 @@ RenderBatchResponse = _reflection.GeneratedProtocolMessageType('RenderBatchRespo
       # @@protoc_insertion_point(class_scope:orrb.RenderBatchResponse.StreamEntry.BatchResponseEntry)
       ))
     ,
+
+    PackedData = _reflection.GeneratedProtocolMessageType('PackedData', (_message.Message,), dict(
+      DESCRIPTOR = _RENDERBATCHRESPONSE_STREAMENTRY_PACKEDDATA,
+      __module__ = 'orrb.protos.RenderService_pb2'
+      # @@protoc_insertion_point(class_scope:orrb.RenderBatchResponse.StreamEntry.PackedData)
+      ))
+    ,
     DESCRIPTOR = _RENDERBATCHRESPONSE_STREAMENTRY,
     __module__ = 'orrb.protos.RenderService_pb2'
     # @@protoc_insertion_point(class_scope:orrb.RenderBatchResponse.StreamEntry)
@@ -554,10 +986,18 @@ RenderBatchResponse = _reflection.GeneratedProtocolMessageType('RenderBatchRespo
 _sym_db.RegisterMessage(RenderBatchResponse)
 _sym_db.RegisterMessage(RenderBatchResponse.StreamEntry)
 _sym_db.RegisterMessage(RenderBatchResponse.StreamEntry.BatchResponseEntry)
+_sym_db.RegisterMessage(RenderBatchResponse.StreamEntry.PackedData)
 _sym_db.RegisterMessage(RenderBatchResponse.AuxiliaryBoolStreamEntry)
 _sym_db.RegisterMessage(RenderBatchResponse.AuxiliaryIntStreamEntry)
 _sym_db.RegisterMessage(RenderBatchResponse.AuxiliaryFloatStreamEntry)
 
+ServerTimings = _reflection.GeneratedProtocolMessageType('ServerTimings', (_message.Message,), dict(
+  DESCRIPTOR = _SERVERTIMINGS,
+  __module__ = 'orrb.protos.RenderService_pb2'
+  # @@protoc_insertion_point(class_scope:orrb.ServerTimings)
+  ))
+_sym_db.RegisterMessage(ServerTimings)
+
 UpdateRequest = _reflection.GeneratedProtocolMessageType('UpdateRequest', (_message.Message,), dict(
   DESCRIPTOR = _UPDATEREQUEST,
   __module__ = 'orrb.protos.RenderService_pb2'
@@ -572,6 +1012,42 @@ UpdateResponse = _reflection.GeneratedProtocolMessageType('UpdateResponse', (_me
   ))
 _sym_db.RegisterMessage(UpdateResponse)
 
+HealthRequest = _reflection.GeneratedProtocolMessageType('HealthRequest', (_message.Message,), dict(
+  DESCRIPTOR = _HEALTHREQUEST,
+  __module__ = 'orrb.protos.RenderService_pb2'
+  # @@protoc_insertion_point(class_scope:orrb.HealthRequest)
+  ))
+_sym_db.RegisterMessage(HealthRequest)
+
+HealthResponse = _reflection.GeneratedProtocolMessageType('HealthResponse', (_message.Message,), dict(
+  DESCRIPTOR = _HEALTHRESPONSE,
+  __module__ = 'orrb.protos.RenderService_pb2'
+  # @@protoc_insertion_point(class_scope:orrb.HealthResponse)
+  ))
+_sym_db.RegisterMessage(HealthResponse)
+
+ComponentStatsRequest = _reflection.GeneratedProtocolMessageType('ComponentStatsRequest', (_message.Message,), dict(
+  DESCRIPTOR = _COMPONENTSTATSREQUEST,
+  __module__ = 'orrb.protos.RenderService_pb2'
+  # @@protoc_insertion_point(class_scope:orrb.ComponentStatsRequest)
+  ))
+_sym_db.RegisterMessage(ComponentStatsRequest)
+
+ComponentStatsResponse = _reflection.GeneratedProtocolMessageType('ComponentStatsResponse', (_message.Message,), dict(
+
+  ComponentStats = _reflection.GeneratedProtocolMessageType('ComponentStats', (_message.Message,), dict(
+    DESCRIPTOR = _COMPONENTSTATSRESPONSE_COMPONENTSTATS,
+    __module__ = 'orrb.protos.RenderService_pb2'
+    # @@protoc_insertion_point(class_scope:orrb.ComponentStatsResponse.ComponentStats)
+    ))
+  ,
+  DESCRIPTOR = _COMPONENTSTATSRESPONSE,
+  __module__ = 'orrb.protos.RenderService_pb2'
+  # @@protoc_insertion_point(class_scope:orrb.ComponentStatsResponse)
+  ))
+_sym_db.RegisterMessage(ComponentStatsResponse)
+_sym_db.RegisterMessage(ComponentStatsResponse.ComponentStats)
+
 
 
 _RENDERSERVICE = _descriptor.ServiceDescriptor(
@@ -580,8 +1056,8 @@ _RENDERSERVICE = _descriptor.ServiceDescriptor(
   file=DESCRIPTOR,
   index=0,
   serialized_options=None,
-  serialized_start=1234,
-  serialized_end=1374,
+  serialized_start=2407,
+  serialized_end=2759,
   methods=[
   _descriptor.MethodDescriptor(
     name='RenderBatch',
@@ -592,15 +1068,42 @@ _RENDERSERVICE = _descriptor.ServiceDescriptor(
     output_type=_RENDERBATCHRESPONSE,
     serialized_options=None,
   ),
+  _descriptor.MethodDescriptor(
+    name='RenderBatchStream',
+    full_name='orrb.RenderService.RenderBatchStream',
+    index=1,
+    containing_service=None,
+    input_type=_RENDERBATCHREQUEST,
+    output_type=_RENDERBATCHRESPONSE,
+    serialized_options=None,
+  ),
   _descriptor.MethodDescriptor(
     name='Update',
     full_name='orrb.RenderService.Update',
-    index=1,
+    index=2,
     containing_service=None,
     input_type=_UPDATEREQUEST,
     output_type=_UPDATERESPONSE,
     serialized_options=None,
   ),
+  _descriptor.MethodDescriptor(
+    name='Health',
+    full_name='orrb.RenderService.Health',
+    index=3,
+    containing_service=None,
+    input_type=_HEALTHREQUEST,
+    output_type=_HEALTHRESPONSE,
+    serialized_options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='ComponentStats',
+    full_name='orrb.RenderService.ComponentStats',
+    index=4,
+    containing_service=None,
+    input_type=_COMPONENTSTATSREQUEST,
+    output_type=_COMPONENTSTATSRESPONSE,
+    serialized_options=None,
+  ),
 ])
 _sym_db.RegisterServiceDescriptor(_RENDERSERVICE)
 
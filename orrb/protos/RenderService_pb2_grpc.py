@@ -19,11 +19,26 @@ class RenderServiceStub(object):
         request_serializer=orrb_dot_protos_dot_RenderService__pb2.RenderBatchRequest.SerializeToString,
         response_deserializer=orrb_dot_protos_dot_RenderService__pb2.RenderBatchResponse.FromString,
         )
+    self.RenderBatchStream = channel.unary_stream(
+        '/orrb.RenderService/RenderBatchStream',
+        request_serializer=orrb_dot_protos_dot_RenderService__pb2.RenderBatchRequest.SerializeToString,
+        response_deserializer=orrb_dot_protos_dot_RenderService__pb2.RenderBatchResponse.FromString,
+        )
     self.Update = channel.unary_unary(
         '/orrb.RenderService/Update',
         request_serializer=orrb_dot_protos_dot_RenderService__pb2.UpdateRequest.SerializeToString,
         response_deserializer=orrb_dot_protos_dot_RenderService__pb2.UpdateResponse.FromString,
         )
+    self.Health = channel.unary_unary(
+        '/orrb.RenderService/Health',
+        request_serializer=orrb_dot_protos_dot_RenderService__pb2.HealthRequest.SerializeToString,
+        response_deserializer=orrb_dot_protos_dot_RenderService__pb2.HealthResponse.FromString,
+        )
+    self.ComponentStats = channel.unary_unary(
+        '/orrb.RenderService/ComponentStats',
+        request_serializer=orrb_dot_protos_dot_RenderService__pb2.ComponentStatsRequest.SerializeToString,
+        response_deserializer=orrb_dot_protos_dot_RenderService__pb2.ComponentStatsResponse.FromString,
+        )
 
 
 class RenderServiceServicer(object):
@@ -37,6 +52,13 @@ class RenderServiceServicer(object):
     context.set_details('Method not implemented!')
     raise NotImplementedError('Method not implemented!')
 
+  def RenderBatchStream(self, request, context):
+    """Renders the batch in chunks and streams them back as they become ready.
+    """
+    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+    context.set_details('Method not implemented!')
+    raise NotImplementedError('Method not implemented!')
+
   def Update(self, request, context):
     # missing associated documentation comment in .proto file
     pass
@@ -44,6 +66,20 @@ class RenderServiceServicer(object):
     context.set_details('Method not implemented!')
     raise NotImplementedError('Method not implemented!')
 
+  def Health(self, request, context):
+    """Answered right away, bypassing the workload queue, to probe if the server is alive.
+    """
+    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+    context.set_details('Method not implemented!')
+    raise NotImplementedError('Method not implemented!')
+
+  def ComponentStats(self, request, context):
+    """Turns the per component profiling on or off, and returns the stats collected so far.
+    """
+    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+    context.set_details('Method not implemented!')
+    raise NotImplementedError('Method not implemented!')
+
 
 def add_RenderServiceServicer_to_server(servicer, server):
   rpc_method_handlers = {
@@ -52,11 +88,26 @@ def add_RenderServiceServicer_to_server(servicer, server):
           request_deserializer=orrb_dot_protos_dot_RenderService__pb2.RenderBatchRequest.FromString,
           response_serializer=orrb_dot_protos_dot_RenderService__pb2.RenderBatchResponse.SerializeToString,
       ),
+      'RenderBatchStream': grpc.unary_stream_rpc_method_handler(
+          servicer.RenderBatchStream,
+          request_deserializer=orrb_dot_protos_dot_RenderService__pb2.RenderBatchRequest.FromString,
+          response_serializer=orrb_dot_protos_dot_RenderService__pb2.RenderBatchResponse.SerializeToString,
+      ),
       'Update': grpc.unary_unary_rpc_method_handler(
           servicer.Update,
           request_deserializer=orrb_dot_protos_dot_RenderService__pb2.UpdateRequest.FromString,
           response_serializer=orrb_dot_protos_dot_RenderService__pb2.UpdateResponse.SerializeToString,
       ),
+      'Health': grpc.unary_unary_rpc_method_handler(
+          servicer.Health,
+          request_deserializer=orrb_dot_protos_dot_RenderService__pb2.HealthRequest.FromString,
+          response_serializer=orrb_dot_protos_dot_RenderService__pb2.HealthResponse.SerializeToString,
+      ),
+      'ComponentStats': grpc.unary_unary_rpc_method_handler(
+          servicer.ComponentStats,
+          request_deserializer=orrb_dot_protos_dot_RenderService__pb2.ComponentStatsRequest.FromString,
+          response_serializer=orrb_dot_protos_dot_RenderService__pb2.ComponentStatsResponse.SerializeToString,
+      ),
   }
   generic_handler = grpc.method_handlers_generic_handler(
       'orrb.RenderService', rpc_method_handlers)
@@ -2,22 +2,84 @@ import logging
 import time
 
 from abc import ABC, abstractmethod
-from queue import Empty, Queue
-from threading import Thread
+from collections import deque
+from concurrent.futures import CancelledError, Future
+from queue import Empty, Full, Queue
+from threading import Condition, Event, Lock, Thread
+
+
+# Put in the worker queues to wake the workers up, when the executor shuts down.
+_SHUTDOWN = object()
 
 
 class QueueTask:
 
-    def __init__(self, workload, destination):
+    def __init__(self, workload, destination=None, future=None, admission=None, cost=0):
         self.workload = workload
         self.destination = destination
+        self.future = future
+        self.admission = admission
+        self.cost = cost
+        self.attempts = 0
+        # When the task was (last) queued, and when, and on which worker, the last attempt started.
+        self.queued_time = time.time()
+        self.started_time = None
+        self.worker_index = None
+
+    def release(self):
+        if self.admission is not None:
+            self.admission.release(self.cost)
+            self.admission = None
+
+    def start(self):
+        """Returns False if the task was cancelled, before it was started."""
+        self.attempts += 1
+        self.started_time = time.time()
+        if self.future is None or self.attempts > 1:
+            return True
+        return self.future.set_running_or_notify_cancel()
+
+    def complete(self, result):
+        if self.future is not None:
+            self.future.set_result(result)
+        if self.destination is not None:
+            self.destination.put(result)
+
+    def fail(self, exception):
+        if self.future is not None:
+            self.future.set_exception(exception)
+        if self.destination is not None:
+            # The exception takes the place of the result, for the caller to raise.
+            self.destination.put(exception)
+
+    def cancel(self):
+        """Drops the queued task, its future is cancelled (or fails, if it was retried), and
+        a CancelledError is put into its destination."""
+        self.release()
+        if self.future is not None and not self.future.cancel():
+            self.future.set_exception(CancelledError('The executor was shut down.'))
+        if self.destination is not None:
+            self.destination.put(CancelledError('The executor was shut down.'))
 
 
 class QueueWorkerABC(ABC):
 
-    def __init__(self, input_queue):
+    def __init__(self, input_queue, pipeline_depth=1):
         self.input_queue = input_queue
+        self.pipeline_depth = pipeline_depth
         self.should_shutdown = False
+        # Set by the scheduler the worker is attached to.
+        self.scheduler = None
+        self.worker_index = 0
+        self.retries = 0
+        # Set once on_run is done, startup_error is the exception if it failed.
+        self.ready = Event()
+        self.startup_error = None
+        self.time_to_ready = None
+        # Set once the worker takes no more tasks, after its run returned.
+        self.stopped = False
+        # How long the task being begun waited in the queue, set right before begin_process.
+        self.queue_wait = 0.0
 
     def shutdown(self):
         self.should_shutdown = True
@@ -28,56 +90,483 @@ class QueueWorkerABC(ABC):
     def on_shutdown(self):
         pass
 
+    def on_idle(self):
+        """Called when no task arrived for a while, e.g. to check the worker health. Errors
+        are logged, the worker carries on."""
+        pass
+
+    def should_retry(self, task, error):
+        """Return True to dispatch the failed task again, instead of failing it. If it raises,
+        e.g. the worker failed to recover, the task fails with that exception."""
+        return False
+
+    def should_drain(self, workload):
+        """Return True to finish the workloads in flight before the workload is begun, e.g. if
+        it changes some state they depend on."""
+        return False
+
     def process(self, workload):
         pass
 
+    def begin_process(self, workload):
+        """Start processing a workload, return a handle that will be passed to end_process.
+
+        Workers that can have multiple workloads in flight override this pair, by default
+        the processing is synchronous.
+        """
+        return self.process(workload)
+
+    def end_process(self, handle):
+        """Block till the workload started with begin_process is done, and return the result."""
+        return handle
+
+    def _begin(self, task):
+        try:
+            return self.begin_process(task.workload), None
+        except Exception as exception:
+            return None, exception
+
+    def _end(self, task, started, handle, error):
+        if error is None:
+            try:
+                result = self.end_process(handle)
+            except Exception as exception:
+                error = exception
+        self.input_queue.task_done()
+        if self.scheduler is not None:
+            self.scheduler.on_complete(self.worker_index, time.time() - started)
+            if error is not None and not self.should_shutdown:
+                retry, error = self._should_retry(task, error)
+                if retry:
+                    # The task keeps its admission, it is still in flight.
+                    logging.warning('Retrying a failed task (attempt %d): %s' % (task.attempts,
+                                                                                error))
+                    self.retries += 1
+                    task.queued_time = time.time()
+                    try:
+                        self.scheduler.dispatch(task)
+                        return
+                    except RuntimeError as dispatch_error:
+                        # No worker is left to take it.
+                        error = dispatch_error
+        task.release()
+        if error is None:
+            task.complete(result)
+        else:
+            task.fail(error)
+
+    def _should_retry(self, task, error):
+        """Returns whether to retry, and the error to fail the task with otherwise."""
+        try:
+            return self.should_retry(task, error), error
+        except Exception as exception:
+            # E.g. restarting the server failed, the task fails with that error instead.
+            logging.error('Worker %d failed to recover: %s' % (self.worker_index, exception))
+            return False, exception
+
+    def _on_idle(self):
+        try:
+            self.on_idle()
+        except Exception as exception:
+            logging.error('Worker %d failed to recover: %s' % (self.worker_index, exception))
+
     def run(self):
-        self.on_run()
-        while True:
+        try:
+            self._run()
+        finally:
+            self.stopped = True
+            if self.scheduler is not None and not self.should_shutdown:
+                # The tasks queued for this worker go to the others.
+                self.scheduler.on_stopped(self.worker_index)
+
+    def _run(self):
+        started = time.time()
+        try:
+            self.on_run()
+        except Exception as exception:
+            logging.error('Worker %d failed to start: %s' % (self.worker_index, exception))
+            self.startup_error = exception
+            # Clean up whatever was started, e.g. the server process.
             try:
-                workload = self.input_queue.get(block=True, timeout=2.0)
-            except Empty:
-                pass
-            else:
-                result = self.process(workload.workload)
-                workload.destination.put(result)
-                self.input_queue.task_done()
+                self.on_shutdown()
+            except Exception as shutdown_exception:
+                logging.error('Worker %d failed to shut down: %s' % (self.worker_index,
+                                                                     shutdown_exception))
+            self.ready.set()
+            return
+        self.time_to_ready = time.time() - started
+        self.ready.set()
 
-            if self.should_shutdown:
+        in_flight = deque()
+        while True:
+            # After a shutdown no new tasks are taken, the ones in flight are finished.
+            if len(in_flight) < self.pipeline_depth and not self.should_shutdown:
+                try:
+                    # Do not block on the queue while there is work in flight to be finished.
+                    task = self.input_queue.get(block=not in_flight, timeout=2.0)
+                except Empty:
+                    if not in_flight:
+                        self._on_idle()
+                else:
+                    if task is _SHUTDOWN:
+                        self.input_queue.task_done()
+                        self.should_shutdown = True
+                        continue
+                    if self.scheduler is not None:
+                        self.scheduler.on_begin(self.worker_index)
+                    task.worker_index = self.worker_index
+                    if task.start():
+                        while in_flight and self.should_drain(task.workload):
+                            self._end(*in_flight.popleft())
+                        self.queue_wait = task.started_time - task.queued_time
+                        in_flight.append((task, time.time()) + self._begin(task))
+                    else:
+                        self.input_queue.task_done()
+                        task.release()
+                        if self.scheduler is not None:
+                            self.scheduler.on_complete(self.worker_index, None)
+                    continue
+
+            if in_flight:
+                self._end(*in_flight.popleft())
+
+            if self.should_shutdown and not in_flight:
                 self.on_shutdown()
                 return
 
 
+class AdmissionControl:
+    """Bounds the number of tasks, and their estimated cost in bytes, queued or in flight.
+
+    A task is admitted when both limits allow it, a task bigger than max_bytes is admitted
+    only when nothing else is in flight. Zero means no limit. The task is released once its
+    result is delivered, the results not consumed yet (e.g. in a destination queue) are not
+    counted.
+    """
+
+    def __init__(self, max_tasks=0, max_bytes=0):
+        self.max_tasks = max_tasks
+        self.max_bytes = max_bytes
+        self.tasks = 0
+        self.bytes = 0
+        # Once closed nothing more is admitted, the waiters fail.
+        self.closed = False
+        self.condition = Condition()
+
+    def _can_admit(self, cost):
+        if self.max_tasks > 0 and self.tasks >= self.max_tasks:
+            return False
+        if self.max_bytes > 0 and self.tasks > 0 and self.bytes + cost > self.max_bytes:
+            return False
+        return True
+
+    def acquire(self, cost=0, timeout=None):
+        """Blocks till the task can be admitted, raises queue.Full after the timeout, and
+        RuntimeError if the admission control is closed."""
+        with self.condition:
+            if not self.condition.wait_for(lambda: self.closed or self._can_admit(cost),
+                                           timeout):
+                raise Full('Executor is full: %d tasks, %d bytes in flight.' % (self.tasks,
+                                                                                self.bytes))
+            if self.closed:
+                raise RuntimeError('The executor has been shut down.')
+            self.tasks += 1
+            self.bytes += cost
+
+    def release(self, cost=0):
+        with self.condition:
+            self.tasks -= 1
+            self.bytes -= cost
+            self.condition.notify_all()
+
+    def close(self):
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+
+    def depth(self):
+        with self.condition:
+            return {'tasks': self.tasks, 'bytes': self.bytes}
+
+
+class WorkerStats:
+
+    def __init__(self):
+        self.dispatched = 0
+        self.completed = 0
+        self.ewma_latency = None
+
+    @property
+    def outstanding(self):
+        return self.dispatched - self.completed
+
+    def as_dict(self):
+        return {'dispatched': self.dispatched, 'completed': self.completed,
+                'outstanding': self.outstanding, 'ewma_latency': self.ewma_latency}
+
+
+class SchedulerABC(ABC):
+    """Routes the tasks queued on an executor to its workers, and keeps per worker stats.
+
+    The workers report back when they start and finish a task, the finished task latencies
+    (from start to result, in seconds) are averaged with an exponentially weighted moving average.
+    """
+
+    def __init__(self, ewma_alpha=0.2, latency_history=256):
+        self.ewma_alpha = ewma_alpha
+        self.lock = Lock()
+        self.worker_stats = []
+        # The recent task latencies of all the workers, for the percentiles.
+        self.latencies = deque(maxlen=latency_history)
+
+    def attach(self, input_queue, workers):
+        self.worker_stats = [WorkerStats() for _ in workers]
+        for i, worker in enumerate(workers):
+            worker.scheduler = self
+            worker.worker_index = i
+
+    @abstractmethod
+    def dispatch(self, task):
+        pass
+
+    def on_begin(self, worker_index):
+        pass
+
+    def on_stopped(self, worker_index):
+        """Called when a worker stopped before the shutdown, e.g. it failed to start."""
+        pass
+
+    def on_complete(self, worker_index, latency):
+        with self.lock:
+            stats = self.worker_stats[worker_index]
+            stats.completed += 1
+            if latency is None:
+                return
+            self.latencies.append(latency)
+            if stats.ewma_latency is None:
+                stats.ewma_latency = latency
+            else:
+                stats.ewma_latency += self.ewma_alpha * (latency - stats.ewma_latency)
+
+    def stats(self):
+        with self.lock:
+            return [stats.as_dict() for stats in self.worker_stats]
+
+    def latency_percentile(self, percentile, min_samples=1):
+        """The percentile of the recent task latencies, or None if there are too few yet."""
+        with self.lock:
+            if len(self.latencies) < max(1, min_samples):
+                return None
+            latencies = sorted(self.latencies)
+        return latencies[min(len(latencies) - 1, int(len(latencies) * percentile / 100.0))]
+
+
+class FifoScheduler(SchedulerABC):
+    """All the workers pull from one shared queue, as soon as they have capacity."""
+
+    def attach(self, input_queue, workers):
+        super().attach(input_queue, workers)
+        self.input_queue = input_queue
+
+    def dispatch(self, task):
+        self.input_queue.put(task)
+
+    def on_begin(self, worker_index):
+        with self.lock:
+            self.worker_stats[worker_index].dispatched += 1
+
+
+class LeastLoadedScheduler(SchedulerABC):
+    """Every worker gets its own queue, a task goes to the worker expected to finish it first.
+
+    The expected completion time is the worker EWMA latency times the number of tasks it has
+    outstanding (queued or in flight), including the new one. Workers without a latency
+    estimate yet are assumed to be as fast as the average worker. Workers that failed to
+    start, or stopped, get no tasks, the tasks queued for them go to the others.
+    """
+
+    def attach(self, input_queue, workers):
+        super().attach(input_queue, workers)
+        self.workers = workers
+        self.worker_queues = []
+        for worker in workers:
+            worker.input_queue = Queue()
+            self.worker_queues.append(worker.input_queue)
+
+    def _expected_completion(self, stats, default_latency):
+        latency = stats.ewma_latency if stats.ewma_latency is not None else default_latency
+        return (stats.outstanding + 1) * latency
+
+    def _is_usable(self, worker):
+        return worker.startup_error is None and not worker.stopped
+
+    def dispatch(self, task):
+        """Raises RuntimeError if no worker is usable."""
+        with self.lock:
+            usable = [i for i, worker in enumerate(self.workers) if self._is_usable(worker)]
+            if not usable:
+                raise RuntimeError('No worker is running.')
+            latencies = [stats.ewma_latency for stats in self.worker_stats
+                         if stats.ewma_latency is not None]
+            default_latency = sum(latencies) / len(latencies) if latencies else 1.0
+            worker_index = min(
+                usable,
+                key=lambda i: self._expected_completion(self.worker_stats[i], default_latency))
+            self.worker_stats[worker_index].dispatched += 1
+            # Queued under the lock, so that nothing is queued for a stopped worker once its
+            # queue is drained.
+            self.worker_queues[worker_index].put(task)
+
+    def on_stopped(self, worker_index):
+        worker_queue = self.worker_queues[worker_index]
+        tasks = []
+        with self.lock:
+            while True:
+                try:
+                    task = worker_queue.get_nowait()
+                except Empty:
+                    break
+                worker_queue.task_done()
+                if task is not _SHUTDOWN:
+                    self.worker_stats[worker_index].dispatched -= 1
+                    tasks.append(task)
+        for task in tasks:
+            try:
+                self.dispatch(task)
+            except RuntimeError as error:
+                task.release()
+                task.fail(error)
+
+
+_SCHEDULERS = {'fifo': FifoScheduler, 'least_loaded': LeastLoadedScheduler}
+
+
+def create_scheduler(name):
+    if name not in _SCHEDULERS:
+        raise ValueError('Unknown scheduler: %s (%s).' % (name, ', '.join(sorted(_SCHEDULERS))))
+    return _SCHEDULERS[name]()
+
+
 def worker_runner(worker):
     worker.run()
 
 
 class QueueExecutorABC(ABC):
 
-    def __init__(self, name, *args):
+    def __init__(self, name, *args, scheduler=None, admission=None):
         self.name = name
         self.input_queue = Queue()
         self.workers = self.create_workers(self.input_queue, *args)
         self.worker_threads = []
+        self.scheduler = scheduler if scheduler is not None else FifoScheduler()
+        self.scheduler.attach(self.input_queue, self.workers)
+        self.admission = admission if admission is not None else AdmissionControl()
+        self.submit_timeout = None
+        self.is_shutdown = False
+        # Guards is_shutdown, no task is dispatched after the queues are drained.
+        self.shutdown_lock = Lock()
 
     def start(self):
+        """Starts all the workers at once, and waits till they are ready.
+
+        Returns the list of workers that failed to start.
+        """
         logging.info('Starting Executor: %s (%d workers)' % (self.name, len(self.workers)))
+        started = time.time()
         self.worker_threads = [
             Thread(target=worker_runner, args=(worker,), daemon=True) for worker in self.workers]
-        for i, worker_thread in enumerate(self.worker_threads):
-            logging.info('Starting worker: %d' % i)
+        for worker_thread in self.worker_threads:
             worker_thread.start()
-            time.sleep(0.5)
+        for worker in self.workers:
+            worker.ready.wait()
+        failed = [worker for worker in self.workers if worker.startup_error is not None]
+        logging.info('Executor: %s ready in %.2fs (%d workers failed).' % (
+            self.name, time.time() - started, len(failed)))
+        return failed
 
-    def shutdown(self):
+    def shutdown(self, timeout=None):
+        """Stops the workers right away: the queued tasks are cancelled, the ones in flight are
+        finished. Returns the workers still running after the timeout.
+
+        Tasks queued with execute get a CancelledError in their destination, in place of the
+        result.
+        """
+        with self.shutdown_lock:
+            self.is_shutdown = True
+        # Fails the submitters blocked on the admission.
+        self.admission.close()
         for worker in self.workers:
             worker.shutdown()
+        worker_queues = {id(worker.input_queue): worker.input_queue for worker in self.workers}
+        for input_queue in worker_queues.values():
+            self._cancel_queued_tasks(input_queue)
+        for worker in self.workers:
+            worker.input_queue.put(_SHUTDOWN)
+        return self.join(timeout)
+
+    def _cancel_queued_tasks(self, input_queue):
+        while True:
+            try:
+                task = input_queue.get_nowait()
+            except Empty:
+                return
+            input_queue.task_done()
+            if task is not _SHUTDOWN:
+                task.cancel()
+
+    def join(self, timeout=None):
+        """Waits for the worker threads to finish, returns the workers still running after the
+        timeout (in seconds, for all of them together)."""
+        deadline = None if timeout is None else time.time() + timeout
         for i, worker_thread in enumerate(self.worker_threads):
             logging.info('Joining worker: %d' % i)
-            worker_thread.join()
+            worker_thread.join(None if deadline is None else max(0.0, deadline - time.time()))
+        return [worker for worker, worker_thread in zip(self.workers, self.worker_threads)
+                if worker_thread.is_alive()]
+
+    def estimate_cost(self, workload):
+        """The cost of a workload for the admission control, e.g. its result size in bytes."""
+        return 0
+
+    def _dispatch(self, workload, destination=None, future=None, timeout=None):
+        if self.is_shutdown:
+            raise RuntimeError('Executor: %s has been shut down.' % self.name)
+        cost = self.estimate_cost(workload)
+        self.admission.acquire(cost, self.submit_timeout if timeout is None else timeout)
+        task = QueueTask(workload, destination, future, self.admission, cost)
+        with self.shutdown_lock:
+            # The executor might have been shut down while waiting for the admission.
+            if self.is_shutdown:
+                task.release()
+                raise RuntimeError('Executor: %s has been shut down.' % self.name)
+            try:
+                self.scheduler.dispatch(task)
+            except Exception:
+                task.release()
+                raise
+        return task
 
     def execute(self, workload, destination):
-        self.input_queue.put(QueueTask(workload, destination))
+        """Queue the workload, the result is put into the destination queue. If processing
+        fails the exception is put there instead."""
+        self._dispatch(workload, destination)
+
+    def submit(self, workload):
+        """Queue the workload, returns a concurrent.futures.Future with the result.
+
+        Blocks if the admission limits are reached, raises queue.Full after submit_timeout.
+        """
+        future = Future()
+        self._dispatch(workload, future=future)
+        return future
+
+    def queue_depth(self):
+        """The number of tasks, and their total cost, queued or in flight."""
+        return self.admission.depth()
+
+    def stats(self):
+        """Per worker dispatch and latency stats, as a list of dictionaries."""
+        return self.scheduler.stats()
 
     @abstractmethod
     def create_workers(self, *args):
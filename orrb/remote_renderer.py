@@ -4,25 +4,26 @@ import os
 import platform
 import socket
 import subprocess
+import sys
 import time
 
 import google.protobuf.json_format as json_format
+import google.protobuf.message as message
 import numpy as np
 
-from copy import deepcopy
-from queue import Queue
+from collections import OrderedDict
+from concurrent.futures import CancelledError, Future
+from copy import copy, deepcopy
+from queue import Full
+from threading import Condition, Lock, Thread
 
-from orrb.queue_executor import QueueExecutorABC, QueueWorkerABC
+from orrb.queue_executor import (AdmissionControl, QueueExecutorABC, QueueWorkerABC,
+                                 create_scheduler)
+from orrb.server_registry import ServerRegistry, server_config_hash
 
 import orrb.protos.RendererConfig_pb2 as renderer_config_pb2
 import orrb.protos.RenderService_pb2 as render_service_pb2
 import orrb.protos.RenderService_pb2_grpc as render_service_pb2_grpc
-from orrb.utils import (
-    read_depth_image,
-    read_normals_image,
-    read_rgba_image,
-    read_segmentation_image,
-)
 
 # Uncompressed batches of images tend to be big, default for grpc is just 4MB.
 DEFAULT_GRPC_MESSAGE_SIZE = 256 * 1024 * 1024
@@ -35,11 +36,86 @@ def _get_server_bind_host():
         return 'localhost'
 
 
-def _create_render_service_stub(port, message_size=DEFAULT_GRPC_MESSAGE_SIZE, timeout=10.0):
-    channel = grpc.insecure_channel('%s:%d' % (_get_server_bind_host(), port),
-                                    [('grpc.max_receive_message_length', message_size)])
-    grpc.channel_ready_future(channel).result(timeout=timeout)
-    return render_service_pb2_grpc.RenderServiceStub(channel)
+def _create_render_service_channel(port, message_size=DEFAULT_GRPC_MESSAGE_SIZE, host=None):
+    # Connects lazily, the readiness of the server is probed with the Health calls.
+    host = host if host is not None else _get_server_bind_host()
+    return grpc.insecure_channel('%s:%d' % (host, port),
+                                 [('grpc.max_receive_message_length', message_size)])
+
+
+def _create_raw_update_method(channel):
+    # Sends an already serialized UpdateRequest, the serialized updates are shared by workers.
+    return channel.unary_unary(
+        '/orrb.RenderService/Update',
+        request_serializer=None,
+        response_deserializer=render_service_pb2.UpdateResponse.FromString)
+
+
+def _create_raw_render_methods(channel):
+    # The RenderBatch calls on serialized requests and responses, so that the (de)serialization
+    # can be timed apart from the call.
+    render_batch = channel.unary_unary('/orrb.RenderService/RenderBatch',
+                                       request_serializer=None, response_deserializer=None)
+    render_batch_stream = channel.unary_stream('/orrb.RenderService/RenderBatchStream',
+                                               request_serializer=None,
+                                               response_deserializer=None)
+    return render_batch, render_batch_stream
+
+
+# The client side stages of a batch, timed by the workers (in seconds): waiting in the queue,
+# the config update, building and serializing the request, the call itself (server side and
+# transfer), parsing the response and converting it to numpy arrays.
+_STAGES = ('queue_wait', 'update', 'build_request', 'serialize', 'rpc', 'parse', 'convert')
+# The server side breakdown of the rpc stage, the ServerTimings the servers send with every
+# response, summed over the streamed chunks, with a server_ prefix.
+_SERVER_STAGES = tuple(field.name for field in render_service_pb2.ServerTimings.DESCRIPTOR.fields)
+_TIMINGS_KEY = 'timings'
+
+
+def _new_timings():
+    return dict.fromkeys(_STAGES + ('request_bytes', 'response_bytes') +
+                         tuple('server_' + stage for stage in _SERVER_STAGES), 0)
+
+
+def _add_server_timings(timings, server_timings):
+    # Older servers do not send them, all zeros then.
+    for stage in _SERVER_STAGES:
+        timings['server_' + stage] += getattr(server_timings, stage)
+
+
+class _StageTimings:
+    """Total per stage times, and request / response bytes, of the batches a worker rendered.
+
+    Only the worker thread adds to them, stats() reads a copy.
+    """
+
+    def __init__(self):
+        self.totals = _new_timings()
+        self.batches = 0
+
+    def add(self, timings):
+        for key, value in timings.items():
+            self.totals[key] += value
+        self.batches += 1
+
+    def as_dict(self):
+        return dict(self.totals, batches=self.batches)
+
+
+# The RemoteRendererConfig fields a workload can override, for its batch only.
+_RENDER_OPTIONS = ('camera_names', 'image_width', 'image_height', 'render_alpha', 'render_depth',
+                   'render_normals', 'render_segmentation')
+
+
+def _effective_config(config, workload):
+    """Returns the config with the render options from the workload applied."""
+    if not any(option in workload for option in _RENDER_OPTIONS):
+        return config
+    config = copy(config)
+    for option in _RENDER_OPTIONS:
+        if option in workload:
+            setattr(config, option, workload[option])
+    return config
 
 
 def _build_render_batch_request(workload, config):
@@ -60,69 +136,169 @@ def _build_render_batch_request(workload, config):
     request.render_depth = config.render_depth
     request.render_normals = config.render_normals
     request.render_segmentation = config.render_segmentation
+    request.packed_images = config.packed_images
+    request.stream_chunk_size = config.stream_chunk_size
 
-    for i, qpos in enumerate(workload['qpos']):
-        entry = request.entries.add()
-        entry.qpos[:] = qpos
+    if config.packed_qpos:
+        qpos = np.ascontiguousarray(workload['qpos'], dtype='<f4')
+        request.packed_qpos = qpos.tobytes()
+        request.packed_qpos_shape[:] = qpos.shape
         if use_entry_seeds:
-            entry.seed = seeds[i]
+            request.packed_seeds = np.asarray(seeds, dtype='<i4').tobytes()
+    else:
+        for i, qpos in enumerate(workload['qpos']):
+            entry = request.entries.add()
+            entry.qpos[:] = qpos
+            if use_entry_seeds:
+                entry.seed = seeds[i]
 
     for camera_name in config.camera_names:
         request.camera_names.append(camera_name)
 
+    request.config_overrides.extend(workload.get('config_overrides', []))
+
     return request, len(workload['qpos'])
 
 
-def _add_auxiliary_stream(batch_dataset, batch_size, stream, dtype):
+def _build_warmup_request(config):
+    # One frame in whatever pose the scene is in, the qpos can be empty.
+    config = copy(config)
+    config.packed_qpos = False
+    config.stream_chunk_size = 0
+    request, _ = _build_render_batch_request({'qpos': [[]], 'seed': 0}, config)
+    return request
+
+
+def _is_serving(error):
+    # Servers that predate the Health call still answer it, with an error.
+    return error.code() == grpc.StatusCode.UNIMPLEMENTED
+
+
+def _add_auxiliary_stream(batch_dataset, batch_size, stream, dtype, offset=0, count=None):
+    count = batch_size if count is None else count
     data = np.array(stream.data, dtype=dtype)
     data_length = len(data)
-    if data_length % batch_size == 0:
-        data = data.reshape((batch_size, len(data) // batch_size))
+    if data_length % count != 0:
+        logging.warning(f'Error in "{stream.name}" len: {len(data)} batch: {count}.')
+        return
+
+    data = data.reshape((count, len(data) // count))
+    if count == batch_size:
         batch_dataset[stream.name] = data
-    else:
-        logging.warning(f'Error in "{stream.name}" len: {len(data)} batch: {batch_size}.')
-
-
-def _convert_render_batch_response(response, config, batch_size):
-    h, w = config.image_height, config.image_width
-    batch_dataset = dict()
-    for stream in response.streams:
-        stream_rgb_dataset = []
-        stream_depth_dataset = []
-        stream_normals_dataset = []
-        stream_segmentation_dataset = []
-        for entry in stream.entries:
-            if entry.image_data:
-                image = read_rgba_image(entry.image_data, w, h)
-                stream_rgb_dataset.append(image)
-            if entry.depth_data:
-                image = read_depth_image(entry.depth_data, w, h)
-                stream_depth_dataset.append(image)
-            if entry.normals_data:
-                image = read_normals_image(entry.normals_data, w, h)
-                stream_normals_dataset.append(image)
-            if entry.segmentation_data:
-                image = read_segmentation_image(entry.segmentation_data, w, h)
-                stream_segmentation_dataset.append(image)
-
-        batch_dataset[stream.name] = np.array(stream_rgb_dataset)
-        if stream_depth_dataset:
-            batch_dataset['%s_depth' % stream.name] = np.array(stream_depth_dataset)
-        if stream_normals_dataset:
-            batch_dataset['%s_normals' % stream.name] = np.array(stream_normals_dataset)
-        if stream_segmentation_dataset:
-            batch_dataset['%s_segmentation' % stream.name] = np.array(stream_segmentation_dataset)
-
-    for float_stream in response.auxiliary_float_streams:
-        _add_auxiliary_stream(batch_dataset, batch_size, float_stream, float)
-
-    for int_stream in response.auxiliary_int_streams:
-        _add_auxiliary_stream(batch_dataset, batch_size, int_stream, int)
-
-    for bool_stream in response.auxiliary_bool_streams:
-        _add_auxiliary_stream(batch_dataset, batch_size, bool_stream, bool)
-
-    return batch_dataset
+        return
+
+    # A streamed chunk, fill in its part of the whole batch.
+    if stream.name not in batch_dataset:
+        batch_dataset[stream.name] = np.empty((batch_size, data.shape[1]), dtype=data.dtype)
+    batch_dataset[stream.name][offset:offset + count] = data
+
+
+# The image modalities: result key suffix, entry field, dtype and per pixel channels. The packed
+# stream field is named: packed_<entry field>.
+_IMAGE_MODALITIES = [('', 'image_data', np.uint8, -1),
+                     ('_depth', 'depth_data', np.float32, 0),
+                     ('_normals', 'normals_data', np.float32, 3),
+                     ('_segmentation', 'segmentation_data', np.uint8, 0)]
+
+
+def _image_shape(data, dtype, channels, w, h):
+    if channels == 0:
+        return (h, w)
+    if channels < 0:
+        channels = len(data) // (np.dtype(dtype).itemsize * w * h)
+    return (h, w, channels)
+
+
+class _BatchDecoder:
+    """Decodes render responses into contiguous, preallocated batch tensors.
+
+    For every modality one (cameras, batch, H, W, C) buffer is allocated up front (or taken from
+    the buffer pool), the per camera results are contiguous views into it. Each image is copied
+    exactly once: from the response bytes into its slot in the buffer.
+
+    Packed streams, that span the whole batch, are not copied at all. The results are read only
+    numpy views of the response bytes, unless a buffer pool was provided.
+    """
+
+    def __init__(self, config, batch_size, buffer_pool=None):
+        self.width = config.image_width
+        self.height = config.image_height
+        self.batch_size = batch_size
+        self.buffer_pool = buffer_pool
+        self.buffers = dict()
+        self.batch_dataset = dict()
+
+    def _allocate(self, shape, dtype):
+        if self.buffer_pool is not None:
+            return self.buffer_pool.acquire(shape, dtype)
+        return np.empty(shape, dtype=dtype)
+
+    def _get_buffer(self, suffix, streams_count, data, dtype, channels):
+        buffer = self.buffers.get(suffix)
+        if buffer is None:
+            image_shape = _image_shape(data, dtype, channels, self.width, self.height)
+            buffer = self._allocate((streams_count, self.batch_size) + image_shape, dtype)
+            self.buffers[suffix] = buffer
+        return buffer
+
+    def _decode_packed(self, stream_index, streams_count, name, suffix, packed, dtype, offset):
+        images = np.frombuffer(packed.data, dtype=dtype).reshape(packed.shape)
+        if offset == 0 and len(images) == self.batch_size and self.buffer_pool is None:
+            self.batch_dataset[name + suffix] = images
+            return
+
+        buffer = self.buffers.get(suffix)
+        if buffer is None:
+            buffer = self._allocate((streams_count, self.batch_size) + images.shape[1:], dtype)
+            self.buffers[suffix] = buffer
+        buffer[stream_index, offset:offset + len(images)] = images
+        self.batch_dataset[name + suffix] = buffer[stream_index]
+
+    def decode(self, response, offset=0):
+        streams_count = len(response.streams)
+        for stream_index, stream in enumerate(response.streams):
+            for suffix, field, dtype, channels in _IMAGE_MODALITIES:
+                packed = getattr(stream, 'packed_' + field)
+                if packed.data:
+                    self._decode_packed(stream_index, streams_count, stream.name, suffix, packed,
+                                        dtype, offset)
+                    continue
+
+                buffer = None
+                for i, entry in enumerate(stream.entries):
+                    data = getattr(entry, field)
+                    if not data:
+                        continue
+                    if buffer is None:
+                        buffer = self._get_buffer(suffix, streams_count, data, dtype, channels)
+                    buffer[stream_index, offset + i] = np.frombuffer(
+                        data, dtype=dtype).reshape(buffer.shape[2:])
+                if buffer is not None:
+                    self.batch_dataset[stream.name + suffix] = buffer[stream_index]
+
+        # Older servers do not fill the entries range in, the response is the whole batch then.
+        count = response.entries_count or self.batch_size
+
+        for float_stream in response.auxiliary_float_streams:
+            _add_auxiliary_stream(self.batch_dataset, self.batch_size, float_stream, float, offset,
+                                  count)
+
+        for int_stream in response.auxiliary_int_streams:
+            _add_auxiliary_stream(self.batch_dataset, self.batch_size, int_stream, int, offset,
+                                  count)
+
+        for bool_stream in response.auxiliary_bool_streams:
+            _add_auxiliary_stream(self.batch_dataset, self.batch_size, bool_stream, bool, offset,
+                                  count)
+
+    def result(self):
+        return self.batch_dataset
+
+
+def _convert_render_batch_response(response, config, batch_size, buffer_pool=None):
+    decoder = _BatchDecoder(config, batch_size, buffer_pool)
+    decoder.decode(response)
+    return decoder.result()
 
 
 def _build_update_request(renderer_config):
@@ -135,76 +311,337 @@ def _build_update_request(renderer_config):
     return request
 
 
+_PROPERTY_MAPS = [field.name for field in
+                  renderer_config_pb2.RendererComponentConfig.DESCRIPTOR.fields]
+
+
+def _diff_renderer_configs(old_config, new_config):
+    """Returns the components of the new config, with only the properties that changed."""
+    old_components = {component.name: component for component in old_config.components}
+    diff = []
+    for component in new_config.components:
+        old_component = old_components.get(component.name)
+        if old_component is None:
+            diff.append(component)
+            continue
+        changed = renderer_config_pb2.RendererComponent(name=component.name, type=component.type,
+                                                        path=component.path)
+        for property_map in _PROPERTY_MAPS:
+            old_properties = getattr(old_component.config, property_map)
+            changed_properties = getattr(changed.config, property_map)
+            for key, value in getattr(component.config, property_map).items():
+                if key in old_properties and old_properties[key] == value:
+                    continue
+                if isinstance(value, message.Message):
+                    changed_properties[key].CopyFrom(value)
+                else:
+                    changed_properties[key] = value
+        if changed.config.ByteSize() > 0:
+            diff.append(changed)
+    return diff
+
+
+class _ConfigVersions:
+    """The recent renderer config versions, and the serialized updates between them.
+
+    The servers are updated with just the properties that changed since the version they have.
+    The serialized updates are cached, the workers of a renderer share them.
+    """
+
+    def __init__(self, renderer_config, max_versions=16, max_updates=64):
+        self.max_versions = max_versions
+        self.max_updates = max_updates
+        self.versions = OrderedDict([(0, deepcopy(renderer_config))])
+        self.serialized_updates = OrderedDict()
+        self.lock = Lock()
+
+    def add(self, stamp, renderer_config):
+        with self.lock:
+            self.versions[stamp] = deepcopy(renderer_config)
+            while len(self.versions) > self.max_versions:
+                self.versions.popitem(last=False)
+
+    def serialized_update(self, from_stamp, to_stamp, renderer_config):
+        """Returns the serialized UpdateRequest, that takes a server from one version to the
+        other. Falls back to the full renderer_config, if the versions are not known.
+        """
+        key = (from_stamp, to_stamp)
+        with self.lock:
+            serialized_update = self.serialized_updates.get(key)
+            if serialized_update is not None:
+                self.serialized_updates.move_to_end(key)
+                return serialized_update
+            old_config = self.versions.get(from_stamp)
+            new_config = self.versions.get(to_stamp)
+
+        if new_config is None:
+            return _build_update_request(renderer_config).SerializeToString()
+        request = render_service_pb2.UpdateRequest()
+        if old_config is None:
+            request.components.extend(new_config.components)
+        else:
+            request.components.extend(_diff_renderer_configs(old_config, new_config))
+        serialized_update = request.SerializeToString()
+
+        with self.lock:
+            self.serialized_updates[key] = serialized_update
+            while len(self.serialized_updates) > self.max_updates:
+                self.serialized_updates.popitem(last=False)
+        return serialized_update
+
+
 class _WorkloadWithConfig:
-    def __init__(self, renderer_config_stamp, renderer_config, workload):
+    def __init__(self, renderer_config_stamp, renderer_config, workload, config_versions=None):
         self.renderer_config_stamp = renderer_config_stamp
         self.renderer_config = renderer_config
         self.workload = workload
+        self.config_versions = config_versions
 
 
-class _RemoteRendererWorker(QueueWorkerABC):
+def _shards_count(config, batch_size, workers_count):
+    if not config.shard_workloads:
+        return 1
+    return max(1, min(workers_count, batch_size // max(1, config.min_shard_size)))
 
-    def __init__(self, input_queue, device, port, base_config):
-        super().__init__(input_queue)
-        self.device = device
-        self.port = port
-        self.base_config = base_config
-        self.server_process = None
-        self.client_stub = None
-        self.renderer_config_stamp = 0
 
-    def on_run(self):
-        if self.base_config.spawn_servers:
-            command, args, environment = self._server_commandline()
-            logging.info('Starting render server: %s args: %s env: %s.' % (
-                command, args, environment if environment else '-'))
-
-            environment_copy = os.environ.copy()
-            if environment:
-                environment_copy.update(environment)
-
-            if os.getenv('ORRB_DETACHED'):
-                print('\nManually start: %s' % ' '.join([command] + args))
-                input('\nPress enter when ready.')
-            else:
-                self.server_process = subprocess.Popen([command] + args,
-                                                       stdout=subprocess.DEVNULL,
-                                                       stderr=subprocess.DEVNULL,
-                                                       cwd=os.path.dirname(command),
-                                                       env=environment_copy)
-        for i in range(10):
-            try:
-                self.client_stub = _create_render_service_stub(self.port)
+# The workload keys that apply to the whole batch, every shard gets them.
+_BATCH_KEYS = ('config_overrides',) + _RENDER_OPTIONS
+# The workload keys sent to the server, everything else in the result was rendered.
+_REQUEST_KEYS = ('qpos', 'seed', 'seeds') + _BATCH_KEYS
+
+
+def _entry_seeds(workload, start=0, end=None):
+    """Returns the explicit per state seeds the server would use for the [start, end) range."""
+    end = len(workload['qpos']) if end is None else end
+    if 'seeds' in workload:
+        return np.asarray(workload['seeds'][start:end])
+    seed = workload['seed'] % (1 << 31)
+    # The server adds the entry index to the batch seed with int32 wraparound, reproduce it.
+    seeds = (seed + np.arange(start, end, dtype=np.int64) + (1 << 31)) % (1 << 32) - (1 << 31)
+    return seeds.astype(np.int32)
+
+
+def _shard_seeds(workload, start, end):
+    if 'seed' in workload and 'seeds' not in workload:
+        seed = workload['seed'] % (1 << 31)
+        if seed + end <= (1 << 31):
+            return {'seed': seed + start}
+    return {'seeds': _entry_seeds(workload, start, end)}
+
+
+def _split_workload(workload, shards_count):
+    """Splits the workload into shards of consecutive states, with unchanged per state seeds."""
+    batch_size = len(workload['qpos'])
+    bounds = np.linspace(0, batch_size, shards_count + 1).astype(int)
+    shards = []
+    for start, end in zip(bounds[:-1], bounds[1:]):
+        shard = {'qpos': workload['qpos'][start:end]}
+        shard.update(_shard_seeds(workload, start, end))
+        shard.update({key: workload[key] for key in _BATCH_KEYS if key in workload})
+        shards.append(shard)
+    return shards
+
+
+def _merge_shards(workload, results, buffer_pool=None):
+    """Concatenates the rendered shards, in order, into the original workload."""
+    for key, value in results[0].items():
+        if key in _REQUEST_KEYS:
+            continue
+        if key == _TIMINGS_KEY:
+            # The shards are rendered in parallel, their timings add up to the total work.
+            workload[key] = {stage: sum(result[key][stage] for result in results)
+                             for stage in value}
+            continue
+        parts = [result[key] for result in results]
+        shape = (sum(len(part) for part in parts),) + value.shape[1:]
+        if buffer_pool is not None:
+            merged = buffer_pool.acquire(shape, value.dtype)
+        else:
+            merged = np.empty(shape, dtype=value.dtype)
+        np.concatenate(parts, out=merged)
+        workload[key] = merged
+    if buffer_pool is not None:
+        for result in results:
+            buffer_pool.release_batch(result)
+    return workload
+
+
+def _put_result(future, destination):
+    # Like the executor does, a failed (or cancelled) batch puts its exception into the queue.
+    try:
+        result = future.result()
+    except Exception as exception:
+        result = exception
+    destination.put(result)
+
+
+def _estimate_response_bytes(config, batch_size):
+    pixels = config.image_width * config.image_height
+    frame_bytes = pixels * (4 if config.render_alpha else 3)
+    if config.render_depth:
+        frame_bytes += pixels * 4
+    if config.render_normals:
+        frame_bytes += pixels * 3 * 4
+    if config.render_segmentation:
+        frame_bytes += pixels
+    return frame_bytes * len(config.camera_names) * batch_size
+
+
+def _chain_call(previous, send, send_after_failure):
+    """Returns a Future of the grpc call that send starts once the previous call is done, or
+    that send_after_failure starts if the previous call failed."""
+    future = Future()
+    future.set_running_or_notify_cancel()
+
+    def on_call_done(call):
+        error = call.exception()
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(call.result())
+
+    def on_previous_done(previous_call):
+        try:
+            call = send() if previous_call.exception() is None else send_after_failure()
+        except Exception as error:
+            future.set_exception(error)
+            return
+        call.add_done_callback(on_call_done)
+
+    previous.add_done_callback(on_previous_done)
+    return future
+
+
+def _gather_calls(result, calls):
+    """Returns a Future that resolves to result once all the grpc calls are done."""
+    future = Future()
+    future.set_running_or_notify_cancel()
+    remaining = [len(calls)]
+    lock = Lock()
+
+    def on_call_done(call):
+        with lock:
+            if future.done():
+                return
+            error = call.exception()
+            if error is not None:
+                future.set_exception(RendererError('Broadcast update failed: %s.' % error))
                 return
-            except:
-                logging.warning(f'... cannot create client stub, retrying. If this persists '
-                                f'check /tmp/StandaloneRenderer.{self.port}.log.')
-                time.sleep(1 + i)
-        raise RendererError('Could not create remote render server.')
+            remaining[0] -= 1
+            if remaining[0] == 0:
+                future.set_result(result)
 
-    def on_shutdown(self):
-        if self.server_process:
-            self.server_process.terminate()
-            self.server_process.kill()
-            self.server_process.wait()
+    if not calls:
+        future.set_result(result)
+    for call in calls:
+        call.add_done_callback(on_call_done)
+    return future
 
-    def process(self, workload_with_config):
-        if workload_with_config.renderer_config_stamp != self.renderer_config_stamp:
-            self.renderer_config_stamp = workload_with_config.renderer_config_stamp
-            self.client_stub.Update(_build_update_request(workload_with_config.renderer_config))
 
-        actual_workload = workload_with_config.workload
-        request, batch_size = _build_render_batch_request(actual_workload, self.base_config)
-        response = self.client_stub.RenderBatch(request)
-        actual_workload.update(
-            _convert_render_batch_response(response, self.base_config, batch_size))
-        return actual_workload
+def _render_server_error(port, error):
+    return RendererError('Render server at port %d failed: %s (%s).' % (
+        port, error.code(), error.details()))
+
 
-    def _server_commandline(self):
-        assert self.base_config.renderer_local_binary
-        assert self.base_config.model_xml_path
-        assert self.base_config.model_mapping_path
-        assert self.base_config.renderer_config_path
+class _RenderServer:
+    """A single render server: spawns and kills its local process, and keeps track of the
+    renderer config version the server was last updated with.
+
+    Attached servers are managed externally (see orrb.ServerRegistry), they are neither
+    spawned nor killed.
+    """
+
+    def __init__(self, device, port, base_config, host=None, attached=False):
+        self.device = device
+        self.port = port
+        self.host = host if host is not None else _get_server_bind_host()
+        self.base_config = base_config
+        self.attached = attached
+        self.server_process = None
+        # An attached server might have been updated by its previous users.
+        self.renderer_config_stamp = -1 if attached else 0
+        # The last eagerly broadcast Update call, guarded by the lock.
+        self.pending_update = None
+        self.lock = Lock()
+        self.restarts = 0
+
+    def spawn(self):
+        if not self.base_config.spawn_servers or self.attached:
+            return
+
+        command, args, environment = self.commandline()
+        logging.info('Starting render server: %s args: %s env: %s.' % (
+            command, args, environment if environment else '-'))
+
+        environment_copy = os.environ.copy()
+        if environment:
+            environment_copy.update(environment)
+
+        if os.getenv('ORRB_DETACHED'):
+            print('\nManually start: %s' % ' '.join([command] + args))
+            input('\nPress enter when ready.')
+        else:
+            self.server_process = subprocess.Popen([command] + args,
+                                                   stdout=subprocess.DEVNULL,
+                                                   stderr=subprocess.DEVNULL,
+                                                   cwd=os.path.dirname(command),
+                                                   env=environment_copy)
+
+    def kill(self, grace_period=0.0):
+        """Terminates the server, and kills it if it does not exit within the grace period."""
+        if self.server_process:
+            self.server_process.terminate()
+            try:
+                self.server_process.wait(grace_period)
+            except subprocess.TimeoutExpired:
+                self.server_process.kill()
+                self.server_process.wait()
+
+    def is_running(self):
+        """False if the spawned server process has exited."""
+        return self.server_process is None or self.server_process.poll() is None
+
+    def respawn(self):
+        """Kills the server and starts it again, with the same commandline."""
+        logging.warning('Restarting render server at port %d (exit code: %s).' % (
+            self.port, self.server_process.poll() if self.server_process else None))
+        self.kill()
+        self.server_process = None
+        self.spawn()
+        self.restarts += 1
+        # Whatever the server had, the next batch brings the full config.
+        self.renderer_config_stamp = -1
+        self.pending_update = None
+
+    def update_request(self, workload_with_config):
+        """Returns the serialized UpdateRequest to send before the workload, or None if the
+        server is up to date."""
+        stamp = workload_with_config.renderer_config_stamp
+        if stamp == self.renderer_config_stamp:
+            return None
+        from_stamp, self.renderer_config_stamp = self.renderer_config_stamp, stamp
+        if workload_with_config.config_versions is None:
+            return _build_update_request(workload_with_config.renderer_config).SerializeToString()
+        return workload_with_config.config_versions.serialized_update(
+            from_stamp, stamp, workload_with_config.renderer_config)
+
+    def wait_for_pending_update(self):
+        """Blocks till the broadcast update, if any, is acknowledged. Call with the lock held."""
+        pending_update, self.pending_update = self.pending_update, None
+        if pending_update is None:
+            return
+        try:
+            pending_update.result()
+        except grpc.RpcError as error:
+            self.renderer_config_stamp = -1
+            raise _render_server_error(self.port, error) from error
+
+    def commandline(self):
+        if not self.base_config.fake_servers:
+            assert self.base_config.renderer_local_binary
+            assert self.base_config.model_xml_path
+            assert self.base_config.model_mapping_path
+            assert self.base_config.renderer_config_path
         commandline_args = ['-logFile', '/tmp/StandaloneRenderer.%d.log' % self.port,
                             '--render_server.host=%s' % _get_server_bind_host(),
                             '--render_server.port=%d' % self.port,
@@ -218,10 +655,229 @@ class _RemoteRendererWorker(QueueWorkerABC):
                                 self.base_config.renderer_config_path),
                             '--main.asset_basedir=%s' % self.base_config.asset_basedir,
                             '--main.parent_pid=%d' % os.getpid()]
+        if self.base_config.fake_servers:
+            return self._fake_commandline(commandline_args)
         display = os.getenv('ORRB_DISPLAY', '0')
         environment = {'DISPLAY': ':%s.%d' % (display, self.device)}
         return (self.base_config.renderer_local_binary, commandline_args, environment)
 
+    def _fake_commandline(self, commandline_args):
+        # The fake server takes the same flags, the package has to be importable from its cwd.
+        package_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        python_path = os.pathsep.join(filter(None, [package_path, os.getenv('PYTHONPATH')]))
+        commandline_args = ['-m', 'orrb.fake_render_server'] + commandline_args + [
+            '--fake.frame_latency=%f' % self.base_config.fake_frame_latency,
+            '--fake.latency_jitter=%f' % self.base_config.fake_latency_jitter]
+        return (sys.executable, commandline_args, {'PYTHONPATH': python_path})
+
+
+class _RemoteRendererWorker(QueueWorkerABC):
+
+    def __init__(self, input_queue, device, port, base_config, buffer_pool=None, host=None,
+                 attached=False):
+        super().__init__(input_queue, base_config.pipeline_depth)
+        self.device = device
+        self.port = port
+        self.base_config = base_config
+        self.buffer_pool = buffer_pool
+        self.server = _RenderServer(device, port, base_config, host, attached)
+        self.client_stub = None
+        self.raw_update = None
+        self.raw_render_batch = None
+        self.raw_render_batch_stream = None
+        self.timings = _StageTimings()
+
+    def on_run(self):
+        self.server.spawn()
+        channel = _create_render_service_channel(self.port, host=self.server.host)
+        self.client_stub = render_service_pb2_grpc.RenderServiceStub(channel)
+        self.raw_update = _create_raw_update_method(channel)
+        self.raw_render_batch, self.raw_render_batch_stream = _create_raw_render_methods(channel)
+        if not self.wait_until_ready(self.base_config.server_start_timeout):
+            raise RendererError(f'Render server at port {self.port} is not ready, check '
+                                f'/tmp/StandaloneRenderer.{self.port}.log.')
+        # Attached servers are long lived, and have been warmed up already.
+        if self.base_config.warmup_render and not self.server.attached:
+            self.warmup()
+        if self.base_config.profile_components:
+            self.component_stats(profiling=True)
+
+    def warmup(self):
+        """Renders one frame, the first frames after startup have some AO artifacts."""
+        try:
+            self.client_stub.RenderBatch(_build_warmup_request(self.base_config),
+                                         timeout=self.base_config.server_start_timeout)
+        except grpc.RpcError as error:
+            raise _render_server_error(self.port, error) from error
+
+    def component_stats(self, profiling=None, reset=False):
+        """Returns the per component stats of the server, optionally switches the profiling."""
+        request = render_service_pb2.ComponentStatsRequest(set_profiling=profiling is not None,
+                                                           profiling=bool(profiling), reset=reset)
+        try:
+            # The call waits for the batches queued on the server before it.
+            response = self.client_stub.ComponentStats(
+                request, timeout=self.base_config.server_start_timeout)
+        except grpc.RpcError as error:
+            raise _render_server_error(self.port, error) from error
+        return {'device': self.device, 'port': self.port, 'profiling': response.profiling,
+                'components': [{'name': component.name, 'type': component.type,
+                                'calls': component.calls,
+                                'total_seconds': component.total_seconds,
+                                'max_seconds': component.max_seconds}
+                               for component in response.components]}
+
+    def on_shutdown(self):
+        # Every worker stops its own server, so they all terminate in parallel.
+        self.server.kill(self.base_config.shutdown_grace_period)
+
+    def check_health(self, timeout=5.0, wait_for_ready=False):
+        if not self.server.is_running():
+            return False
+        try:
+            self.client_stub.Health(render_service_pb2.HealthRequest(), timeout=timeout,
+                                    wait_for_ready=wait_for_ready)
+        except grpc.RpcError as error:
+            return _is_serving(error)
+        return True
+
+    def wait_until_ready(self, timeout):
+        """Polls the server till it answers, gives up if its process exits or on timeout."""
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if self.check_health(min(1.0, deadline - time.time()), wait_for_ready=True):
+                return True
+            if not self.server.is_running():
+                return False
+        return False
+
+    def restart_server(self):
+        with self.server.lock:
+            self.server.respawn()
+        if not self.wait_until_ready(self.base_config.server_start_timeout):
+            logging.error(f'Render server at port {self.port} did not come back, check '
+                          f'/tmp/StandaloneRenderer.{self.port}.log.')
+        elif self.base_config.profile_components:
+            self.component_stats(profiling=True)
+
+    def on_idle(self):
+        if not self.server.is_running():
+            self.restart_server()
+
+    def should_retry(self, task, error):
+        if not isinstance(error, RendererError):
+            return False
+        if not self.check_health():
+            self.restart_server()
+        elif not isinstance(error.__cause__, grpc.RpcError) or (
+                error.__cause__.code() != grpc.StatusCode.UNAVAILABLE):
+            # The server is fine, and did not go away mid call, the request itself failed.
+            return False
+        # Another worker, or this one once the server is back, renders it with the same seeds.
+        return task.attempts <= self.base_config.max_retries
+
+    def should_drain(self, workload_with_config):
+        # grpc does not keep separate calls in order, the batches in flight could be rendered
+        # with the new config if the update was sent alongside them.
+        return workload_with_config.renderer_config_stamp != self.server.renderer_config_stamp
+
+    def begin_process(self, workload_with_config):
+        timings = _new_timings()
+        timings['queue_wait'] = self.queue_wait
+        start = time.perf_counter()
+        # The batches in flight were finished first (see should_drain), the update is applied
+        # after them, and before this one.
+        with self.server.lock:
+            self.server.wait_for_pending_update()
+            update_request = self.server.update_request(workload_with_config)
+            if update_request is not None:
+                try:
+                    self.raw_update(update_request)
+                except grpc.RpcError as error:
+                    # Force a retry of the update with the next batch.
+                    self.server.renderer_config_stamp = -1
+                    raise _render_server_error(self.port, error) from error
+
+        update_done = time.perf_counter()
+        timings['update'] = update_done - start
+
+        actual_workload = workload_with_config.workload
+        config = _effective_config(self.base_config, actual_workload)
+        request, batch_size = _build_render_batch_request(actual_workload, config)
+        request_built = time.perf_counter()
+        timings['build_request'] = request_built - update_done
+
+        serialized_request = request.SerializeToString()
+        call_start = time.perf_counter()
+        timings['serialize'] = call_start - request_built
+        timings['request_bytes'] = len(serialized_request)
+        if config.stream_chunk_size > 0:
+            call = self.raw_render_batch_stream(serialized_request)
+        else:
+            call = self.raw_render_batch.future(serialized_request)
+        return actual_workload, batch_size, config, call, timings, call_start
+
+    def broadcast_update(self, workload_with_config):
+        """Sends the config update without blocking, returns the future of the Update call, or
+        None if there is nothing to send. The following batches wait for the acknowledgement,
+        the batches already in flight might be rendered with the new config.
+        """
+        with self.server.lock:
+            if self.client_stub is None:
+                return None
+            update_request = self.server.update_request(workload_with_config)
+            if update_request is None:
+                return None
+            previous_update = self.server.pending_update
+            if previous_update is None:
+                self.server.pending_update = self.raw_update.future(update_request)
+            else:
+                # Keep the updates in order. The update is relative to the previous one, if
+                # that failed the full config is sent instead.
+                full_update_request = _build_update_request(
+                    workload_with_config.renderer_config).SerializeToString()
+                self.server.pending_update = _chain_call(
+                    previous_update, lambda: self.raw_update.future(update_request),
+                    lambda: self.raw_update.future(full_update_request))
+            return self.server.pending_update
+
+    def _decode(self, decoder, serialized_response, timings, received, offset=None):
+        response = render_service_pb2.RenderBatchResponse.FromString(serialized_response)
+        parsed = time.perf_counter()
+        decoder.decode(response, response.entries_offset if offset is None else offset)
+        timings['parse'] += parsed - received
+        timings['convert'] += time.perf_counter() - parsed
+        _add_server_timings(timings, response.server_timings)
+        timings['response_bytes'] += len(serialized_response)
+
+    def end_process(self, handle):
+        actual_workload, batch_size, config, call, timings, call_start = handle
+        decoder = _BatchDecoder(config, batch_size, self.buffer_pool)
+        try:
+            if config.stream_chunk_size > 0:
+                # Decode the chunks as they arrive, while the server keeps rendering.
+                wait_start = call_start
+                for serialized_response in call:
+                    received = time.perf_counter()
+                    timings['rpc'] += received - wait_start
+                    self._decode(decoder, serialized_response, timings, received)
+                    wait_start = time.perf_counter()
+            else:
+                serialized_response = call.result()
+                received = time.perf_counter()
+                timings['rpc'] = received - call_start
+                self._decode(decoder, serialized_response, timings, received, 0)
+        except grpc.RpcError as error:
+            raise _render_server_error(self.port, error) from error
+        actual_workload.update(decoder.result())
+        self.timings.add(timings)
+        if self.base_config.report_timings:
+            actual_workload[_TIMINGS_KEY] = timings
+        return actual_workload
+
+    def process(self, workload_with_config):
+        return self.end_process(self.begin_process(workload_with_config))
+
 
 def _resolve_path(base_dir, path):
     if os.path.isabs(path):
@@ -250,6 +906,12 @@ class RemoteRendererConfig:
         self.render_depth = False
         self.render_normals = False
         self.render_segmentation = False
+        # Ask the servers for one packed blob per camera and modality, cheaper to parse.
+        self.packed_images = False
+        # Send the qpos and seeds as packed binary tensors, instead of per state messages.
+        self.packed_qpos = False
+        # Stream the results back in chunks of this many frames (0 - wait for the whole batch).
+        self.stream_chunk_size = 0
         self.image_width = 100
         self.image_height = 100
         self.spawn_servers = True
@@ -260,66 +922,444 @@ class RemoteRendererConfig:
         self.model_mapping_path = None
         self.asset_basedir = "."
 
+        # Number of requests each worker keeps in flight on its render server. Values above the
+        # streams_count will be throttled by the server.
+        self.pipeline_depth = 1
+        # How the batches are routed to the workers: 'fifo' - whichever worker is free first,
+        # 'least_loaded' - the worker with the shortest expected completion time.
+        self.scheduler = 'fifo'
+        # Split big workloads into shards, of at least min_shard_size states, rendered in
+        # parallel by all the servers. The seeds, and hence the results, stay the same.
+        self.shard_workloads = False
+        self.min_shard_size = 64
+        # Backpressure: submitting blocks while this many batches, or batches with this many
+        # (estimated) response bytes, are queued or rendering. Zero means no limit. After
+        # submit_timeout seconds queue.Full is raised (None - wait forever). The results
+        # delivered, but not consumed yet, are not counted.
+        self.max_queued_batches = 0
+        self.max_inflight_bytes = 0
+        self.submit_timeout = None
+        # Render servers that crash, or stop responding, are restarted, and the batches they were
+        # rendering are retried (with the same seeds) up to max_retries times.
+        self.max_retries = 2
+        # How long to wait for a (re)started render server to respond, in seconds.
+        self.server_start_timeout = 60.0
+        # Render one frame on every server at startup, the very first frames have AO artifacts.
+        self.warmup_render = True
+        # How long shutdown waits for the batches being rendered, and then for the servers to
+        # exit after SIGTERM, before killing them, in seconds.
+        self.shutdown_grace_period = 5.0
+        # Lease idle, long lived servers with a matching config from the orrb.ServerRegistry
+        # (e.g. started with bin/render_daemon.py), only the missing ones are spawned. The
+        # registry file defaults to $ORRB_SERVER_REGISTRY, or /tmp/orrb_servers.json.
+        self.attach_servers = False
+        self.server_registry_path = None
+        # Hedging: a batch still rendering after this percentile (e.g. 95) of the recent batch
+        # latencies is also sent to an idle server, the first result wins (0 - no hedging).
+        # There have to be hedge_min_samples latencies recorded first.
+        self.hedge_percentile = 0
+        self.hedge_min_samples = 32
+        # Time every renderer component (randomizer, tracker, ...) on the servers, see
+        # RemoteRenderer.component_stats and orrb.utils.print_component_stats.
+        self.profile_components = False
+        # Add the client side stage timings (see the stats), of each batch, to its result as
+        # result['timings'].
+        self.report_timings = False
+        # Spawn orrb.fake_render_server processes instead of the StandaloneRenderer: synthetic
+        # frames, rendered in fake_frame_latency (+- fake_latency_jitter) seconds each. No GPU,
+        # nor renderer binary needed, for client benchmarks and tests.
+        self.fake_servers = False
+        self.fake_frame_latency = 0.0
+        self.fake_latency_jitter = 0.0
+
         # Tune these params according to the request load placed upon each render server.
         self.workers_count = 4
         self.queues_count = 4
         self.streams_count = 4
 
 
+def _build_local_config(base_config):
+    local_config = deepcopy(base_config)
+    if local_config.renderer_local_binary is None and not local_config.fake_servers:
+        local_config.renderer_local_binary = get_renderer_executable(local_config.renderer_version)
+    return local_config
+
+
+def _select_server_configs(server_configs):
+    assert len(server_configs) > 0
+
+    if os.getenv('ORRB_MINIMAL'):
+        minimal_setup_size = int(os.getenv('ORRB_MINIMAL'))
+        server_configs = server_configs[:minimal_setup_size]
+    return server_configs
+
+
+class _HedgedRequest:
+
+    def __init__(self, workload_with_config):
+        self.workload_with_config = workload_with_config
+        # The QueueTasks rendering the workload, the first one is the primary.
+        self.attempts = []
+        self.future = Future()
+        self.future.set_running_or_notify_cancel()
+
+
+class _Hedger:
+    """Sends a copy of the batches, that take longer than the given percentile of the recent
+    batch latencies, to an idle worker. Both copies are rendered with the same seeds, so the
+    results are interchangeable: the first one wins, the other one is cancelled or discarded.
+    """
+
+    def __init__(self, renderer, percentile, min_samples):
+        self.renderer = renderer
+        self.percentile = percentile
+        self.min_samples = min_samples
+        # The requests that might still need a hedge, guarded by the condition.
+        self.pending = []
+        self.condition = Condition()
+        self.should_shutdown = False
+        self.hedged = 0
+        self.hedges_won = 0
+        self.thread = None
+
+    def start(self):
+        self.thread = Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def shutdown(self):
+        with self.condition:
+            self.should_shutdown = True
+            self.condition.notify()
+        if self.thread is not None:
+            self.thread.join()
+
+    def stats(self):
+        with self.condition:
+            return {'hedged': self.hedged, 'hedges_won': self.hedges_won}
+
+    def submit(self, workload_with_config):
+        request = _HedgedRequest(workload_with_config)
+        self._dispatch(request)
+        with self.condition:
+            if not request.future.done():
+                self.pending.append(request)
+                self.condition.notify()
+        return request.future
+
+    def _dispatch(self, request, timeout=None):
+        # Every attempt renders into its own copy of the workload, the winner's go to the caller.
+        workload_with_config = request.workload_with_config
+        attempt = _WorkloadWithConfig(workload_with_config.renderer_config_stamp,
+                                      workload_with_config.renderer_config,
+                                      dict(workload_with_config.workload),
+                                      workload_with_config.config_versions)
+        task = self.renderer._dispatch(attempt, future=Future(), timeout=timeout)
+        request.attempts.append(task)
+        task.future.add_done_callback(lambda future: self._on_attempt_done(request, future))
+
+    def _discard(self, future):
+        if future.exception() is None and self.renderer.buffer_pool is not None:
+            self.renderer.buffer_pool.release_batch(
+                {key: value for key, value in future.result().items()
+                 if key not in _REQUEST_KEYS})
+
+    def _on_attempt_done(self, request, future):
+        with self.condition:
+            # A new latency sample, and a free worker, for the requests waiting on a hedge.
+            self.condition.notify()
+            if request.future.done():
+                winner = None
+            elif not future.cancelled() and future.exception() is None:
+                winner = future
+            elif not all(task.future.done() for task in request.attempts):
+                # The other attempt may still succeed.
+                return
+            else:
+                # All the attempts failed, or were cancelled by a shutdown.
+                winner = future
+            if winner is not None:
+                if request in self.pending:
+                    self.pending.remove(request)
+                succeeded = not winner.cancelled() and winner.exception() is None
+                if succeeded and winner is not request.attempts[0].future:
+                    self.hedges_won += 1
+            losers = [task.future for task in request.attempts if task.future is not future]
+
+        if winner is None:
+            if not future.cancelled():
+                self._discard(future)
+            return
+        if winner.cancelled():
+            request.future.set_exception(CancelledError('The renderer was shut down.'))
+            return
+        if winner.exception() is not None:
+            request.future.set_exception(winner.exception())
+            return
+        workload = request.workload_with_config.workload
+        workload.update(winner.result())
+        request.future.set_result(workload)
+        for loser in losers:
+            loser.cancel()
+
+    def _has_idle_worker(self, busy_worker_index):
+        return any(stats['outstanding'] == 0
+                   for i, stats in enumerate(self.renderer.scheduler.stats())
+                   if i != busy_worker_index)
+
+    def _run(self):
+        with self.condition:
+            while not self.should_shutdown:
+                threshold = self.renderer.scheduler.latency_percentile(self.percentile,
+                                                                       self.min_samples)
+                if threshold is None:
+                    # Too few samples yet, an attempt done brings a new one.
+                    self.condition.wait()
+                    continue
+                # Without a deadline wait till an attempt is done, that frees a worker.
+                wait = None
+                for request in list(self.pending):
+                    primary = request.attempts[0]
+                    # A primary that has not started is a threshold away from a hedge, at least.
+                    remaining = threshold if primary.started_time is None else (
+                        primary.started_time + threshold - time.time())
+                    if remaining > 0:
+                        wait = remaining if wait is None else min(wait, remaining)
+                        continue
+                    if not self._has_idle_worker(primary.worker_index):
+                        continue
+                    try:
+                        self._dispatch(request, timeout=0)
+                    except Full:
+                        continue
+                    self.hedged += 1
+                    self.pending.remove(request)
+                self.condition.wait(wait)
+
+
 class RemoteRenderer(QueueExecutorABC):
 
-    def __init__(self, name, server_configs, base_config):
+    def __init__(self, name, server_configs, base_config, buffer_pool=None):
         """Main class for managing remote renderer workers and configs.
 
         :param name: A name for this renderer in str.
         :param server_configs: A list of (device, port), where device could be the GPU id.
         :param base_config: A orrb.RemoteRendererConfig object.
+        :param buffer_pool: An optional orrb.BufferPool, the result tensors are allocated from it.
         """
         self.renderer_config_stamp = 0
         self.renderer_config = _load_renderer_config(base_config.asset_basedir,
                                                      base_config.renderer_config_path)
-        self.local_config = deepcopy(base_config)
-        self.sync_queue = Queue()
-
-        if self.local_config.renderer_local_binary is None:
-            self.local_config.renderer_local_binary = get_renderer_executable(
-                self.local_config.renderer_version)
-
-        super().__init__(name, server_configs, self.local_config)
+        self.local_config = _build_local_config(base_config)
+        self.buffer_pool = buffer_pool
+        self.config_versions = _ConfigVersions(self.renderer_config)
+        self.config_lock = Lock()
+        self.registry = None
+        if self.local_config.attach_servers:
+            self.registry = ServerRegistry(self.local_config.server_registry_path)
+
+        super().__init__(name, server_configs, self.local_config, buffer_pool,
+                         scheduler=create_scheduler(self.local_config.scheduler),
+                         admission=AdmissionControl(self.local_config.max_queued_batches,
+                                                    self.local_config.max_inflight_bytes))
+        self.submit_timeout = self.local_config.submit_timeout
+        self.hedger = None
+        if self.local_config.hedge_percentile > 0:
+            self.hedger = _Hedger(self, self.local_config.hedge_percentile,
+                                  self.local_config.hedge_min_samples)
+
+    def start(self):
+        """Starts all the render servers concurrently, and blocks till they are ready (and warmed
+        up). Returns the time it took, in seconds.
+
+        Raises orrb.RendererError naming the servers that failed to start, the ones that did
+        start are left running, call shutdown to stop them.
+        """
+        started = time.time()
+        failed = super().start()
+        if failed:
+            raise RendererError('Render servers failed to start: %s.' % ', '.join(
+                'port %d (%s)' % (worker.port, worker.startup_error) for worker in failed))
+        if self.hedger is not None:
+            self.hedger.start()
+        return time.time() - started
+
+    def shutdown(self):
+        """Stops the renderer: the queued batches are cancelled, the ones being rendered are
+        finished, and the render servers are terminated in parallel.
+        """
+        grace_period = self.local_config.shutdown_grace_period
+        # One grace period for the batches being rendered, and one for the workers of the
+        # killed servers to finish.
+        deadline = time.time() + 2 * grace_period
+        if self.hedger is not None:
+            self.hedger.shutdown()
+        stuck_workers = super().shutdown(grace_period)
+        # Servers that are still rendering, after the grace period, are killed. That fails the
+        # batches they were rendering, and lets the workers finish.
+        for worker in stuck_workers:
+            logging.warning(f'Killing the render server at port {worker.port}.')
+            worker.server.kill()
+        for worker in self.join(max(0.0, deadline - time.time())):
+            logging.warning(f'Worker of the render server at port {worker.port} is stuck.')
+        if self.registry is not None:
+            self.registry.release([worker.port for worker in self.workers
+                                   if worker.server.attached])
 
     def mutable_renderer_config(self):
         return self.renderer_config
 
-    def create_workers(self, input_queue, server_configs, base_config):
-        assert len(server_configs) > 0
-
-        if os.getenv('ORRB_MINIMAL'):
-            minimal_setup_size = int(os.getenv('ORRB_MINIMAL'))
-            server_configs = server_configs[:minimal_setup_size]
+    def component_stats(self, profiling=None, reset=False):
+        """Returns the per component costs, from every render server, as a list of dictionaries.
 
-        workers = []
-        for (device, port) in server_configs:
-            workers.append(_RemoteRendererWorker(input_queue, device, port, base_config))
+        The servers time every RunComponent call while profiling, which is turned on with
+        profiling=True (or the profile_components config), and off with profiling=False. The
+        stats of each component are: name, type, calls, total_seconds and max_seconds. With
+        reset the stats are cleared, after they are returned. See
+        orrb.utils.print_component_stats.
+        """
+        return [worker.component_stats(profiling, reset) for worker in self.workers]
+
+    def create_workers(self, input_queue, server_configs, base_config, buffer_pool):
+        server_configs = _select_server_configs(server_configs)
+        workers_count = len(server_configs)
+        attached = []
+        if self.registry is not None:
+            attached = self.registry.lease(server_config_hash(base_config), workers_count)
+            logging.info('Attached to %d registered render servers.' % len(attached))
+            # The ports of the registered servers, on this host, are taken.
+            host = _get_server_bind_host()
+            registered_ports = {entry['port'] for entry in self.registry.servers()
+                                if entry['host'] == host}
+            server_configs = [(device, port) for (device, port) in server_configs
+                              if port not in registered_ports]
+            if len(attached) + len(server_configs) < workers_count:
+                logging.warning('Only %d of the %d render server ports are free.' % (
+                    len(attached) + len(server_configs), workers_count))
+        workers = [_RemoteRendererWorker(input_queue, entry['device'], entry['port'], base_config,
+                                         buffer_pool, entry['host'], attached=True)
+                   for entry in attached]
+        for (device, port) in server_configs[:workers_count - len(attached)]:
+            workers.append(_RemoteRendererWorker(input_queue, device, port, base_config,
+                                                 buffer_pool))
         return workers
 
     def execute(self, workload, destination):
         assert False, "Executor low level API is hidden by the renderer."
 
+    def estimate_cost(self, workload_with_config):
+        workload = workload_with_config.workload
+        return _estimate_response_bytes(_effective_config(self.local_config, workload),
+                                        len(workload['qpos']))
+
+    def stats(self):
+        """Per render server dispatch counts, EWMA latencies, time to ready, restarts, retries
+        and the client side timings, as a list of dictionaries.
+
+        The timings hold the total seconds spent in each stage (queue_wait, update,
+        build_request, serialize, rpc, parse, convert), the request and response bytes, and
+        the number of batches they add up over.
+        """
+        stats = super().stats()
+        for worker, worker_stats in zip(self.workers, stats):
+            worker_stats.update({'device': worker.device, 'port': worker.port,
+                                 'time_to_ready': worker.time_to_ready,
+                                 'restarts': worker.server.restarts, 'retries': worker.retries,
+                                 'timings': worker.timings.as_dict()})
+        return stats
+
+    def config_snapshot(self):
+        """Returns the current (stamp, renderer config) pair, it can be passed to submit."""
+        with self.config_lock:
+            return self.renderer_config_stamp, self.renderer_config
+
+    def _workload_with_config(self, workload, config_snapshot=None):
+        stamp, renderer_config = config_snapshot or self.config_snapshot()
+        return _WorkloadWithConfig(stamp, renderer_config, workload, self.config_versions)
+
+    def _submit_shards(self, workload, shards_count, config_snapshot=None):
+        shards = _split_workload(workload, shards_count)
+        config_snapshot = config_snapshot or self.config_snapshot()
+        shard_futures = [self._submit_task(self._workload_with_config(shard, config_snapshot))
+                         for shard in shards]
+
+        future = Future()
+        future.set_running_or_notify_cancel()
+        merge_lock = Lock()
+
+        def on_shard_done(_):
+            if not all(shard_future.done() for shard_future in shard_futures):
+                return
+            # All the shards are done, only one of the callbacks gets to resolve the future.
+            with merge_lock:
+                if future.done():
+                    return
+                try:
+                    results = [shard_future.result() for shard_future in shard_futures]
+                    future.set_result(_merge_shards(workload, results, self.buffer_pool))
+                except Exception as exception:
+                    future.set_exception(exception)
+
+        for shard_future in shard_futures:
+            shard_future.add_done_callback(on_shard_done)
+        return future
+
+    def _submit_task(self, workload_with_config):
+        if self.hedger is not None:
+            return self.hedger.submit(workload_with_config)
+        return super().submit(workload_with_config)
+
+    def hedge_stats(self):
+        """The number of hedged batches, and how many of the hedges finished first."""
+        return self.hedger.stats() if self.hedger is not None else {'hedged': 0, 'hedges_won': 0}
+
     def render_batch_async(self, workload, destination):
-        workload_with_config = _WorkloadWithConfig(self.renderer_config_stamp,
-                                                   self.renderer_config,
-                                                   workload)
-        super().execute(workload_with_config, destination)
+        shards_count = _shards_count(self.local_config, len(workload['qpos']), len(self.workers))
+        if shards_count > 1 or self.hedger is not None:
+            self.submit(workload).add_done_callback(
+                lambda future: _put_result(future, destination))
+        else:
+            super().execute(self._workload_with_config(workload), destination)
+
+    def submit(self, workload, config_snapshot=None):
+        """Queue the workload for rendering, returns a concurrent.futures.Future.
+
+        The future holds the rendered batch, or the orrb.RendererError if rendering failed.
+        Safe to call from multiple threads.
+
+        :param config_snapshot: Render with this config_snapshot() instead of the current config.
+        """
+        shards_count = _shards_count(self.local_config, len(workload['qpos']), len(self.workers))
+        if shards_count > 1:
+            return self._submit_shards(workload, shards_count, config_snapshot)
+        return self._submit_task(self._workload_with_config(workload, config_snapshot))
 
     def render_batch(self, workload):
-        self.render_batch_async(workload, self.sync_queue)
-        result = self.sync_queue.get()
-        self.sync_queue.task_done()
-        return result
-
-    def update(self, renderer_config):
-        self.renderer_config_stamp += 1
-        self.renderer_config = deepcopy(renderer_config)
+        return self.submit(workload).result()
+
+    def update(self, renderer_config, broadcast=False):
+        """Sets a new renderer config, for all the batches submitted from now on.
+
+        By default the servers are updated lazily, right before they render the next batch.
+        With broadcast the config is sent to all the servers concurrently right away, and a
+        concurrent.futures.Future is returned, that resolves to the config stamp once every server
+        has acknowledged it (or fails with a orrb.RendererError). It does not block, and the
+        batches being rendered at the time might get the new config, the ones submitted
+        afterwards always do.
+        """
+        renderer_config = deepcopy(renderer_config)
+        with self.config_lock:
+            self.renderer_config_stamp += 1
+            self.renderer_config = renderer_config
+            self.config_versions.add(self.renderer_config_stamp, renderer_config)
+            workload_with_config = _WorkloadWithConfig(self.renderer_config_stamp,
+                                                       renderer_config, None,
+                                                       self.config_versions)
+        if not broadcast:
+            return None
+
+        calls = [worker.broadcast_update(workload_with_config) for worker in self.workers]
+        return _gather_calls(workload_with_config.renderer_config_stamp,
+                             [call for call in calls if call is not None])
 
 
 def get_renderer_executable(version):
@@ -0,0 +1,113 @@
+import fcntl
+import hashlib
+import json
+import os
+import time
+
+from contextlib import contextmanager
+
+
+def _default_registry_path():
+    return os.getenv('ORRB_SERVER_REGISTRY', '/tmp/orrb_servers.json')
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def server_config_hash(config):
+    """Hashes the RemoteRendererConfig fields that the render server is started with.
+
+    A renderer can only attach to servers started with the same binary, scene and renderer
+    config, the rest (cameras, resolution, modalities) is sent with every request.
+    """
+    fields = [config.renderer_local_binary, config.model_xml_path, config.model_mapping_path,
+              config.renderer_config_path, os.path.abspath(config.asset_basedir),
+              config.workers_count, config.queues_count, config.streams_count]
+    return hashlib.sha1(json.dumps(fields).encode('utf-8')).hexdigest()
+
+
+class ServerRegistry:
+    """A registry of long lived render servers, in a local json file shared by the processes.
+
+    Every entry describes one running server: host, port, device, model, config_hash and the
+    pid of the process that owns it. A renderer leases idle servers, with a matching config
+    hash, for its lifetime. The leases of dead renderer processes, and the servers of dead
+    owners, are dropped.
+    """
+
+    def __init__(self, path=None):
+        self.path = path if path is not None else _default_registry_path()
+
+    @contextmanager
+    def _locked(self):
+        # All the changes are read-modify-write under an exclusive lock on a side file.
+        with open(self.path + '.lock', 'w') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                entries = self._read()
+                yield entries
+                self._write(entries)
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read(self):
+        if not os.path.exists(self.path):
+            return []
+        with open(self.path, 'r') as f:
+            entries = json.load(f)
+        live_entries = []
+        for entry in entries:
+            if not _pid_alive(entry['pid']):
+                continue
+            if entry['lease'] is not None and not _pid_alive(entry['lease']['pid']):
+                entry['lease'] = None
+            live_entries.append(entry)
+        return live_entries
+
+    def _write(self, entries):
+        temporary_path = self.path + '.tmp'
+        with open(temporary_path, 'w') as f:
+            json.dump(entries, f, indent=2)
+        os.replace(temporary_path, self.path)
+
+    def servers(self):
+        """Returns all the live registered servers."""
+        with self._locked() as entries:
+            return [dict(entry) for entry in entries]
+
+    def register(self, host, port, device, model, config_hash, pid=None):
+        with self._locked() as entries:
+            entries[:] = [entry for entry in entries if entry['port'] != port]
+            entries.append({'host': host, 'port': port, 'device': device, 'model': model,
+                            'config_hash': config_hash,
+                            'pid': pid if pid is not None else os.getpid(), 'lease': None})
+
+    def unregister(self, port):
+        with self._locked() as entries:
+            entries[:] = [entry for entry in entries if entry['port'] != port]
+
+    def lease(self, config_hash, count):
+        """Leases up to count idle servers with the config hash, returns their entries."""
+        leased = []
+        with self._locked() as entries:
+            for entry in entries:
+                if len(leased) == count:
+                    break
+                if entry['config_hash'] == config_hash and entry['lease'] is None:
+                    entry['lease'] = {'pid': os.getpid(), 'time': time.time()}
+                    leased.append(dict(entry))
+        return leased
+
+    def release(self, ports):
+        with self._locked() as entries:
+            for entry in entries:
+                if entry['port'] in ports and entry['lease'] is not None and (
+                        entry['lease']['pid'] == os.getpid()):
+                    entry['lease'] = None
@@ -0,0 +1,89 @@
+import asyncio
+import grpc
+import pytest
+
+import numpy as np
+import orrb
+
+from orrb.test_remote_renderer import (_RecordingRenderService, _SlowRenderService,
+                                       _build_batch, _serving, _test_config)
+
+
+class _FlakyUpdateService(_RecordingRenderService):
+    """Fails the first update."""
+
+    def Update(self, request, context):
+        response = super().Update(request, context)
+        if self.calls.count('update') == 1:
+            context.abort(grpc.StatusCode.INTERNAL, 'Update failed.')
+        return response
+
+
+async def _render_concurrently(port):
+    renderer = orrb.AsyncRemoteRenderer('AsyncRenderer0', [[0, port]],
+                                        _test_config(pipeline_depth=2))
+    try:
+        await renderer.start()
+        assert await renderer.update(renderer.mutable_renderer_config(), broadcast=True) == 1
+        batches = [_build_batch(np.random.rand(i + 1, 7)) for i in range(6)]
+        return await asyncio.gather(*[renderer.render_batch(batch) for batch in batches])
+    finally:
+        await renderer.shutdown()
+
+
+def test_async_remote_renderer():
+    service = _RecordingRenderService()
+    with _serving([service]) as ports:
+        results = asyncio.run(_render_concurrently(ports[0]))
+
+    assert service.calls.count('update') == 1
+    for i, result in enumerate(results):
+        assert result['cam_a'].shape == (i + 1, 6, 8, 3)
+        assert result['tracker'].shape == (i + 1, 2)
+
+
+async def _render_after_failed_update(port):
+    renderer = orrb.AsyncRemoteRenderer('AsyncRenderer0', [[0, port]], _test_config())
+    try:
+        with pytest.raises(RuntimeError, match='not been started'):
+            await renderer.render_batch(_build_batch(np.random.rand(2, 7)))
+        await renderer.start()
+        renderer.update(renderer.mutable_renderer_config())
+        with pytest.raises(orrb.RendererError):
+            await renderer.render_batch(_build_batch(np.random.rand(2, 7)))
+        return await renderer.render_batch(_build_batch(np.random.rand(2, 7)))
+    finally:
+        await renderer.shutdown()
+
+
+def test_failed_update_is_retried():
+    service = _FlakyUpdateService()
+    with _serving([service]) as ports:
+        result = asyncio.run(_render_after_failed_update(ports[0]))
+
+    # The next batch sends the update again.
+    assert service.calls == ['update', 'update', 'render']
+    assert result['cam_a'].shape == (2, 6, 8, 3)
+
+
+async def _update_between_renders(port):
+    renderer = orrb.AsyncRemoteRenderer('AsyncRenderer0', [[0, port]],
+                                        _test_config(pipeline_depth=2))
+    try:
+        await renderer.start()
+        first = asyncio.ensure_future(renderer.render_batch(_build_batch(np.random.rand(3, 7))))
+        await asyncio.sleep(0.05)
+        update = renderer.update(renderer.mutable_renderer_config(), broadcast=True)
+        await renderer.render_batch(_build_batch(np.random.rand(3, 7)))
+        await asyncio.gather(first, update)
+    finally:
+        await renderer.shutdown()
+
+
+def test_update_waits_for_batches_in_flight():
+    service = _SlowRenderService()
+    with _serving([service]) as ports:
+        asyncio.run(_update_between_renders(ports[0]))
+
+    # The first batch is rendered with the old config.
+    assert service.calls == ['render', 'update', 'render']
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from concurrent.futures import Future
+from queue import Full
+
+from orrb.coalescer import RenderCoalescer
+
+
+class _FakeRenderer:
+    """Renders the per state seeds as the images."""
+
+    def __init__(self):
+        self.buffer_pool = None
+        self.stamp = 0
+        self.batches = []
+        self.full = False
+
+    def config_snapshot(self):
+        return self.stamp, None
+
+    def submit(self, workload, config_snapshot=None):
+        if self.full:
+            raise Full('Renderer is full.')
+        self.batches.append((config_snapshot[0], len(workload['qpos'])))
+        workload['cam'] = np.asarray(workload['seeds'])[:, None] * np.ones((1, 3))
+        future = Future()
+        future.set_result(workload)
+        return future
+
+
+def test_coalescer_merges_and_splits():
+    renderer = _FakeRenderer()
+    coalescer = RenderCoalescer(renderer, max_batch_size=8, max_wait=0.1)
+
+    futures = [coalescer.submit({'qpos': np.zeros((2, 7)), 'seed': 100 * i}) for i in range(3)]
+    renderer.stamp = 1
+    futures.append(coalescer.submit({'qpos': np.zeros((3, 7)), 'seeds': np.array([5, 6, 7])}))
+    futures.append(coalescer.submit({'qpos': np.zeros((16, 7)), 'seeds': np.arange(16)}))
+    coalescer.shutdown()
+
+    results = [future.result() for future in futures]
+    for i in range(3):
+        assert list(results[i]['cam'][:, 0]) == [100 * i, 100 * i + 1]
+    assert list(results[3]['cam'][:, 0]) == [5, 6, 7]
+    assert results[4]['cam'].shape == (16, 3)
+    # The big request goes straight through, the rest is grouped by config stamp.
+    assert sorted(renderer.batches) == [(0, 6), (1, 3), (1, 16)]
+
+
+def test_coalescer_fails_requests_it_cannot_send():
+    renderer = _FakeRenderer()
+    coalescer = RenderCoalescer(renderer, max_batch_size=8, max_wait=0.01)
+
+    renderer.full = True
+    failed = coalescer.submit({'qpos': np.zeros((2, 7)), 'seed': 0})
+    with pytest.raises(Full):
+        failed.result(timeout=1.0)
+    # The coalescer carries on.
+    renderer.full = False
+    assert coalescer.render_batch({'qpos': np.zeros((2, 7)), 'seed': 0})['cam'].shape == (2, 3)
+    coalescer.shutdown()
+    with pytest.raises(RuntimeError):
+        coalescer.submit({'qpos': np.zeros((2, 7)), 'seed': 0})
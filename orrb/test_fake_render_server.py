@@ -0,0 +1,109 @@
+import numpy as np
+import orrb
+import pytest
+import queue
+
+from orrb.test_remote_renderer import (_build_batch, _free_port, _package_relative_path,
+                                       _running)
+
+
+def test_fake_render_servers():
+    config = orrb.RemoteRendererConfig()
+    config.camera_names = ['cam_a', 'cam_b']
+    config.image_width = 8
+    config.image_height = 6
+    config.renderer_config_path = 'dactyl.renderer_config.json'
+    config.asset_basedir = _package_relative_path('assets')
+    config.render_depth = True
+    config.render_normals = True
+    config.render_segmentation = True
+    config.fake_servers = True
+    config.fake_frame_latency = 0.001
+    config.server_start_timeout = 20.0
+    # Only the bigger batch is split, across both servers.
+    config.shard_workloads = True
+    config.min_shard_size = 4
+
+    with _running(orrb.RemoteRenderer('OrrbRenderer0', [[0, _free_port()], [0, _free_port()]],
+                                      config)) as renderer:
+        states = np.random.rand(5, 7)
+        results = [renderer.render_batch(_build_batch(states)) for _ in range(2)]
+        packed_result = renderer.render_batch(dict(_build_batch(states), packed_images=True))
+        streamed_result = renderer.render_batch(dict(_build_batch(states), stream_chunk_size=2))
+        destination = queue.Queue()
+        renderer.render_batch_async(_build_batch(np.random.rand(8, 7)), destination)
+        sharded_result = destination.get(timeout=10.0)
+        assert all(worker.server.is_running() for worker in renderer.workers)
+
+    result = results[0]
+    assert result['cam_a'].shape == (5, 6, 8, 3)
+    assert result['cam_a_depth'].shape == (5, 6, 8)
+    assert result['cam_a_normals'].shape == (5, 6, 8, 3)
+    assert result['cam_a_segmentation'].shape == (5, 6, 8)
+    assert result['tracker_object_X_cam_b'].shape == (5, 2)
+    assert result['tracker_object_X_cam_b_bbox'].shape == (5, 4)
+    # The frames depend on the camera and the seed only, whichever server renders them.
+    assert not np.array_equal(result['cam_a'], result['cam_b'])
+    assert not np.array_equal(result['cam_a'][0], result['cam_a'][1])
+    rendered_keys = [key for key in result if key.startswith(('cam_', 'tracker_'))]
+    assert len(rendered_keys) == 12
+    for other_result in results[1:] + [packed_result, streamed_result]:
+        for key in rendered_keys:
+            assert np.array_equal(other_result[key], result[key]), key
+    # The shards are merged from the workloads the workers rendered into.
+    for key in rendered_keys:
+        assert len(sharded_result[key]) == 8
+        assert np.array_equal(sharded_result[key][:5], result[key]), key
+
+
+def test_stage_timings():
+    config = orrb.RemoteRendererConfig()
+    config.camera_names = ['cam_a']
+    config.image_width = 8
+    config.image_height = 6
+    config.renderer_config_path = 'dactyl.renderer_config.json'
+    config.asset_basedir = _package_relative_path('assets')
+    config.fake_servers = True
+    config.fake_frame_latency = 0.01
+    config.warmup_render = False
+    config.report_timings = True
+
+    with _running(orrb.RemoteRenderer('OrrbRenderer0', [[0, _free_port()]],
+                                      config)) as renderer:
+        result = renderer.render_batch(_build_batch(np.random.rand(4, 7)))
+        streamed_result = renderer.render_batch(dict(_build_batch(np.random.rand(4, 7)),
+                                                     stream_chunk_size=2))
+        stats = renderer.stats()
+
+    for timings in [result['timings'], streamed_result['timings']]:
+        # Four frames, of the fake frame latency each, are rendered during the call.
+        assert timings['rpc'] >= 0.04
+        assert timings['response_bytes'] > 4 * 8 * 6 * 3
+        assert timings['request_bytes'] > 0
+        assert all(timings[stage] >= 0 for stage in ['queue_wait', 'update', 'build_request',
+                                                     'serialize', 'parse', 'convert'])
+        # The server side breakdown, of the time spent in the call.
+        assert timings['server_frames'] == 4
+        assert timings['server_capture'] == pytest.approx(0.04)
+        assert timings['server_capture'] <= timings['server_total'] <= timings['rpc']
+    totals = stats[0]['timings']
+    assert totals['batches'] == 2
+    assert totals['response_bytes'] == (result['timings']['response_bytes'] +
+                                        streamed_result['timings']['response_bytes'])
+
+
+def test_failed_start_kills_the_server():
+    config = orrb.RemoteRendererConfig()
+    config.camera_names = ['cam_a']
+    config.renderer_config_path = 'dactyl.renderer_config.json'
+    config.asset_basedir = _package_relative_path('assets')
+    config.fake_servers = True
+    # Too short for the server to come up.
+    config.server_start_timeout = 0.01
+
+    renderer = orrb.RemoteRenderer('OrrbRenderer0', [[0, _free_port()]], config)
+    with pytest.raises(orrb.RendererError):
+        renderer.start()
+    # Before any shutdown, the server that did not become ready is gone.
+    assert renderer.workers[0].server.server_process.poll() is not None
+    renderer.shutdown()
@@ -0,0 +1,231 @@
+import pytest
+import random
+import time
+
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from queue import Full, Queue
+from threading import Timer
+
+from orrb.queue_executor import (AdmissionControl, LeastLoadedScheduler, QueueExecutorABC,
+                                 QueueWorkerABC)
+
+
+class _SleepyWorker(QueueWorkerABC):
+    """Doubles the workload, after a random delay, with a number of workloads in flight."""
+
+    def __init__(self, input_queue, pipeline_depth):
+        super().__init__(input_queue, pipeline_depth)
+        self.pool = ThreadPoolExecutor(max_workers=pipeline_depth)
+        self.max_in_flight = 0
+        self.in_flight = 0
+
+    def _double(self, workload):
+        time.sleep(random.random() * 0.01)
+        return workload * 2
+
+    def begin_process(self, workload):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        return self.pool.submit(self._double, workload)
+
+    def end_process(self, handle):
+        self.in_flight -= 1
+        return handle.result()
+
+
+class _SleepyExecutor(QueueExecutorABC):
+
+    def create_workers(self, input_queue, workers_count, pipeline_depth):
+        return [_SleepyWorker(input_queue, pipeline_depth) for _ in range(workers_count)]
+
+
+def test_pipelined_worker_keeps_order():
+    executor = _SleepyExecutor('sleepy', 1, 4)
+    destination = Queue()
+    for i in range(32):
+        executor.execute(i, destination)
+    executor.start()
+
+    results = [destination.get() for _ in range(32)]
+
+    assert results == [i * 2 for i in range(32)]
+    assert executor.workers[0].max_in_flight == 4
+    executor.shutdown()
+
+
+class _FailingWorker(QueueWorkerABC):
+    """Doubles the workload, fails on negative workloads."""
+
+    def process(self, workload):
+        if workload < 0:
+            raise ValueError(workload)
+        return workload * 2
+
+
+class _FailingExecutor(QueueExecutorABC):
+
+    def create_workers(self, input_queue):
+        return [_FailingWorker(input_queue)]
+
+
+def test_submit_propagates_exceptions():
+    executor = _FailingExecutor('failing')
+    futures = [executor.submit(i) for i in [1, -1, 2]]
+    cancelled = executor.submit(3)
+    assert cancelled.cancel()
+    executor.start()
+
+    assert futures[0].result() == 2
+    with pytest.raises(ValueError):
+        futures[1].result()
+    # The worker survives the failure.
+    assert futures[2].result() == 4
+    assert executor.submit(5).result() == 10
+    assert cancelled.cancelled()
+    executor.shutdown()
+
+
+class _RetryingWorker(_FailingWorker):
+
+    def should_retry(self, task, error):
+        return task.attempts <= 2
+
+
+class _RetryingExecutor(QueueExecutorABC):
+
+    def create_workers(self, input_queue):
+        return [_RetryingWorker(input_queue)]
+
+
+def test_execute_delivers_exceptions():
+    executor = _RetryingExecutor('retrying')
+    destination = Queue()
+    for i in [1, -1, 2]:
+        executor.execute(i, destination)
+    executor.start()
+
+    # The failed task is retried after the others, till the retries run out.
+    results = [destination.get(timeout=5.0) for _ in range(3)]
+    assert results[:2] == [2, 4]
+    assert isinstance(results[2], ValueError)
+    assert executor.workers[0].retries == 2
+    # The worker survives.
+    executor.execute(3, destination)
+    assert destination.get(timeout=5.0) == 6
+    executor.shutdown()
+
+
+class _FixedDelayWorker(QueueWorkerABC):
+
+    def __init__(self, input_queue, delay):
+        super().__init__(input_queue)
+        self.delay = delay
+
+    def process(self, workload):
+        time.sleep(self.delay)
+        return workload
+
+
+class _MixedExecutor(QueueExecutorABC):
+
+    def create_workers(self, input_queue, delays):
+        return [_FixedDelayWorker(input_queue, delay) for delay in delays]
+
+
+def test_least_loaded_scheduler_prefers_fast_workers():
+    executor = _MixedExecutor('mixed', [0.02, 0.002], scheduler=LeastLoadedScheduler())
+    executor.start()
+
+    window = [executor.submit(i) for i in range(4)]
+    for i in range(4, 100):
+        assert window.pop(0).result() == i - 4
+        window.append(executor.submit(i))
+    for future in window:
+        future.result()
+
+    slow, fast = executor.stats()
+    assert slow['completed'] + fast['completed'] == 100
+    assert fast['completed'] > 2 * slow['completed']
+    assert fast['ewma_latency'] < slow['ewma_latency']
+    executor.shutdown()
+
+
+class _BrokenWorker(_FixedDelayWorker):
+
+    def on_run(self):
+        raise RuntimeError('Broken.')
+
+
+class _HalfBrokenExecutor(QueueExecutorABC):
+
+    def create_workers(self, input_queue):
+        return [_BrokenWorker(input_queue, 0.001), _FixedDelayWorker(input_queue, 0.001)]
+
+
+def test_least_loaded_scheduler_skips_failed_workers():
+    executor = _HalfBrokenExecutor('half broken', scheduler=LeastLoadedScheduler())
+    # Half of these are queued for the broken worker, they go to the other one.
+    futures = [executor.submit(i) for i in range(10)]
+    assert executor.start() == [executor.workers[0]]
+    futures += [executor.submit(i) for i in range(10, 20)]
+
+    assert [future.result(timeout=5.0) for future in futures] == list(range(20))
+    broken, working = executor.stats()
+    assert broken['outstanding'] == 0
+    assert working['completed'] == 20
+    executor.shutdown()
+
+
+def test_admission_control_blocks_and_times_out():
+    admission = AdmissionControl(max_tasks=2, max_bytes=100)
+    admission.acquire(60)
+    with pytest.raises(Full):
+        admission.acquire(60, timeout=0.01)
+    admission.acquire(40)
+    with pytest.raises(Full):
+        admission.acquire(0, timeout=0.01)
+    assert admission.depth() == {'tasks': 2, 'bytes': 100}
+
+    releaser = Timer(0.05, admission.release, args=(60,))
+    releaser.start()
+    admission.acquire(50, timeout=1.0)
+    assert admission.depth() == {'tasks': 2, 'bytes': 90}
+    releaser.join()
+
+
+def test_shutdown_cancels_queued_tasks():
+    executor = _MixedExecutor('mixed', [0.2])
+    executor.start()
+    futures = [executor.submit(i) for i in range(5)]
+    destination = Queue()
+    executor.execute(5, destination)
+    while not futures[0].running():
+        time.sleep(0.001)
+
+    start = time.time()
+    assert executor.shutdown() == []
+    assert time.time() - start < 0.5
+
+    # The task in flight is finished, the queued ones are cancelled.
+    assert futures[0].result() == 0
+    assert all(future.cancelled() for future in futures[1:])
+    assert isinstance(destination.get(timeout=1.0), CancelledError)
+    with pytest.raises(RuntimeError):
+        executor.submit(5)
+
+
+def test_shutdown_fails_blocked_submitters():
+    executor = _MixedExecutor('mixed', [0.2], admission=AdmissionControl(max_tasks=1))
+    executor.start()
+    first = executor.submit(0)
+    pool = ThreadPoolExecutor(max_workers=1)
+    # Blocks on the admission, till the shutdown.
+    blocked = pool.submit(executor.submit, 1)
+    time.sleep(0.05)
+    assert not blocked.done()
+
+    executor.shutdown()
+    with pytest.raises(RuntimeError):
+        blocked.result(timeout=1.0)
+    assert first.result() == 0
+    pool.shutdown()
@@ -1,10 +1,33 @@
+import grpc
 import pytest
 import numpy as np
 import orrb
 import os
 import imageio
 import platform
+import queue
+import socket
+import subprocess
+import sys
+import time
 
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+import orrb.protos.RenderService_pb2 as render_service_pb2
+import orrb.protos.RenderService_pb2_grpc as render_service_pb2_grpc
+from orrb.fake_render_server import FakeRenderService
+from orrb.remote_renderer import (
+    _BatchDecoder,
+    _ConfigVersions,
+    _get_server_bind_host,
+    _load_renderer_config,
+    _build_render_batch_request,
+    _convert_render_batch_response,
+    _effective_config,
+    _merge_shards,
+    _split_workload,
+)
 from orrb.utils import render_depth, render_normals, render_segmentation
 
 
@@ -64,10 +87,8 @@ def test_remote_renderer():
 
     batch = _build_batch(states)
 
-    # Burn first batch, first frame has some AO artifacts.
+    # No need to burn a batch, the first frame AO artifacts are burnt by the warmup render.
     # TODO(maciekcc): investigate and fix on renderer side.
-    _ = renderer.render_batch(batch)
-
     result = renderer.render_batch(batch)
 
     golden_dir = _package_relative_path('assets/test_images')
@@ -119,3 +140,501 @@ def test_remote_renderer():
                         print(f'Image different than golden: {name}, error: {error}')
 
     renderer.shutdown()
+
+
+def _build_fake_response(camera_names, batch_size, width, height, packed=False):
+    response = render_service_pb2.RenderBatchResponse()
+    for c, camera_name in enumerate(camera_names):
+        stream = response.streams.add()
+        stream.name = camera_name
+        images = [np.full((height, width, 3), c * 16 + i, dtype=np.uint8)
+                  for i in range(batch_size)]
+        depths = [np.full((height, width), i, dtype=np.float32) for i in range(batch_size)]
+        if packed:
+            stream.packed_image_data.data = np.array(images).tobytes()
+            stream.packed_image_data.shape[:] = (batch_size, height, width, 3)
+            stream.packed_depth_data.data = np.array(depths).tobytes()
+            stream.packed_depth_data.shape[:] = (batch_size, height, width)
+            continue
+        for image, depth in zip(images, depths):
+            entry = stream.entries.add()
+            entry.image_data = image.tobytes()
+            entry.depth_data = depth.tobytes()
+    tracker = response.auxiliary_float_streams.add()
+    tracker.name = 'tracker'
+    tracker.data[:] = np.arange(batch_size * 2)
+    return response
+
+
+@pytest.mark.parametrize('packed', [False, True])
+def test_convert_render_batch_response(packed):
+    config = orrb.RemoteRendererConfig()
+    config.image_width = 8
+    config.image_height = 6
+    camera_names = ['cam_a', 'cam_b']
+    response = _build_fake_response(camera_names, 4, config.image_width, config.image_height,
+                                     packed)
+
+    pool = orrb.BufferPool()
+    result = _convert_render_batch_response(response, config, 4, pool)
+
+    assert sorted(result.keys()) == ['cam_a', 'cam_a_depth', 'cam_b', 'cam_b_depth', 'tracker']
+    for c, camera_name in enumerate(camera_names):
+        images = result[camera_name]
+        assert images.shape == (4, 6, 8, 3)
+        assert images.dtype == np.uint8
+        assert images.flags['C_CONTIGUOUS']
+        assert [image[0, 0, 0] for image in images] == [c * 16 + i for i in range(4)]
+        assert result[f'{camera_name}_depth'].shape == (4, 6, 8)
+        assert result[f'{camera_name}_depth'].dtype == np.float32
+    assert result['tracker'].shape == (4, 2)
+
+    # Released buffers are recycled by the following decodes.
+    rgb_buffer = result['cam_a'].base
+    pool.release_batch(result)
+    recycled = _convert_render_batch_response(response, config, 4, pool)
+    assert recycled['cam_b'].base is rgb_buffer
+
+
+def test_build_packed_render_batch_request():
+    config = orrb.RemoteRendererConfig()
+    config.camera_names = ['cam_a']
+    config.packed_qpos = True
+    states = np.random.rand(5, 7)
+
+    request, batch_size = _build_render_batch_request(_build_batch(states), config)
+
+    assert batch_size == 5
+    assert len(request.entries) == 0
+    assert request.use_entry_seeds
+    assert list(request.packed_qpos_shape) == [5, 7]
+    qpos = np.frombuffer(request.packed_qpos, dtype=np.float32).reshape(request.packed_qpos_shape)
+    assert np.allclose(qpos, states)
+    assert list(np.frombuffer(request.packed_seeds, dtype=np.int32)) == list(range(5))
+
+
+@pytest.mark.parametrize('packed', [False, True])
+def test_decode_streamed_chunks(packed):
+    config = orrb.RemoteRendererConfig()
+    config.image_width = 8
+    config.image_height = 6
+    decoder = _BatchDecoder(config, 5)
+    for offset, count in [(0, 2), (2, 2), (4, 1)]:
+        chunk = _build_fake_response(['cam_a'], count, config.image_width, config.image_height,
+                                     packed)
+        chunk.entries_offset = offset
+        chunk.entries_count = count
+        decoder.decode(chunk, chunk.entries_offset)
+    result = decoder.result()
+
+    assert result['cam_a'].shape == (5, 6, 8, 3)
+    assert list(result['cam_a'][:, 0, 0, 0]) == [0, 1, 0, 1, 0]
+    assert result['tracker'].shape == (5, 2)
+    assert list(result['tracker'][:, 0]) == [0, 2, 0, 2, 0]
+
+
+def _server_seeds(request, batch_size):
+    # Mirrors RenderBatchWorkload: batch seed plus entry index, with int32 wraparound.
+    if request.use_entry_seeds:
+        return [entry.seed for entry in request.entries]
+    return list((np.int32(request.batch_seed) + np.arange(batch_size, dtype=np.int32)))
+
+
+@pytest.mark.parametrize('seed', [7, (1 << 31) - 3])
+def test_sharded_workload_keeps_seeds(seed):
+    config = orrb.RemoteRendererConfig()
+    states = np.random.rand(10, 7)
+    workload = {'qpos': states, 'seed': seed}
+
+    request, _ = _build_render_batch_request(workload, config)
+    expected_seeds = _server_seeds(request, 10)
+
+    shards = _split_workload(workload, 3)
+    assert [len(shard['qpos']) for shard in shards] == [3, 3, 4]
+    shard_seeds = []
+    for shard in shards:
+        shard_request, shard_size = _build_render_batch_request(shard, config)
+        shard_seeds += _server_seeds(shard_request, shard_size)
+    assert shard_seeds == expected_seeds
+
+    for shard in shards:
+        shard['cam_a'] = shard['qpos'][:, :1] * 2
+    merged = _merge_shards(workload, shards)
+    assert np.allclose(merged['cam_a'], states[:, :1] * 2)
+    assert merged['qpos'] is states
+
+
+def _test_config(**fields):
+    """A config for renderers of the in process test services, with the fields overridden."""
+    config = orrb.RemoteRendererConfig()
+    config.camera_names = ['cam_a']
+    config.image_width = 8
+    config.image_height = 6
+    config.renderer_config_path = 'dactyl.renderer_config.json'
+    config.asset_basedir = _package_relative_path('assets')
+    config.renderer_local_binary = 'unused'
+    config.spawn_servers = False
+    config.warmup_render = False
+    for name, value in fields.items():
+        setattr(config, name, value)
+    return config
+
+
+def _free_port():
+    with socket.socket() as probe:
+        probe.bind((_get_server_bind_host(), 0))
+        return probe.getsockname()[1]
+
+
+@contextmanager
+def _serving(services):
+    """Serves the render services on free ports, yields the ports. The servers are stopped
+    even if the test fails."""
+    servers = []
+    try:
+        ports = []
+        for service in services:
+            server = grpc.server(ThreadPoolExecutor(max_workers=2))
+            render_service_pb2_grpc.add_RenderServiceServicer_to_server(service, server)
+            ports.append(server.add_insecure_port('%s:0' % _get_server_bind_host()))
+            servers.append(server)
+            server.start()
+        yield ports
+    finally:
+        for server in servers:
+            server.stop(None)
+
+
+@contextmanager
+def _running(renderer, start=True):
+    """Yields the (started) renderer, it is shut down even if the test fails."""
+    try:
+        if start:
+            renderer.start()
+        yield renderer
+    finally:
+        renderer.shutdown()
+
+
+class _RecordingRenderService(render_service_pb2_grpc.RenderServiceServicer):
+    """Records the order of the calls, renders fake images."""
+
+    def __init__(self):
+        self.calls = []
+
+    def RenderBatch(self, request, context):
+        self.calls.append('render')
+        return _build_fake_response(request.camera_names, len(request.entries), 8, 6)
+
+    def Update(self, request, context):
+        self.calls.append('update')
+        return render_service_pb2.UpdateResponse()
+
+
+def test_broadcast_update():
+    services = [_RecordingRenderService() for _ in range(2)]
+    with _serving(services) as ports, _running(orrb.RemoteRenderer(
+            'OrrbRenderer0', [[0, port] for port in ports], _test_config())) as renderer:
+        assert renderer.update(renderer.mutable_renderer_config(), broadcast=True).result() == 1
+        for _ in range(4):
+            renderer.render_batch(_build_batch(np.random.rand(3, 7)))
+        renderer.update(renderer.mutable_renderer_config())
+        renderer.render_batch(_build_batch(np.random.rand(3, 7)))
+
+    calls = sum([service.calls for service in services], [])
+    # Every server got the broadcast before any batch, the lazy update goes before the batch.
+    assert all(service.calls[0] == 'update' for service in services)
+    assert calls.count('update') == 3
+    assert calls.count('render') == 5
+
+
+class _SlowUpdateService(_RecordingRenderService):
+    """Records the update calls once they are done."""
+
+    def Update(self, request, context):
+        time.sleep(0.1)
+        return super().Update(request, context)
+
+
+def test_broadcast_update_does_not_block():
+    service = _SlowUpdateService()
+    with _serving([service]) as ports, _running(orrb.RemoteRenderer(
+            'OrrbRenderer0', [[0, ports[0]]], _test_config())) as renderer:
+        start = time.time()
+        updates = [renderer.update(renderer.mutable_renderer_config(), broadcast=True)
+                   for _ in range(2)]
+        assert time.time() - start < 0.1
+        assert [update.result() for update in updates] == [1, 2]
+        renderer.render_batch(_build_batch(np.random.rand(3, 7)))
+
+    # The updates are sent one after another, the batch waits for them.
+    assert service.calls == ['update', 'update', 'render']
+
+
+class _SlowRenderService(_RecordingRenderService):
+    """Records the render calls once they are done."""
+
+    def RenderBatch(self, request, context):
+        time.sleep(0.1)
+        return super().RenderBatch(request, context)
+
+
+def test_update_waits_for_batches_in_flight():
+    service = _SlowRenderService()
+    with _serving([service]) as ports, _running(orrb.RemoteRenderer(
+            'OrrbRenderer0', [[0, ports[0]]], _test_config(pipeline_depth=2))) as renderer:
+        first = renderer.submit(_build_batch(np.random.rand(3, 7)))
+        renderer.update(renderer.mutable_renderer_config())
+        second = renderer.submit(_build_batch(np.random.rand(3, 7)))
+        third = renderer.submit(_build_batch(np.random.rand(3, 7)))
+        for future in [first, second, third]:
+            future.result()
+
+    # The first batch is rendered with the old config, the others are pipelined.
+    assert service.calls == ['render', 'update', 'render', 'render']
+
+
+def test_start_reports_failed_servers():
+    config = _test_config(warmup_render=True, server_start_timeout=1.0)
+    # Nothing listens on the second port.
+    service = _RecordingRenderService()
+    dead_port = _free_port()
+    with _serving([service]) as ports, _running(orrb.RemoteRenderer(
+            'OrrbRenderer0', [[0, ports[0]], [0, dead_port]], config), start=False) as renderer:
+        with pytest.raises(orrb.RendererError, match='port %d' % dead_port):
+            renderer.start()
+        stats = renderer.stats()
+
+    # The server that did start was probed, and warmed up with a single frame.
+    assert service.calls == ['render']
+    assert stats[0]['time_to_ready'] < 1.0
+    assert stats[1]['time_to_ready'] is None
+
+
+class _FlakyRenderService(_RecordingRenderService):
+    """Drops the selected render calls, as if the server went away mid call."""
+
+    def __init__(self, failing_calls):
+        super().__init__()
+        self.failing_calls = failing_calls
+        self.seeds = []
+
+    def RenderBatch(self, request, context):
+        self.seeds.append([entry.seed for entry in request.entries])
+        if len(self.seeds) - 1 in self.failing_calls:
+            context.abort(grpc.StatusCode.UNAVAILABLE, 'Server went away.')
+        return super().RenderBatch(request, context)
+
+    def Health(self, request, context):
+        return render_service_pb2.HealthResponse(serving=True)
+
+
+def test_failed_batches_are_retried():
+    # The third batch fails on every attempt.
+    service = _FlakyRenderService(failing_calls=[0, 2, 4, 5, 6])
+    with _serving([service]) as ports, _running(orrb.RemoteRenderer(
+            'OrrbRenderer0', [[0, ports[0]]], _test_config())) as renderer:
+        # Pretend the server process crashed, it gets restarted before the retry.
+        crashed_process = subprocess.Popen([sys.executable, '-c', 'pass'])
+        crashed_process.wait()
+        renderer.workers[0].server.server_process = crashed_process
+        first = renderer.render_batch(_build_batch(np.random.rand(3, 7)))
+        second = renderer.render_batch(_build_batch(np.random.rand(2, 7)))
+        destination = queue.Queue()
+        renderer.render_batch_async(_build_batch(np.random.rand(1, 7)), destination)
+        error = destination.get(timeout=10.0)
+        stats = renderer.stats()
+
+    assert first['cam_a'].shape == (3, 6, 8, 3)
+    assert second['cam_a'].shape == (2, 6, 8, 3)
+    # Once the retries run out, the error takes the place of the result.
+    assert isinstance(error, orrb.RendererError)
+    assert service.seeds == [[0, 1, 2], [0, 1, 2], [0, 1], [0, 1], [0], [0], [0]]
+    assert (stats[0]['restarts'], stats[0]['retries']) == (1, 4)
+    # The restarted server got the full config again.
+    assert service.calls.count('update') == 1
+
+
+def test_sharded_batch_errors_reach_the_queue():
+    config = _test_config(shard_workloads=True, min_shard_size=2, max_retries=0)
+    services = [_FlakyRenderService(failing_calls=[0]) for _ in range(2)]
+    with _serving(services) as ports, _running(orrb.RemoteRenderer(
+            'OrrbRenderer0', [[0, port] for port in ports], config)) as renderer:
+        destination = queue.Queue()
+        renderer.render_batch_async(_build_batch(np.random.rand(4, 7)), destination)
+        error = destination.get(timeout=10.0)
+
+    assert isinstance(error, orrb.RendererError)
+
+
+class _UnprofilableRenderService(_FlakyRenderService):
+    """Turns the profiling on once, fails to after a restart."""
+
+    def ComponentStats(self, request, context):
+        self.calls.append('component_stats')
+        if self.calls.count('component_stats') > 1:
+            context.abort(grpc.StatusCode.INTERNAL, 'Profiling failed.')
+        return render_service_pb2.ComponentStatsResponse(profiling=True)
+
+
+def test_failed_restart_fails_the_batch():
+    service = _UnprofilableRenderService(failing_calls=[0])
+    with _serving([service]) as ports, _running(orrb.RemoteRenderer(
+            'OrrbRenderer0', [[0, ports[0]]], _test_config(profile_components=True))) as renderer:
+        crashed_process = subprocess.Popen([sys.executable, '-c', 'pass'])
+        crashed_process.wait()
+        renderer.workers[0].server.server_process = crashed_process
+        with pytest.raises(orrb.RendererError, match='Profiling failed'):
+            renderer.submit(_build_batch(np.random.rand(3, 7))).result(timeout=10.0)
+        # The worker survives, and renders the next batch.
+        result = renderer.submit(_build_batch(np.random.rand(2, 7))).result(timeout=10.0)
+        assert renderer.worker_threads[0].is_alive()
+
+    assert result['cam_a'].shape == (2, 6, 8, 3)
+    assert renderer.stats()[0]['restarts'] == 1
+
+
+class _StragglerRenderService(_FlakyRenderService):
+    """Stalls on the selected render calls."""
+
+    def __init__(self, slow_calls):
+        super().__init__(failing_calls=[])
+        self.slow_calls = slow_calls
+        self.calls_count = 0
+
+    def RenderBatch(self, request, context):
+        self.calls_count += 1
+        if self.calls_count - 1 in self.slow_calls:
+            time.sleep(2.0)
+        return super().RenderBatch(request, context)
+
+
+def test_hedged_requests():
+    config = _test_config(hedge_percentile=90, hedge_min_samples=4)
+    # Both servers share the service, the fifth batch stalls on whichever server gets it.
+    service = _StragglerRenderService(slow_calls=[4])
+    with _serving([service, service]) as ports, _running(orrb.RemoteRenderer(
+            'OrrbRenderer0', [[0, port] for port in ports], config)) as renderer:
+        for _ in range(4):
+            renderer.render_batch(_build_batch(np.random.rand(3, 7)))
+        start = time.time()
+        result = renderer.render_batch(_build_batch(np.random.rand(2, 7)))
+        elapsed = time.time() - start
+        hedge_stats = renderer.hedge_stats()
+
+    assert elapsed < 1.0
+    assert result['cam_a'].shape == (2, 6, 8, 3)
+    assert hedge_stats == {'hedged': 1, 'hedges_won': 1}
+    # The hedge is the same request, with the same seeds.
+    assert service.seeds[4] == service.seeds[5] == [0, 1]
+
+
+def test_config_versions_send_only_changes():
+    renderer_config = _load_renderer_config(_package_relative_path('assets'),
+                                            'dactyl.renderer_config.json')
+    versions = _ConfigVersions(renderer_config)
+    full_update = render_service_pb2.UpdateRequest.FromString(
+        versions.serialized_update(-1, 0, renderer_config))
+    assert len(full_update.components) == len(renderer_config.components)
+
+    # Modified in place, like the mutable_renderer_config() is.
+    renderer_config.components[0].config.float_properties['fov_radius'] += 1.0
+    renderer_config.components[1].config.bool_properties['enable_bloom'] ^= True
+    versions.add(1, renderer_config)
+
+    serialized_update = versions.serialized_update(0, 1, renderer_config)
+    assert versions.serialized_update(0, 1, renderer_config) is serialized_update
+    update = render_service_pb2.UpdateRequest.FromString(serialized_update)
+    assert [component.name for component in update.components] == [
+        'camera_randomizer_0', 'post_processing_randomizer_0']
+    assert list(update.components[0].config.float_properties) == ['fov_radius']
+    assert list(update.components[1].config.bool_properties) == ['enable_bloom']
+    assert len(update.components[1].config.float_properties) == 0
+    assert len(serialized_update) < len(full_update.SerializeToString()) // 10
+
+
+def test_config_overrides_in_request():
+    config = orrb.RemoteRendererConfig()
+    renderer_config = _load_renderer_config(_package_relative_path('assets'),
+                                            'dactyl.renderer_config.json')
+    camera_randomizer = renderer_config.components[0]
+    camera_randomizer.config.float_properties['fov_radius'] = 0.0
+    workload = _build_batch(np.random.rand(4, 7))
+    workload['config_overrides'] = [camera_randomizer]
+
+    request, _ = _build_render_batch_request(workload, config)
+    assert list(request.config_overrides) == [camera_randomizer]
+
+    for shard in _split_workload(workload, 2):
+        shard_request, _ = _build_render_batch_request(shard, config)
+        assert list(shard_request.config_overrides) == [camera_randomizer]
+
+
+def test_per_workload_render_options():
+    config = orrb.RemoteRendererConfig()
+    config.camera_names = ['cam_a', 'cam_b']
+    config.image_width = 8
+    config.image_height = 6
+    workload = _build_batch(np.random.rand(4, 7))
+    workload.update({'camera_names': ['cam_b'], 'image_width': 16, 'render_depth': True})
+
+    effective_config = _effective_config(config, workload)
+    assert config.camera_names == ['cam_a', 'cam_b'] and config.image_width == 8
+    assert _effective_config(config, _build_batch(np.random.rand(4, 7))) is config
+    request, batch_size = _build_render_batch_request(workload, effective_config)
+    assert list(request.camera_names) == ['cam_b']
+    assert (request.width, request.height, request.render_depth) == (16, 6, True)
+
+    response = _build_fake_response(request.camera_names, batch_size, 16, 6)
+    workload.update(_convert_render_batch_response(response, effective_config, batch_size))
+    assert workload['cam_b'].shape == (4, 6, 16, 3)
+    assert 'cam_a' not in workload
+    for shard in _split_workload(workload, 2):
+        assert shard['camera_names'] == ['cam_b'] and shard['image_width'] == 16
+
+
+class _ProfilingRenderService(FakeRenderService):
+    """Reports made up per component costs, while profiling."""
+
+    def __init__(self, costs):
+        super().__init__()
+        self.costs = costs
+        self.frames = 0
+
+    def _render(self, frames_count, arrival=None):
+        if self.profiling:
+            self.frames += frames_count
+        return super()._render(frames_count, arrival)
+
+    def ComponentStats(self, request, context):
+        response = super().ComponentStats(request, context)
+        for name, cost in self.costs.items():
+            response.components.add(name=name, type=name.title() + 'Randomizer',
+                                    calls=self.frames, total_seconds=cost * self.frames,
+                                    max_seconds=cost * 2)
+        if request.reset:
+            self.frames = 0
+        return response
+
+
+def test_component_stats():
+    services = [_ProfilingRenderService({'light': 0.001, 'material': 0.004}),
+                _ProfilingRenderService({'light': 0.001, 'material': 0.002})]
+    with _serving(services) as ports, _running(orrb.RemoteRenderer(
+            'OrrbRenderer0', [[0, port] for port in ports],
+            _test_config(profile_components=True))) as renderer:
+        futures = [renderer.submit(_build_batch(np.random.rand(5, 7))) for _ in range(4)]
+        for future in futures:
+            future.result()
+        stats = renderer.component_stats(profiling=False, reset=True)
+        assert renderer.component_stats()[0]['components'][0]['calls'] == 0
+
+    assert [server_stats['port'] for server_stats in stats] == ports
+    assert not any(server_stats['profiling'] for server_stats in stats)
+    assert sum(server_stats['components'][0]['calls'] for server_stats in stats) == 20
+
+    # The components are ranked by their total cost, over all the servers.
+    table = orrb.utils.format_component_stats(stats).splitlines()
+    assert len(table) == 3
+    assert table[1].split()[:4] == ['1', 'material', 'MaterialRandomizer', '20']
+    assert table[2].split()[:4] == ['2', 'light', 'LightRandomizer', '20']
@@ -0,0 +1,62 @@
+import numpy as np
+import orrb
+import os
+import subprocess
+import sys
+
+from orrb.remote_renderer import _build_local_config, _get_server_bind_host
+from orrb.server_registry import server_config_hash
+from orrb.test_remote_renderer import (_RecordingRenderService, _build_batch, _running,
+                                       _serving, _test_config)
+
+
+def _dead_pid():
+    process = subprocess.Popen([sys.executable, '-c', 'pass'])
+    process.wait()
+    return process.pid
+
+
+def test_attach_to_registered_servers(tmp_path):
+    # The warmup is on, attached servers skip it.
+    config = _test_config(warmup_render=True, attach_servers=True,
+                          server_registry_path=str(tmp_path / 'servers.json'))
+
+    registry = orrb.ServerRegistry(config.server_registry_path)
+    config_hash = server_config_hash(_build_local_config(config))
+    host = _get_server_bind_host()
+    service = _RecordingRenderService()
+    with _serving([service]) as ports:
+        port = ports[0]
+        registry.register(host, port, 0, 'dactyl.xml', config_hash)
+        # Only registry entries, nothing listens on these.
+        registry.register(host, 7395, 0, 'dactyl.xml', 'other config')
+        registry.register(host, 7396, 0, 'dactyl.xml', config_hash, pid=_dead_pid())
+        assert [entry['port'] for entry in registry.servers()] == [port, 7395]
+
+        with _running(orrb.RemoteRenderer('OrrbRenderer0', [[0, 7000]], config),
+                      start=False) as renderer:
+            assert [(worker.port, worker.server.attached) for worker in renderer.workers] == [
+                (port, True)]
+            # The only matching server is leased, other renderers fall back to their server
+            # configs.
+            other_renderer = orrb.RemoteRenderer('OrrbRenderer1', [[0, 7000]], config)
+            assert [(worker.port, worker.server.attached)
+                    for worker in other_renderer.workers] == [(7000, False)]
+            # No server is spawned on the port of a registered one.
+            other_renderer = orrb.RemoteRenderer('OrrbRenderer2', [[0, 7395], [0, 7001]],
+                                                 config)
+            assert [(worker.port, worker.server.attached)
+                    for worker in other_renderer.workers] == [(7001, False)]
+            renderer.start()
+            renderer.render_batch(_build_batch(np.random.rand(3, 7)))
+
+    # No warmup for the attached server, it gets the full config before the first batch.
+    assert service.calls == ['update', 'render']
+    assert registry.servers()[0]['lease'] is None
+
+    # Leases of dead renderer processes are dropped.
+    entries = registry.lease(config_hash, 1)
+    assert [entry['lease']['pid'] for entry in entries] == [os.getpid()]
+    with registry._locked() as locked_entries:
+        locked_entries[0]['lease']['pid'] = _dead_pid()
+    assert registry.lease(config_hash, 1)[0]['port'] == port
@@ -77,6 +77,35 @@ def build_batch(states, seed):
     return {'qpos': states, 'seed': seed} 
 
 
+def format_component_stats(stats):
+    """Formats the RemoteRenderer.component_stats, summed over the servers, as a table of the
+    components ranked by their total cost."""
+    components = dict()
+    for server_stats in stats:
+        for component in server_stats['components']:
+            total = components.setdefault(component['name'], dict(
+                component, calls=0, total_seconds=0.0, max_seconds=0.0))
+            total['calls'] += component['calls']
+            total['total_seconds'] += component['total_seconds']
+            total['max_seconds'] = max(total['max_seconds'], component['max_seconds'])
+
+    ranked = sorted(components.values(), key=lambda component: -component['total_seconds'])
+    all_seconds = sum(component['total_seconds'] for component in ranked) or 1.0
+    lines = [f'{"#":>3} {"component":<32} {"type":<24} {"calls":>10} {"total s":>10} '
+             f'{"mean ms":>10} {"max ms":>10} {"share":>7}']
+    for rank, component in enumerate(ranked, 1):
+        mean = component['total_seconds'] / max(1, component['calls'])
+        lines.append(f'{rank:>3} {component["name"]:<32} {component["type"]:<24} '
+                     f'{component["calls"]:>10} {component["total_seconds"]:>10.3f} '
+                     f'{mean * 1000:>10.3f} {component["max_seconds"] * 1000:>10.3f} '
+                     f'{100.0 * component["total_seconds"] / all_seconds:>6.1f}%')
+    return '\n'.join(lines)
+
+
+def print_component_stats(stats):
+    print(format_component_stats(stats))
+
+
 def setup_logging():
     mpi_comm = MPI.COMM_WORLD
 
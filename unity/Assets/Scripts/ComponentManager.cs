@@ -93,6 +93,17 @@ public class ComponentManager : MonoBehaviour {
 
     private Vector2 scroll_position_ = Vector2.zero;
 
+    // The accumulated cost of the RunComponent calls of a component, in Stopwatch ticks.
+    private class ComponentProfile {
+        public long calls = 0;
+        public long total_ticks = 0;
+        public long max_ticks = 0;
+    }
+
+    // When profiling, every RunComponent call is timed, the stats are kept per component name.
+    private bool profiling_ = false;
+    private Dictionary<string, ComponentProfile> profiles_ = new Dictionary<string, ComponentProfile>();
+
     // Traverse the kinetic hierarchy in order to find the object.
     private static GameObject FindSubject(GameObject parent, string path) {
 
@@ -174,17 +185,69 @@ public class ComponentManager : MonoBehaviour {
         }
     }
 
+    // Returns the current config of the named component, or null if there is no such component.
+    public Orrb.RendererComponentConfig GetComponentConfig(string name) {
+        if (components_dictionary_.ContainsKey(name)) {
+            return components_dictionary_[name].renderer_component.GetConfig();
+        }
+        return null;
+    }
+
     public bool RunComponents(RendererComponent.IOutputContext context) {
         foreach (ComponentInstance component_instance in components_) {
             if (component_instance.enabled) {
+                long start = profiling_ ? System.Diagnostics.Stopwatch.GetTimestamp() : 0;
                 if (!component_instance.renderer_component.RunComponent(context)) {
                     Logger.Warning("ComponentManager::RunComponents::Failed running: {0}.", component_instance.name);
                 }
+                if (profiling_) {
+                    AddProfile(component_instance.name, System.Diagnostics.Stopwatch.GetTimestamp() - start);
+                }
             }
         }
         return true;
     }
 
+    private void AddProfile(string name, long ticks) {
+        ComponentProfile profile = null;
+        if (!profiles_.TryGetValue(name, out profile)) {
+            profile = new ComponentProfile();
+            profiles_.Add(name, profile);
+        }
+        profile.calls++;
+        profile.total_ticks += ticks;
+        profile.max_ticks = Math.Max(profile.max_ticks, ticks);
+    }
+
+    public void SetProfiling(bool profiling) {
+        profiling_ = profiling;
+    }
+
+    public void ResetProfiles() {
+        profiles_.Clear();
+    }
+
+    // The per component stats collected while profiling, in the order the components run.
+    public Orrb.ComponentStatsResponse GetComponentStats() {
+        Orrb.ComponentStatsResponse response = new Orrb.ComponentStatsResponse();
+        response.Profiling = profiling_;
+        double frequency = System.Diagnostics.Stopwatch.Frequency;
+        foreach (ComponentInstance component_instance in components_) {
+            ComponentProfile profile = null;
+            if (!profiles_.TryGetValue(component_instance.name, out profile)) {
+                continue;
+            }
+            Orrb.ComponentStatsResponse.Types.ComponentStats stats = new Orrb.ComponentStatsResponse.Types.ComponentStats();
+            stats.Name = component_instance.name;
+            stats.Type = component_instance.type;
+            stats.Calls = profile.calls;
+            stats.TotalSeconds = profile.total_ticks / frequency;
+            stats.MaxSeconds = profile.max_ticks / frequency;
+            response.Components.Add(stats);
+        }
+        return response;
+    }
+
     public void DrawEditorGUI() {
         scroll_position_ = GUILayout.BeginScrollView(scroll_position_, GUILayout.ExpandWidth(true));
         GUILayout.BeginVertical();
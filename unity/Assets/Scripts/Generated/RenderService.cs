@@ -25,46 +25,83 @@ namespace Orrb {
       byte[] descriptorData = global::System.Convert.FromBase64String(
           string.Concat(
             "Ch9vcnJiL3Byb3Rvcy9SZW5kZXJTZXJ2aWNlLnByb3RvEgRvcnJiGiBvcnJi",
-            "L3Byb3Rvcy9SZW5kZXJlckNvbmZpZy5wcm90byLXAgoSUmVuZGVyQmF0Y2hS",
+            "L3Byb3Rvcy9SZW5kZXJlckNvbmZpZy5wcm90byKCBAoSUmVuZGVyQmF0Y2hS",
             "ZXF1ZXN0EjsKB2VudHJpZXMYASADKAsyKi5vcnJiLlJlbmRlckJhdGNoUmVx",
             "dWVzdC5CYXRjaFJlcXVlc3RFbnRyeRINCgV3aWR0aBgCIAEoBRIOCgZoZWln",
             "aHQYAyABKAUSEAoIc2NlbmVfaWQYBCABKAUSFAoMY2FtZXJhX25hbWVzGAUg",
             "AygJEhIKCmJhdGNoX3NlZWQYBiABKAUSFwoPdXNlX2VudHJ5X3NlZWRzGAcg",
             "ASgIEhQKDHJlbmRlcl9hbHBoYRgIIAEoCBIUCgxyZW5kZXJfZGVwdGgYCSAB",
             "KAgSFgoOcmVuZGVyX25vcm1hbHMYCiABKAgSGwoTcmVuZGVyX3NlZ21lbnRh",
-            "dGlvbhgLIAEoCBovChFCYXRjaFJlcXVlc3RFbnRyeRIMCgRxcG9zGAEgAygC",
-            "EgwKBHNlZWQYAiABKAUiyQUKE1JlbmRlckJhdGNoUmVzcG9uc2USNgoHc3Ry",
-            "ZWFtcxgBIAMoCzIlLm9ycmIuUmVuZGVyQmF0Y2hSZXNwb25zZS5TdHJlYW1F",
-            "bnRyeRJSChZhdXhpbGlhcnlfYm9vbF9zdHJlYW1zGAIgAygLMjIub3JyYi5S",
-            "ZW5kZXJCYXRjaFJlc3BvbnNlLkF1eGlsaWFyeUJvb2xTdHJlYW1FbnRyeRJQ",
-            "ChVhdXhpbGlhcnlfaW50X3N0cmVhbXMYAyADKAsyMS5vcnJiLlJlbmRlckJh",
-            "dGNoUmVzcG9uc2UuQXV4aWxpYXJ5SW50U3RyZWFtRW50cnkSVAoXYXV4aWxp",
-            "YXJ5X2Zsb2F0X3N0cmVhbXMYBCADKAsyMy5vcnJiLlJlbmRlckJhdGNoUmVz",
-            "cG9uc2UuQXV4aWxpYXJ5RmxvYXRTdHJlYW1FbnRyeRrVAQoLU3RyZWFtRW50",
-            "cnkSDAoEbmFtZRgBIAEoCRJJCgdlbnRyaWVzGAIgAygLMjgub3JyYi5SZW5k",
-            "ZXJCYXRjaFJlc3BvbnNlLlN0cmVhbUVudHJ5LkJhdGNoUmVzcG9uc2VFbnRy",
-            "eRptChJCYXRjaFJlc3BvbnNlRW50cnkSEgoKaW1hZ2VfZGF0YRgBIAEoDBIS",
-            "CgpkZXB0aF9kYXRhGAIgASgMEhQKDG5vcm1hbHNfZGF0YRgDIAEoDBIZChFz",
-            "ZWdtZW50YXRpb25fZGF0YRgEIAEoDBo2ChhBdXhpbGlhcnlCb29sU3RyZWFt",
-            "RW50cnkSDAoEbmFtZRgBIAEoCRIMCgRkYXRhGAIgAygIGjUKF0F1eGlsaWFy",
-            "eUludFN0cmVhbUVudHJ5EgwKBG5hbWUYASABKAkSDAoEZGF0YRgCIAMoBRo3",
-            "ChlBdXhpbGlhcnlGbG9hdFN0cmVhbUVudHJ5EgwKBG5hbWUYASABKAkSDAoE",
-            "ZGF0YRgCIAMoAiI8Cg1VcGRhdGVSZXF1ZXN0EisKCmNvbXBvbmVudHMYASAD",
-            "KAsyFy5vcnJiLlJlbmRlcmVyQ29tcG9uZW50IiAKDlVwZGF0ZVJlc3BvbnNl",
-            "Eg4KBmVycm9ycxgBIAMoCTKMAQoNUmVuZGVyU2VydmljZRJECgtSZW5kZXJC",
-            "YXRjaBIYLm9ycmIuUmVuZGVyQmF0Y2hSZXF1ZXN0Ghkub3JyYi5SZW5kZXJC",
-            "YXRjaFJlc3BvbnNlIgASNQoGVXBkYXRlEhMub3JyYi5VcGRhdGVSZXF1ZXN0",
-            "GhQub3JyYi5VcGRhdGVSZXNwb25zZSIAYgZwcm90bzM="));
+            "dGlvbhgLIAEoCBIVCg1wYWNrZWRfaW1hZ2VzGAwgASgIEhMKC3BhY2tlZF9x",
+            "cG9zGA0gASgMEhkKEXBhY2tlZF9xcG9zX3NoYXBlGA4gAygFEhQKDHBhY2tl",
+            "ZF9zZWVkcxgPIAEoDBIZChFzdHJlYW1fY2h1bmtfc2l6ZRgQIAEoBRIxChBj",
+            "b25maWdfb3ZlcnJpZGVzGBEgAygLMhcub3JyYi5SZW5kZXJlckNvbXBvbmVu",
+            "dBovChFCYXRjaFJlcXVlc3RFbnRyeRIMCgRxcG9zGAEgAygCEgwKBHNlZWQY",
+            "AiABKAUijQkKE1JlbmRlckJhdGNoUmVzcG9uc2USNgoHc3RyZWFtcxgBIAMo",
+            "CzIlLm9ycmIuUmVuZGVyQmF0Y2hSZXNwb25zZS5TdHJlYW1FbnRyeRJSChZh",
+            "dXhpbGlhcnlfYm9vbF9zdHJlYW1zGAIgAygLMjIub3JyYi5SZW5kZXJCYXRj",
+            "aFJlc3BvbnNlLkF1eGlsaWFyeUJvb2xTdHJlYW1FbnRyeRJQChVhdXhpbGlh",
+            "cnlfaW50X3N0cmVhbXMYAyADKAsyMS5vcnJiLlJlbmRlckJhdGNoUmVzcG9u",
+            "c2UuQXV4aWxpYXJ5SW50U3RyZWFtRW50cnkSVAoXYXV4aWxpYXJ5X2Zsb2F0",
+            "X3N0cmVhbXMYBCADKAsyMy5vcnJiLlJlbmRlckJhdGNoUmVzcG9uc2UuQXV4",
+            "aWxpYXJ5RmxvYXRTdHJlYW1FbnRyeRIWCg5lbnRyaWVzX29mZnNldBgFIAEo",
+            "BRIVCg1lbnRyaWVzX2NvdW50GAYgASgFEisKDnNlcnZlcl90aW1pbmdzGAcg",
+            "ASgLMhMub3JyYi5TZXJ2ZXJUaW1pbmdzGr0ECgtTdHJlYW1FbnRyeRIMCgRu",
+            "YW1lGAEgASgJEkkKB2VudHJpZXMYAiADKAsyOC5vcnJiLlJlbmRlckJhdGNo",
+            "UmVzcG9uc2UuU3RyZWFtRW50cnkuQmF0Y2hSZXNwb25zZUVudHJ5EksKEXBh",
+            "Y2tlZF9pbWFnZV9kYXRhGAMgASgLMjAub3JyYi5SZW5kZXJCYXRjaFJlc3Bv",
+            "bnNlLlN0cmVhbUVudHJ5LlBhY2tlZERhdGESSwoRcGFja2VkX2RlcHRoX2Rh",
+            "dGEYBCABKAsyMC5vcnJiLlJlbmRlckJhdGNoUmVzcG9uc2UuU3RyZWFtRW50",
+            "cnkuUGFja2VkRGF0YRJNChNwYWNrZWRfbm9ybWFsc19kYXRhGAUgASgLMjAu",
+            "b3JyYi5SZW5kZXJCYXRjaFJlc3BvbnNlLlN0cmVhbUVudHJ5LlBhY2tlZERh",
+            "dGESUgoYcGFja2VkX3NlZ21lbnRhdGlvbl9kYXRhGAYgASgLMjAub3JyYi5S",
+            "ZW5kZXJCYXRjaFJlc3BvbnNlLlN0cmVhbUVudHJ5LlBhY2tlZERhdGEabQoS",
+            "QmF0Y2hSZXNwb25zZUVudHJ5EhIKCmltYWdlX2RhdGEYASABKAwSEgoKZGVw",
+            "dGhfZGF0YRgCIAEoDBIUCgxub3JtYWxzX2RhdGEYAyABKAwSGQoRc2VnbWVu",
+            "dGF0aW9uX2RhdGEYBCABKAwaKQoKUGFja2VkRGF0YRIMCgRkYXRhGAEgASgM",
+            "Eg0KBXNoYXBlGAIgAygFGjYKGEF1eGlsaWFyeUJvb2xTdHJlYW1FbnRyeRIM",
+            "CgRuYW1lGAEgASgJEgwKBGRhdGEYAiADKAgaNQoXQXV4aWxpYXJ5SW50U3Ry",
+            "ZWFtRW50cnkSDAoEbmFtZRgBIAEoCRIMCgRkYXRhGAIgAygFGjcKGUF1eGls",
+            "aWFyeUZsb2F0U3RyZWFtRW50cnkSDAoEbmFtZRgBIAEoCRIMCgRkYXRhGAIg",
+            "AygCIqsBCg1TZXJ2ZXJUaW1pbmdzEhIKCnF1ZXVlX3dhaXQYASABKAISFAoM",
+            "dXBkYXRlX3N0YXRlGAIgASgCEhYKDnJ1bl9jb21wb25lbnRzGAMgASgCEg8K",
+            "B2NhcHR1cmUYBCABKAISEAoIcmVhZGJhY2sYBSABKAISFgoOYnVpbGRfcmVz",
+            "cG9uc2UYBiABKAISDQoFdG90YWwYByABKAISDgoGZnJhbWVzGAggASgFIjwK",
+            "DVVwZGF0ZVJlcXVlc3QSKwoKY29tcG9uZW50cxgBIAMoCzIXLm9ycmIuUmVu",
+            "ZGVyZXJDb21wb25lbnQiIAoOVXBkYXRlUmVzcG9uc2USDgoGZXJyb3JzGAEg",
+            "AygJIg8KDUhlYWx0aFJlcXVlc3QiOwoOSGVhbHRoUmVzcG9uc2USDwoHc2Vy",
+            "dmluZxgBIAEoCBIYChBxdWV1ZWRfd29ya2xvYWRzGAIgASgFIlAKFUNvbXBv",
+            "bmVudFN0YXRzUmVxdWVzdBIVCg1zZXRfcHJvZmlsaW5nGAEgASgIEhEKCXBy",
+            "b2ZpbGluZxgCIAEoCBINCgVyZXNldBgDIAEoCCLVAQoWQ29tcG9uZW50U3Rh",
+            "dHNSZXNwb25zZRIRCglwcm9maWxpbmcYASABKAgSPwoKY29tcG9uZW50cxgC",
+            "IAMoCzIrLm9ycmIuQ29tcG9uZW50U3RhdHNSZXNwb25zZS5Db21wb25lbnRT",
+            "dGF0cxpnCg5Db21wb25lbnRTdGF0cxIMCgRuYW1lGAEgASgJEgwKBHR5cGUY",
+            "AiABKAkSDQoFY2FsbHMYAyABKAMSFQoNdG90YWxfc2Vjb25kcxgEIAEoARIT",
+            "CgttYXhfc2Vjb25kcxgFIAEoATLgAgoNUmVuZGVyU2VydmljZRJECgtSZW5k",
+            "ZXJCYXRjaBIYLm9ycmIuUmVuZGVyQmF0Y2hSZXF1ZXN0Ghkub3JyYi5SZW5k",
+            "ZXJCYXRjaFJlc3BvbnNlIgASTAoRUmVuZGVyQmF0Y2hTdHJlYW0SGC5vcnJi",
+            "LlJlbmRlckJhdGNoUmVxdWVzdBoZLm9ycmIuUmVuZGVyQmF0Y2hSZXNwb25z",
+            "ZSIAMAESNQoGVXBkYXRlEhMub3JyYi5VcGRhdGVSZXF1ZXN0GhQub3JyYi5V",
+            "cGRhdGVSZXNwb25zZSIAEjUKBkhlYWx0aBITLm9ycmIuSGVhbHRoUmVxdWVz",
+            "dBoULm9ycmIuSGVhbHRoUmVzcG9uc2UiABJNCg5Db21wb25lbnRTdGF0cxIb",
+            "Lm9ycmIuQ29tcG9uZW50U3RhdHNSZXF1ZXN0Ghwub3JyYi5Db21wb25lbnRT",
+            "dGF0c1Jlc3BvbnNlIgBiBnByb3RvMw=="));
       descriptor = pbr::FileDescriptor.FromGeneratedCode(descriptorData,
           new pbr::FileDescriptor[] { global::Orrb.RendererConfigReflection.Descriptor, },
           new pbr::GeneratedClrTypeInfo(null, new pbr::GeneratedClrTypeInfo[] {
-            new pbr::GeneratedClrTypeInfo(typeof(global::Orrb.RenderBatchRequest), global::Orrb.RenderBatchRequest.Parser, new[]{ "Entries", "Width", "Height", "SceneId", "CameraNames", "BatchSeed", "UseEntrySeeds", "RenderAlpha", "RenderDepth", "RenderNormals", "RenderSegmentation" }, null, null, new pbr::GeneratedClrTypeInfo[] { new pbr::GeneratedClrTypeInfo(typeof(global::Orrb.RenderBatchRequest.Types.BatchRequestEntry), global::Orrb.RenderBatchRequest.Types.BatchRequestEntry.Parser, new[]{ "Qpos", "Seed" }, null, null, null)}),
-            new pbr::GeneratedClrTypeInfo(typeof(global::Orrb.RenderBatchResponse), global::Orrb.RenderBatchResponse.Parser, new[]{ "Streams", "AuxiliaryBoolStreams", "AuxiliaryIntStreams", "AuxiliaryFloatStreams" }, null, null, new pbr::GeneratedClrTypeInfo[] { new pbr::GeneratedClrTypeInfo(typeof(global::Orrb.RenderBatchResponse.Types.StreamEntry), global::Orrb.RenderBatchResponse.Types.StreamEntry.Parser, new[]{ "Name", "Entries" }, null, null, new pbr::GeneratedClrTypeInfo[] { new pbr::GeneratedClrTypeInfo(typeof(global::Orrb.RenderBatchResponse.Types.StreamEntry.Types.BatchResponseEntry), global::Orrb.RenderBatchResponse.Types.StreamEntry.Types.BatchResponseEntry.Parser, new[]{ "ImageData", "DepthData", "NormalsData", "SegmentationData" }, null, null, null)}),
+            new pbr::GeneratedClrTypeInfo(typeof(global::Orrb.RenderBatchRequest), global::Orrb.RenderBatchRequest.Parser, new[]{ "Entries", "Width", "Height", "SceneId", "CameraNames", "BatchSeed", "UseEntrySeeds", "RenderAlpha", "RenderDepth", "RenderNormals", "RenderSegmentation", "PackedImages", "PackedQpos", "PackedQposShape", "PackedSeeds", "StreamChunkSize", "ConfigOverrides" }, null, null, new pbr::GeneratedClrTypeInfo[] { new pbr::GeneratedClrTypeInfo(typeof(global::Orrb.RenderBatchRequest.Types.BatchRequestEntry), global::Orrb.RenderBatchRequest.Types.BatchRequestEntry.Parser, new[]{ "Qpos", "Seed" }, null, null, null)}),
+            new pbr::GeneratedClrTypeInfo(typeof(global::Orrb.RenderBatchResponse), global::Orrb.RenderBatchResponse.Parser, new[]{ "Streams", "AuxiliaryBoolStreams", "AuxiliaryIntStreams", "AuxiliaryFloatStreams", "EntriesOffset", "EntriesCount", "ServerTimings" }, null, null, new pbr::GeneratedClrTypeInfo[] { new pbr::GeneratedClrTypeInfo(typeof(global::Orrb.RenderBatchResponse.Types.StreamEntry), global::Orrb.RenderBatchResponse.Types.StreamEntry.Parser, new[]{ "Name", "Entries", "PackedImageData", "PackedDepthData", "PackedNormalsData", "PackedSegmentationData" }, null, null, new pbr::GeneratedClrTypeInfo[] { new pbr::GeneratedClrTypeInfo(typeof(global::Orrb.RenderBatchResponse.Types.StreamEntry.Types.BatchResponseEntry), global::Orrb.RenderBatchResponse.Types.StreamEntry.Types.BatchResponseEntry.Parser, new[]{ "ImageData", "DepthData", "NormalsData", "SegmentationData" }, null, null, null),
+            new pbr::GeneratedClrTypeInfo(typeof(global::Orrb.RenderBatchResponse.Types.StreamEntry.Types.PackedData), global::Orrb.RenderBatchResponse.Types.StreamEntry.Types.PackedData.Parser, new[]{ "Data", "Shape" }, null, null, null)}),
             new pbr::GeneratedClrTypeInfo(typeof(global::Orrb.RenderBatchResponse.Types.AuxiliaryBoolStreamEntry), global::Orrb.RenderBatchResponse.Types.AuxiliaryBoolStreamEntry.Parser, new[]{ "Name", "Data" }, null, null, null),
             new pbr::GeneratedClrTypeInfo(typeof(global::Orrb.RenderBatchResponse.Types.AuxiliaryIntStreamEntry), global::Orrb.RenderBatchResponse.Types.AuxiliaryIntStreamEntry.Parser, new[]{ "Name", "Data" }, null, null, null),
             new pbr::GeneratedClrTypeInfo(typeof(global::Orrb.RenderBatchResponse.Types.AuxiliaryFloatStreamEntry), global::Orrb.RenderBatchResponse.Types.AuxiliaryFloatStreamEntry.Parser, new[]{ "Name", "Data" }, null, null, null)}),
+            new pbr::GeneratedClrTypeInfo(typeof(global::Orrb.ServerTimings), global::Orrb.ServerTimings.Parser, new[]{ "QueueWait", "UpdateState", "RunComponents", "Capture", "Readback", "BuildResponse", "Total", "Frames" }, null, null, null),
             new pbr::GeneratedClrTypeInfo(typeof(global::Orrb.UpdateRequest), global::Orrb.UpdateRequest.Parser, new[]{ "Components" }, null, null, null),
-            new pbr::GeneratedClrTypeInfo(typeof(global::Orrb.UpdateResponse), global::Orrb.UpdateResponse.Parser, new[]{ "Errors" }, null, null, null)
+            new pbr::GeneratedClrTypeInfo(typeof(global::Orrb.UpdateResponse), global::Orrb.UpdateResponse.Parser, new[]{ "Errors" }, null, null, null),
+            new pbr::GeneratedClrTypeInfo(typeof(global::Orrb.HealthRequest), global::Orrb.HealthRequest.Parser, null, null, null, null),
+            new pbr::GeneratedClrTypeInfo(typeof(global::Orrb.HealthResponse), global::Orrb.HealthResponse.Parser, new[]{ "Serving", "QueuedWorkloads" }, null, null, null),
+            new pbr::GeneratedClrTypeInfo(typeof(global::Orrb.ComponentStatsRequest), global::Orrb.ComponentStatsRequest.Parser, new[]{ "SetProfiling", "Profiling", "Reset" }, null, null, null),
+            new pbr::GeneratedClrTypeInfo(typeof(global::Orrb.ComponentStatsResponse), global::Orrb.ComponentStatsResponse.Parser, new[]{ "Profiling", "Components" }, null, null, new pbr::GeneratedClrTypeInfo[] { new pbr::GeneratedClrTypeInfo(typeof(global::Orrb.ComponentStatsResponse.Types.ComponentStats), global::Orrb.ComponentStatsResponse.Types.ComponentStats.Parser, new[]{ "Name", "Type", "Calls", "TotalSeconds", "MaxSeconds" }, null, null, null)})
           }));
     }
     #endregion
@@ -107,6 +144,12 @@ namespace Orrb {
       renderDepth_ = other.renderDepth_;
       renderNormals_ = other.renderNormals_;
       renderSegmentation_ = other.renderSegmentation_;
+      packedImages_ = other.packedImages_;
+      packedQpos_ = other.packedQpos_;
+      packedQposShape_ = other.packedQposShape_.Clone();
+      packedSeeds_ = other.packedSeeds_;
+      streamChunkSize_ = other.streamChunkSize_;
+      configOverrides_ = other.configOverrides_.Clone();
       _unknownFields = pb::UnknownFieldSet.Clone(other._unknownFields);
     }
 
@@ -234,6 +277,83 @@ namespace Orrb {
       }
     }
 
+    /// <summary>Field number for the "packed_images" field.</summary>
+    public const int PackedImagesFieldNumber = 12;
+    private bool packedImages_;
+    /// <summary>
+    /// Respond with one packed blob per stream and modality, instead of per entry data.
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public bool PackedImages {
+      get { return packedImages_; }
+      set {
+        packedImages_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "packed_qpos" field.</summary>
+    public const int PackedQposFieldNumber = 13;
+    private pb::ByteString packedQpos_ = pb::ByteString.Empty;
+    /// <summary>
+    /// Packed alternative to the entries: a little endian float32 (batch, dim) qpos
+    /// tensor, and optional int32 (batch) seeds used when use_entry_seeds is set.
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public pb::ByteString PackedQpos {
+      get { return packedQpos_; }
+      set {
+        packedQpos_ = pb::ProtoPreconditions.CheckNotNull(value, "value");
+      }
+    }
+
+    /// <summary>Field number for the "packed_qpos_shape" field.</summary>
+    public const int PackedQposShapeFieldNumber = 14;
+    private static readonly pb::FieldCodec<int> _repeated_packedQposShape_codec
+        = pb::FieldCodec.ForInt32(114);
+    private readonly pbc::RepeatedField<int> packedQposShape_ = new pbc::RepeatedField<int>();
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public pbc::RepeatedField<int> PackedQposShape {
+      get { return packedQposShape_; }
+    }
+
+    /// <summary>Field number for the "packed_seeds" field.</summary>
+    public const int PackedSeedsFieldNumber = 15;
+    private pb::ByteString packedSeeds_ = pb::ByteString.Empty;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public pb::ByteString PackedSeeds {
+      get { return packedSeeds_; }
+      set {
+        packedSeeds_ = pb::ProtoPreconditions.CheckNotNull(value, "value");
+      }
+    }
+
+    /// <summary>Field number for the "stream_chunk_size" field.</summary>
+    public const int StreamChunkSizeFieldNumber = 16;
+    private int streamChunkSize_;
+    /// <summary>
+    /// Frames per streamed response chunk, used by RenderBatchStream only.
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public int StreamChunkSize {
+      get { return streamChunkSize_; }
+      set {
+        streamChunkSize_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "config_overrides" field.</summary>
+    public const int ConfigOverridesFieldNumber = 17;
+    private static readonly pb::FieldCodec<global::Orrb.RendererComponent> _repeated_configOverrides_codec
+        = pb::FieldCodec.ForMessage(138, global::Orrb.RendererComponent.Parser);
+    private readonly pbc::RepeatedField<global::Orrb.RendererComponent> configOverrides_ = new pbc::RepeatedField<global::Orrb.RendererComponent>();
+    /// <summary>
+    /// Component configs applied for this batch only, the previous configs are restored after it.
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public pbc::RepeatedField<global::Orrb.RendererComponent> ConfigOverrides {
+      get { return configOverrides_; }
+    }
+
     [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
     public override bool Equals(object other) {
       return Equals(other as RenderBatchRequest);
@@ -258,6 +378,12 @@ namespace Orrb {
       if (RenderDepth != other.RenderDepth) return false;
       if (RenderNormals != other.RenderNormals) return false;
       if (RenderSegmentation != other.RenderSegmentation) return false;
+      if (PackedImages != other.PackedImages) return false;
+      if (PackedQpos != other.PackedQpos) return false;
+      if(!packedQposShape_.Equals(other.packedQposShape_)) return false;
+      if (PackedSeeds != other.PackedSeeds) return false;
+      if (StreamChunkSize != other.StreamChunkSize) return false;
+      if(!configOverrides_.Equals(other.configOverrides_)) return false;
       return Equals(_unknownFields, other._unknownFields);
     }
 
@@ -275,6 +401,12 @@ namespace Orrb {
       if (RenderDepth != false) hash ^= RenderDepth.GetHashCode();
       if (RenderNormals != false) hash ^= RenderNormals.GetHashCode();
       if (RenderSegmentation != false) hash ^= RenderSegmentation.GetHashCode();
+      if (PackedImages != false) hash ^= PackedImages.GetHashCode();
+      if (PackedQpos.Length != 0) hash ^= PackedQpos.GetHashCode();
+      hash ^= packedQposShape_.GetHashCode();
+      if (PackedSeeds.Length != 0) hash ^= PackedSeeds.GetHashCode();
+      if (StreamChunkSize != 0) hash ^= StreamChunkSize.GetHashCode();
+      hash ^= configOverrides_.GetHashCode();
       if (_unknownFields != null) {
         hash ^= _unknownFields.GetHashCode();
       }
@@ -326,6 +458,24 @@ namespace Orrb {
         output.WriteRawTag(88);
         output.WriteBool(RenderSegmentation);
       }
+      if (PackedImages != false) {
+        output.WriteRawTag(96);
+        output.WriteBool(PackedImages);
+      }
+      if (PackedQpos.Length != 0) {
+        output.WriteRawTag(106);
+        output.WriteBytes(PackedQpos);
+      }
+      packedQposShape_.WriteTo(output, _repeated_packedQposShape_codec);
+      if (PackedSeeds.Length != 0) {
+        output.WriteRawTag(122);
+        output.WriteBytes(PackedSeeds);
+      }
+      if (StreamChunkSize != 0) {
+        output.WriteRawTag(128, 1);
+        output.WriteInt32(StreamChunkSize);
+      }
+      configOverrides_.WriteTo(output, _repeated_configOverrides_codec);
       if (_unknownFields != null) {
         _unknownFields.WriteTo(output);
       }
@@ -363,6 +513,20 @@ namespace Orrb {
       if (RenderSegmentation != false) {
         size += 1 + 1;
       }
+      if (PackedImages != false) {
+        size += 1 + 1;
+      }
+      if (PackedQpos.Length != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeBytesSize(PackedQpos);
+      }
+      size += packedQposShape_.CalculateSize(_repeated_packedQposShape_codec);
+      if (PackedSeeds.Length != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeBytesSize(PackedSeeds);
+      }
+      if (StreamChunkSize != 0) {
+        size += 2 + pb::CodedOutputStream.ComputeInt32Size(StreamChunkSize);
+      }
+      size += configOverrides_.CalculateSize(_repeated_configOverrides_codec);
       if (_unknownFields != null) {
         size += _unknownFields.CalculateSize();
       }
@@ -403,6 +567,20 @@ namespace Orrb {
       if (other.RenderSegmentation != false) {
         RenderSegmentation = other.RenderSegmentation;
       }
+      if (other.PackedImages != false) {
+        PackedImages = other.PackedImages;
+      }
+      if (other.PackedQpos.Length != 0) {
+        PackedQpos = other.PackedQpos;
+      }
+      packedQposShape_.Add(other.packedQposShape_);
+      if (other.PackedSeeds.Length != 0) {
+        PackedSeeds = other.PackedSeeds;
+      }
+      if (other.StreamChunkSize != 0) {
+        StreamChunkSize = other.StreamChunkSize;
+      }
+      configOverrides_.Add(other.configOverrides_);
       _unknownFields = pb::UnknownFieldSet.MergeFrom(_unknownFields, other._unknownFields);
     }
 
@@ -458,6 +636,31 @@ namespace Orrb {
             RenderSegmentation = input.ReadBool();
             break;
           }
+          case 96: {
+            PackedImages = input.ReadBool();
+            break;
+          }
+          case 106: {
+            PackedQpos = input.ReadBytes();
+            break;
+          }
+          case 114:
+          case 112: {
+            packedQposShape_.AddEntriesFrom(input, _repeated_packedQposShape_codec);
+            break;
+          }
+          case 122: {
+            PackedSeeds = input.ReadBytes();
+            break;
+          }
+          case 128: {
+            StreamChunkSize = input.ReadInt32();
+            break;
+          }
+          case 138: {
+            configOverrides_.AddEntriesFrom(input, _repeated_configOverrides_codec);
+            break;
+          }
         }
       }
     }
@@ -650,6 +853,9 @@ namespace Orrb {
       auxiliaryBoolStreams_ = other.auxiliaryBoolStreams_.Clone();
       auxiliaryIntStreams_ = other.auxiliaryIntStreams_.Clone();
       auxiliaryFloatStreams_ = other.auxiliaryFloatStreams_.Clone();
+      entriesOffset_ = other.entriesOffset_;
+      entriesCount_ = other.entriesCount_;
+      serverTimings_ = other.serverTimings_ != null ? other.serverTimings_.Clone() : null;
       _unknownFields = pb::UnknownFieldSet.Clone(other._unknownFields);
     }
 
@@ -698,6 +904,42 @@ namespace Orrb {
       get { return auxiliaryFloatStreams_; }
     }
 
+    /// <summary>Field number for the "entries_offset" field.</summary>
+    public const int EntriesOffsetFieldNumber = 5;
+    private int entriesOffset_;
+    /// <summary>
+    /// The range of request entries this response (or streamed chunk) covers.
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public int EntriesOffset {
+      get { return entriesOffset_; }
+      set {
+        entriesOffset_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "entries_count" field.</summary>
+    public const int EntriesCountFieldNumber = 6;
+    private int entriesCount_;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public int EntriesCount {
+      get { return entriesCount_; }
+      set {
+        entriesCount_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "server_timings" field.</summary>
+    public const int ServerTimingsFieldNumber = 7;
+    private global::Orrb.ServerTimings serverTimings_;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public global::Orrb.ServerTimings ServerTimings {
+      get { return serverTimings_; }
+      set {
+        serverTimings_ = value;
+      }
+    }
+
     [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
     public override bool Equals(object other) {
       return Equals(other as RenderBatchResponse);
@@ -715,6 +957,9 @@ namespace Orrb {
       if(!auxiliaryBoolStreams_.Equals(other.auxiliaryBoolStreams_)) return false;
       if(!auxiliaryIntStreams_.Equals(other.auxiliaryIntStreams_)) return false;
       if(!auxiliaryFloatStreams_.Equals(other.auxiliaryFloatStreams_)) return false;
+      if (EntriesOffset != other.EntriesOffset) return false;
+      if (EntriesCount != other.EntriesCount) return false;
+      if (!object.Equals(ServerTimings, other.ServerTimings)) return false;
       return Equals(_unknownFields, other._unknownFields);
     }
 
@@ -725,6 +970,9 @@ namespace Orrb {
       hash ^= auxiliaryBoolStreams_.GetHashCode();
       hash ^= auxiliaryIntStreams_.GetHashCode();
       hash ^= auxiliaryFloatStreams_.GetHashCode();
+      if (EntriesOffset != 0) hash ^= EntriesOffset.GetHashCode();
+      if (EntriesCount != 0) hash ^= EntriesCount.GetHashCode();
+      if (serverTimings_ != null) hash ^= ServerTimings.GetHashCode();
       if (_unknownFields != null) {
         hash ^= _unknownFields.GetHashCode();
       }
@@ -742,6 +990,18 @@ namespace Orrb {
       auxiliaryBoolStreams_.WriteTo(output, _repeated_auxiliaryBoolStreams_codec);
       auxiliaryIntStreams_.WriteTo(output, _repeated_auxiliaryIntStreams_codec);
       auxiliaryFloatStreams_.WriteTo(output, _repeated_auxiliaryFloatStreams_codec);
+      if (EntriesOffset != 0) {
+        output.WriteRawTag(40);
+        output.WriteInt32(EntriesOffset);
+      }
+      if (EntriesCount != 0) {
+        output.WriteRawTag(48);
+        output.WriteInt32(EntriesCount);
+      }
+      if (serverTimings_ != null) {
+        output.WriteRawTag(58);
+        output.WriteMessage(ServerTimings);
+      }
       if (_unknownFields != null) {
         _unknownFields.WriteTo(output);
       }
@@ -754,6 +1014,15 @@ namespace Orrb {
       size += auxiliaryBoolStreams_.CalculateSize(_repeated_auxiliaryBoolStreams_codec);
       size += auxiliaryIntStreams_.CalculateSize(_repeated_auxiliaryIntStreams_codec);
       size += auxiliaryFloatStreams_.CalculateSize(_repeated_auxiliaryFloatStreams_codec);
+      if (EntriesOffset != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeInt32Size(EntriesOffset);
+      }
+      if (EntriesCount != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeInt32Size(EntriesCount);
+      }
+      if (serverTimings_ != null) {
+        size += 1 + pb::CodedOutputStream.ComputeMessageSize(ServerTimings);
+      }
       if (_unknownFields != null) {
         size += _unknownFields.CalculateSize();
       }
@@ -769,6 +1038,18 @@ namespace Orrb {
       auxiliaryBoolStreams_.Add(other.auxiliaryBoolStreams_);
       auxiliaryIntStreams_.Add(other.auxiliaryIntStreams_);
       auxiliaryFloatStreams_.Add(other.auxiliaryFloatStreams_);
+      if (other.EntriesOffset != 0) {
+        EntriesOffset = other.EntriesOffset;
+      }
+      if (other.EntriesCount != 0) {
+        EntriesCount = other.EntriesCount;
+      }
+      if (other.serverTimings_ != null) {
+        if (serverTimings_ == null) {
+          ServerTimings = new global::Orrb.ServerTimings();
+        }
+        ServerTimings.MergeFrom(other.ServerTimings);
+      }
       _unknownFields = pb::UnknownFieldSet.MergeFrom(_unknownFields, other._unknownFields);
     }
 
@@ -796,6 +1077,21 @@ namespace Orrb {
             auxiliaryFloatStreams_.AddEntriesFrom(input, _repeated_auxiliaryFloatStreams_codec);
             break;
           }
+          case 40: {
+            EntriesOffset = input.ReadInt32();
+            break;
+          }
+          case 48: {
+            EntriesCount = input.ReadInt32();
+            break;
+          }
+          case 58: {
+            if (serverTimings_ == null) {
+              ServerTimings = new global::Orrb.ServerTimings();
+            }
+            input.ReadMessage(ServerTimings);
+            break;
+          }
         }
       }
     }
@@ -831,6 +1127,10 @@ namespace Orrb {
         public StreamEntry(StreamEntry other) : this() {
           name_ = other.name_;
           entries_ = other.entries_.Clone();
+          packedImageData_ = other.packedImageData_ != null ? other.packedImageData_.Clone() : null;
+          packedDepthData_ = other.packedDepthData_ != null ? other.packedDepthData_.Clone() : null;
+          packedNormalsData_ = other.packedNormalsData_ != null ? other.packedNormalsData_.Clone() : null;
+          packedSegmentationData_ = other.packedSegmentationData_ != null ? other.packedSegmentationData_.Clone() : null;
           _unknownFields = pb::UnknownFieldSet.Clone(other._unknownFields);
         }
 
@@ -860,6 +1160,50 @@ namespace Orrb {
           get { return entries_; }
         }
 
+        /// <summary>Field number for the "packed_image_data" field.</summary>
+        public const int PackedImageDataFieldNumber = 3;
+        private global::Orrb.RenderBatchResponse.Types.StreamEntry.Types.PackedData packedImageData_;
+        [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+        public global::Orrb.RenderBatchResponse.Types.StreamEntry.Types.PackedData PackedImageData {
+          get { return packedImageData_; }
+          set {
+            packedImageData_ = value;
+          }
+        }
+
+        /// <summary>Field number for the "packed_depth_data" field.</summary>
+        public const int PackedDepthDataFieldNumber = 4;
+        private global::Orrb.RenderBatchResponse.Types.StreamEntry.Types.PackedData packedDepthData_;
+        [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+        public global::Orrb.RenderBatchResponse.Types.StreamEntry.Types.PackedData PackedDepthData {
+          get { return packedDepthData_; }
+          set {
+            packedDepthData_ = value;
+          }
+        }
+
+        /// <summary>Field number for the "packed_normals_data" field.</summary>
+        public const int PackedNormalsDataFieldNumber = 5;
+        private global::Orrb.RenderBatchResponse.Types.StreamEntry.Types.PackedData packedNormalsData_;
+        [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+        public global::Orrb.RenderBatchResponse.Types.StreamEntry.Types.PackedData PackedNormalsData {
+          get { return packedNormalsData_; }
+          set {
+            packedNormalsData_ = value;
+          }
+        }
+
+        /// <summary>Field number for the "packed_segmentation_data" field.</summary>
+        public const int PackedSegmentationDataFieldNumber = 6;
+        private global::Orrb.RenderBatchResponse.Types.StreamEntry.Types.PackedData packedSegmentationData_;
+        [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+        public global::Orrb.RenderBatchResponse.Types.StreamEntry.Types.PackedData PackedSegmentationData {
+          get { return packedSegmentationData_; }
+          set {
+            packedSegmentationData_ = value;
+          }
+        }
+
         [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
         public override bool Equals(object other) {
           return Equals(other as StreamEntry);
@@ -875,6 +1219,10 @@ namespace Orrb {
           }
           if (Name != other.Name) return false;
           if(!entries_.Equals(other.entries_)) return false;
+          if (!object.Equals(PackedImageData, other.PackedImageData)) return false;
+          if (!object.Equals(PackedDepthData, other.PackedDepthData)) return false;
+          if (!object.Equals(PackedNormalsData, other.PackedNormalsData)) return false;
+          if (!object.Equals(PackedSegmentationData, other.PackedSegmentationData)) return false;
           return Equals(_unknownFields, other._unknownFields);
         }
 
@@ -883,6 +1231,10 @@ namespace Orrb {
           int hash = 1;
           if (Name.Length != 0) hash ^= Name.GetHashCode();
           hash ^= entries_.GetHashCode();
+          if (packedImageData_ != null) hash ^= PackedImageData.GetHashCode();
+          if (packedDepthData_ != null) hash ^= PackedDepthData.GetHashCode();
+          if (packedNormalsData_ != null) hash ^= PackedNormalsData.GetHashCode();
+          if (packedSegmentationData_ != null) hash ^= PackedSegmentationData.GetHashCode();
           if (_unknownFields != null) {
             hash ^= _unknownFields.GetHashCode();
           }
@@ -901,6 +1253,22 @@ namespace Orrb {
             output.WriteString(Name);
           }
           entries_.WriteTo(output, _repeated_entries_codec);
+          if (packedImageData_ != null) {
+            output.WriteRawTag(26);
+            output.WriteMessage(PackedImageData);
+          }
+          if (packedDepthData_ != null) {
+            output.WriteRawTag(34);
+            output.WriteMessage(PackedDepthData);
+          }
+          if (packedNormalsData_ != null) {
+            output.WriteRawTag(42);
+            output.WriteMessage(PackedNormalsData);
+          }
+          if (packedSegmentationData_ != null) {
+            output.WriteRawTag(50);
+            output.WriteMessage(PackedSegmentationData);
+          }
           if (_unknownFields != null) {
             _unknownFields.WriteTo(output);
           }
@@ -913,6 +1281,18 @@ namespace Orrb {
             size += 1 + pb::CodedOutputStream.ComputeStringSize(Name);
           }
           size += entries_.CalculateSize(_repeated_entries_codec);
+          if (packedImageData_ != null) {
+            size += 1 + pb::CodedOutputStream.ComputeMessageSize(PackedImageData);
+          }
+          if (packedDepthData_ != null) {
+            size += 1 + pb::CodedOutputStream.ComputeMessageSize(PackedDepthData);
+          }
+          if (packedNormalsData_ != null) {
+            size += 1 + pb::CodedOutputStream.ComputeMessageSize(PackedNormalsData);
+          }
+          if (packedSegmentationData_ != null) {
+            size += 1 + pb::CodedOutputStream.ComputeMessageSize(PackedSegmentationData);
+          }
           if (_unknownFields != null) {
             size += _unknownFields.CalculateSize();
           }
@@ -928,6 +1308,30 @@ namespace Orrb {
             Name = other.Name;
           }
           entries_.Add(other.entries_);
+          if (other.packedImageData_ != null) {
+            if (packedImageData_ == null) {
+              PackedImageData = new global::Orrb.RenderBatchResponse.Types.StreamEntry.Types.PackedData();
+            }
+            PackedImageData.MergeFrom(other.PackedImageData);
+          }
+          if (other.packedDepthData_ != null) {
+            if (packedDepthData_ == null) {
+              PackedDepthData = new global::Orrb.RenderBatchResponse.Types.StreamEntry.Types.PackedData();
+            }
+            PackedDepthData.MergeFrom(other.PackedDepthData);
+          }
+          if (other.packedNormalsData_ != null) {
+            if (packedNormalsData_ == null) {
+              PackedNormalsData = new global::Orrb.RenderBatchResponse.Types.StreamEntry.Types.PackedData();
+            }
+            PackedNormalsData.MergeFrom(other.PackedNormalsData);
+          }
+          if (other.packedSegmentationData_ != null) {
+            if (packedSegmentationData_ == null) {
+              PackedSegmentationData = new global::Orrb.RenderBatchResponse.Types.StreamEntry.Types.PackedData();
+            }
+            PackedSegmentationData.MergeFrom(other.PackedSegmentationData);
+          }
           _unknownFields = pb::UnknownFieldSet.MergeFrom(_unknownFields, other._unknownFields);
         }
 
@@ -947,6 +1351,34 @@ namespace Orrb {
                 entries_.AddEntriesFrom(input, _repeated_entries_codec);
                 break;
               }
+              case 26: {
+                if (packedImageData_ == null) {
+                  PackedImageData = new global::Orrb.RenderBatchResponse.Types.StreamEntry.Types.PackedData();
+                }
+                input.ReadMessage(PackedImageData);
+                break;
+              }
+              case 34: {
+                if (packedDepthData_ == null) {
+                  PackedDepthData = new global::Orrb.RenderBatchResponse.Types.StreamEntry.Types.PackedData();
+                }
+                input.ReadMessage(PackedDepthData);
+                break;
+              }
+              case 42: {
+                if (packedNormalsData_ == null) {
+                  PackedNormalsData = new global::Orrb.RenderBatchResponse.Types.StreamEntry.Types.PackedData();
+                }
+                input.ReadMessage(PackedNormalsData);
+                break;
+              }
+              case 50: {
+                if (packedSegmentationData_ == null) {
+                  PackedSegmentationData = new global::Orrb.RenderBatchResponse.Types.StreamEntry.Types.PackedData();
+                }
+                input.ReadMessage(PackedSegmentationData);
+                break;
+              }
             }
           }
         }
@@ -1168,6 +1600,159 @@ namespace Orrb {
 
           }
 
+          /// <summary>
+          /// All the frames of a stream in one contiguous blob, shape is: (batch, H, W[, C]).
+          /// </summary>
+          public sealed partial class PackedData : pb::IMessage<PackedData> {
+            private static readonly pb::MessageParser<PackedData> _parser = new pb::MessageParser<PackedData>(() => new PackedData());
+            private pb::UnknownFieldSet _unknownFields;
+            [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+            public static pb::MessageParser<PackedData> Parser { get { return _parser; } }
+
+            [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+            public static pbr::MessageDescriptor Descriptor {
+              get { return global::Orrb.RenderBatchResponse.Types.StreamEntry.Descriptor.NestedTypes[1]; }
+            }
+
+            [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+            pbr::MessageDescriptor pb::IMessage.Descriptor {
+              get { return Descriptor; }
+            }
+
+            [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+            public PackedData() {
+              OnConstruction();
+            }
+
+            partial void OnConstruction();
+
+            [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+            public PackedData(PackedData other) : this() {
+              data_ = other.data_;
+              shape_ = other.shape_.Clone();
+              _unknownFields = pb::UnknownFieldSet.Clone(other._unknownFields);
+            }
+
+            [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+            public PackedData Clone() {
+              return new PackedData(this);
+            }
+
+            /// <summary>Field number for the "data" field.</summary>
+            public const int DataFieldNumber = 1;
+            private pb::ByteString data_ = pb::ByteString.Empty;
+            [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+            public pb::ByteString Data {
+              get { return data_; }
+              set {
+                data_ = pb::ProtoPreconditions.CheckNotNull(value, "value");
+              }
+            }
+
+            /// <summary>Field number for the "shape" field.</summary>
+            public const int ShapeFieldNumber = 2;
+            private static readonly pb::FieldCodec<int> _repeated_shape_codec
+                = pb::FieldCodec.ForInt32(18);
+            private readonly pbc::RepeatedField<int> shape_ = new pbc::RepeatedField<int>();
+            [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+            public pbc::RepeatedField<int> Shape {
+              get { return shape_; }
+            }
+
+            [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+            public override bool Equals(object other) {
+              return Equals(other as PackedData);
+            }
+
+            [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+            public bool Equals(PackedData other) {
+              if (ReferenceEquals(other, null)) {
+                return false;
+              }
+              if (ReferenceEquals(other, this)) {
+                return true;
+              }
+              if (Data != other.Data) return false;
+              if(!shape_.Equals(other.shape_)) return false;
+              return Equals(_unknownFields, other._unknownFields);
+            }
+
+            [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+            public override int GetHashCode() {
+              int hash = 1;
+              if (Data.Length != 0) hash ^= Data.GetHashCode();
+              hash ^= shape_.GetHashCode();
+              if (_unknownFields != null) {
+                hash ^= _unknownFields.GetHashCode();
+              }
+              return hash;
+            }
+
+            [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+            public override string ToString() {
+              return pb::JsonFormatter.ToDiagnosticString(this);
+            }
+
+            [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+            public void WriteTo(pb::CodedOutputStream output) {
+              if (Data.Length != 0) {
+                output.WriteRawTag(10);
+                output.WriteBytes(Data);
+              }
+              shape_.WriteTo(output, _repeated_shape_codec);
+              if (_unknownFields != null) {
+                _unknownFields.WriteTo(output);
+              }
+            }
+
+            [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+            public int CalculateSize() {
+              int size = 0;
+              if (Data.Length != 0) {
+                size += 1 + pb::CodedOutputStream.ComputeBytesSize(Data);
+              }
+              size += shape_.CalculateSize(_repeated_shape_codec);
+              if (_unknownFields != null) {
+                size += _unknownFields.CalculateSize();
+              }
+              return size;
+            }
+
+            [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+            public void MergeFrom(PackedData other) {
+              if (other == null) {
+                return;
+              }
+              if (other.Data.Length != 0) {
+                Data = other.Data;
+              }
+              shape_.Add(other.shape_);
+              _unknownFields = pb::UnknownFieldSet.MergeFrom(_unknownFields, other._unknownFields);
+            }
+
+            [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+            public void MergeFrom(pb::CodedInputStream input) {
+              uint tag;
+              while ((tag = input.ReadTag()) != 0) {
+                switch(tag) {
+                  default:
+                    _unknownFields = pb::UnknownFieldSet.MergeFieldFrom(_unknownFields, input);
+                    break;
+                  case 10: {
+                    Data = input.ReadBytes();
+                    break;
+                  }
+                  case 18:
+                  case 16: {
+                    shape_.AddEntriesFrom(input, _repeated_shape_codec);
+                    break;
+                  }
+                }
+              }
+            }
+
+          }
+
         }
         #endregion
 
@@ -1628,11 +2213,14 @@ namespace Orrb {
 
   }
 
-  public sealed partial class UpdateRequest : pb::IMessage<UpdateRequest> {
-    private static readonly pb::MessageParser<UpdateRequest> _parser = new pb::MessageParser<UpdateRequest>(() => new UpdateRequest());
+  /// <summary>
+  /// Where the server spent the time on a batch (or streamed chunk), in seconds.
+  /// </summary>
+  public sealed partial class ServerTimings : pb::IMessage<ServerTimings> {
+    private static readonly pb::MessageParser<ServerTimings> _parser = new pb::MessageParser<ServerTimings>(() => new ServerTimings());
     private pb::UnknownFieldSet _unknownFields;
     [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
-    public static pb::MessageParser<UpdateRequest> Parser { get { return _parser; } }
+    public static pb::MessageParser<ServerTimings> Parser { get { return _parser; } }
 
     [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
     public static pbr::MessageDescriptor Descriptor {
@@ -1645,32 +2233,372 @@ namespace Orrb {
     }
 
     [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
-    public UpdateRequest() {
+    public ServerTimings() {
       OnConstruction();
     }
 
     partial void OnConstruction();
 
     [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
-    public UpdateRequest(UpdateRequest other) : this() {
-      components_ = other.components_.Clone();
+    public ServerTimings(ServerTimings other) : this() {
+      queueWait_ = other.queueWait_;
+      updateState_ = other.updateState_;
+      runComponents_ = other.runComponents_;
+      capture_ = other.capture_;
+      readback_ = other.readback_;
+      buildResponse_ = other.buildResponse_;
+      total_ = other.total_;
+      frames_ = other.frames_;
       _unknownFields = pb::UnknownFieldSet.Clone(other._unknownFields);
     }
 
     [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
-    public UpdateRequest Clone() {
-      return new UpdateRequest(this);
+    public ServerTimings Clone() {
+      return new ServerTimings(this);
     }
 
-    /// <summary>Field number for the "components" field.</summary>
-    public const int ComponentsFieldNumber = 1;
-    private static readonly pb::FieldCodec<global::Orrb.RendererComponent> _repeated_components_codec
-        = pb::FieldCodec.ForMessage(10, global::Orrb.RendererComponent.Parser);
-    private readonly pbc::RepeatedField<global::Orrb.RendererComponent> components_ = new pbc::RepeatedField<global::Orrb.RendererComponent>();
+    /// <summary>Field number for the "queue_wait" field.</summary>
+    public const int QueueWaitFieldNumber = 1;
+    private float queueWait_;
+    /// <summary>
+    /// From the request arrival, till the main loop picked it up (first chunk only).
+    /// </summary>
     [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
-    public pbc::RepeatedField<global::Orrb.RendererComponent> Components {
-      get { return components_; }
-    }
+    public float QueueWait {
+      get { return queueWait_; }
+      set {
+        queueWait_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "update_state" field.</summary>
+    public const int UpdateStateFieldNumber = 2;
+    private float updateState_;
+    /// <summary>
+    /// Setting the qpos, and running the renderer components (randomizers, trackers).
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public float UpdateState {
+      get { return updateState_; }
+      set {
+        updateState_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "run_components" field.</summary>
+    public const int RunComponentsFieldNumber = 3;
+    private float runComponents_;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public float RunComponents {
+      get { return runComponents_; }
+      set {
+        runComponents_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "capture" field.</summary>
+    public const int CaptureFieldNumber = 4;
+    private float capture_;
+    /// <summary>
+    /// Issuing the camera renders, and reading the render textures back from the GPU.
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public float Capture {
+      get { return capture_; }
+      set {
+        capture_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "readback" field.</summary>
+    public const int ReadbackFieldNumber = 5;
+    private float readback_;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public float Readback {
+      get { return readback_; }
+      set {
+        readback_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "build_response" field.</summary>
+    public const int BuildResponseFieldNumber = 6;
+    private float buildResponse_;
+    /// <summary>
+    /// Converting the images, and building the response message.
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public float BuildResponse {
+      get { return buildResponse_; }
+      set {
+        buildResponse_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "total" field.</summary>
+    public const int TotalFieldNumber = 7;
+    private float total_;
+    /// <summary>
+    /// From the start of the batch (or chunk) on the main loop, till its response was ready.
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public float Total {
+      get { return total_; }
+      set {
+        total_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "frames" field.</summary>
+    public const int FramesFieldNumber = 8;
+    private int frames_;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public int Frames {
+      get { return frames_; }
+      set {
+        frames_ = value;
+      }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public override bool Equals(object other) {
+      return Equals(other as ServerTimings);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public bool Equals(ServerTimings other) {
+      if (ReferenceEquals(other, null)) {
+        return false;
+      }
+      if (ReferenceEquals(other, this)) {
+        return true;
+      }
+      if (!pbc::ProtobufEqualityComparers.BitwiseSingleEqualityComparer.Equals(QueueWait, other.QueueWait)) return false;
+      if (!pbc::ProtobufEqualityComparers.BitwiseSingleEqualityComparer.Equals(UpdateState, other.UpdateState)) return false;
+      if (!pbc::ProtobufEqualityComparers.BitwiseSingleEqualityComparer.Equals(RunComponents, other.RunComponents)) return false;
+      if (!pbc::ProtobufEqualityComparers.BitwiseSingleEqualityComparer.Equals(Capture, other.Capture)) return false;
+      if (!pbc::ProtobufEqualityComparers.BitwiseSingleEqualityComparer.Equals(Readback, other.Readback)) return false;
+      if (!pbc::ProtobufEqualityComparers.BitwiseSingleEqualityComparer.Equals(BuildResponse, other.BuildResponse)) return false;
+      if (!pbc::ProtobufEqualityComparers.BitwiseSingleEqualityComparer.Equals(Total, other.Total)) return false;
+      if (Frames != other.Frames) return false;
+      return Equals(_unknownFields, other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public override int GetHashCode() {
+      int hash = 1;
+      if (QueueWait != 0F) hash ^= pbc::ProtobufEqualityComparers.BitwiseSingleEqualityComparer.GetHashCode(QueueWait);
+      if (UpdateState != 0F) hash ^= pbc::ProtobufEqualityComparers.BitwiseSingleEqualityComparer.GetHashCode(UpdateState);
+      if (RunComponents != 0F) hash ^= pbc::ProtobufEqualityComparers.BitwiseSingleEqualityComparer.GetHashCode(RunComponents);
+      if (Capture != 0F) hash ^= pbc::ProtobufEqualityComparers.BitwiseSingleEqualityComparer.GetHashCode(Capture);
+      if (Readback != 0F) hash ^= pbc::ProtobufEqualityComparers.BitwiseSingleEqualityComparer.GetHashCode(Readback);
+      if (BuildResponse != 0F) hash ^= pbc::ProtobufEqualityComparers.BitwiseSingleEqualityComparer.GetHashCode(BuildResponse);
+      if (Total != 0F) hash ^= pbc::ProtobufEqualityComparers.BitwiseSingleEqualityComparer.GetHashCode(Total);
+      if (Frames != 0) hash ^= Frames.GetHashCode();
+      if (_unknownFields != null) {
+        hash ^= _unknownFields.GetHashCode();
+      }
+      return hash;
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public override string ToString() {
+      return pb::JsonFormatter.ToDiagnosticString(this);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public void WriteTo(pb::CodedOutputStream output) {
+      if (QueueWait != 0F) {
+        output.WriteRawTag(13);
+        output.WriteFloat(QueueWait);
+      }
+      if (UpdateState != 0F) {
+        output.WriteRawTag(21);
+        output.WriteFloat(UpdateState);
+      }
+      if (RunComponents != 0F) {
+        output.WriteRawTag(29);
+        output.WriteFloat(RunComponents);
+      }
+      if (Capture != 0F) {
+        output.WriteRawTag(37);
+        output.WriteFloat(Capture);
+      }
+      if (Readback != 0F) {
+        output.WriteRawTag(45);
+        output.WriteFloat(Readback);
+      }
+      if (BuildResponse != 0F) {
+        output.WriteRawTag(53);
+        output.WriteFloat(BuildResponse);
+      }
+      if (Total != 0F) {
+        output.WriteRawTag(61);
+        output.WriteFloat(Total);
+      }
+      if (Frames != 0) {
+        output.WriteRawTag(64);
+        output.WriteInt32(Frames);
+      }
+      if (_unknownFields != null) {
+        _unknownFields.WriteTo(output);
+      }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public int CalculateSize() {
+      int size = 0;
+      if (QueueWait != 0F) {
+        size += 1 + 4;
+      }
+      if (UpdateState != 0F) {
+        size += 1 + 4;
+      }
+      if (RunComponents != 0F) {
+        size += 1 + 4;
+      }
+      if (Capture != 0F) {
+        size += 1 + 4;
+      }
+      if (Readback != 0F) {
+        size += 1 + 4;
+      }
+      if (BuildResponse != 0F) {
+        size += 1 + 4;
+      }
+      if (Total != 0F) {
+        size += 1 + 4;
+      }
+      if (Frames != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeInt32Size(Frames);
+      }
+      if (_unknownFields != null) {
+        size += _unknownFields.CalculateSize();
+      }
+      return size;
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public void MergeFrom(ServerTimings other) {
+      if (other == null) {
+        return;
+      }
+      if (other.QueueWait != 0F) {
+        QueueWait = other.QueueWait;
+      }
+      if (other.UpdateState != 0F) {
+        UpdateState = other.UpdateState;
+      }
+      if (other.RunComponents != 0F) {
+        RunComponents = other.RunComponents;
+      }
+      if (other.Capture != 0F) {
+        Capture = other.Capture;
+      }
+      if (other.Readback != 0F) {
+        Readback = other.Readback;
+      }
+      if (other.BuildResponse != 0F) {
+        BuildResponse = other.BuildResponse;
+      }
+      if (other.Total != 0F) {
+        Total = other.Total;
+      }
+      if (other.Frames != 0) {
+        Frames = other.Frames;
+      }
+      _unknownFields = pb::UnknownFieldSet.MergeFrom(_unknownFields, other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public void MergeFrom(pb::CodedInputStream input) {
+      uint tag;
+      while ((tag = input.ReadTag()) != 0) {
+        switch(tag) {
+          default:
+            _unknownFields = pb::UnknownFieldSet.MergeFieldFrom(_unknownFields, input);
+            break;
+          case 13: {
+            QueueWait = input.ReadFloat();
+            break;
+          }
+          case 21: {
+            UpdateState = input.ReadFloat();
+            break;
+          }
+          case 29: {
+            RunComponents = input.ReadFloat();
+            break;
+          }
+          case 37: {
+            Capture = input.ReadFloat();
+            break;
+          }
+          case 45: {
+            Readback = input.ReadFloat();
+            break;
+          }
+          case 53: {
+            BuildResponse = input.ReadFloat();
+            break;
+          }
+          case 61: {
+            Total = input.ReadFloat();
+            break;
+          }
+          case 64: {
+            Frames = input.ReadInt32();
+            break;
+          }
+        }
+      }
+    }
+
+  }
+
+  public sealed partial class UpdateRequest : pb::IMessage<UpdateRequest> {
+    private static readonly pb::MessageParser<UpdateRequest> _parser = new pb::MessageParser<UpdateRequest>(() => new UpdateRequest());
+    private pb::UnknownFieldSet _unknownFields;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public static pb::MessageParser<UpdateRequest> Parser { get { return _parser; } }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public static pbr::MessageDescriptor Descriptor {
+      get { return global::Orrb.RenderServiceReflection.Descriptor.MessageTypes[3]; }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    pbr::MessageDescriptor pb::IMessage.Descriptor {
+      get { return Descriptor; }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public UpdateRequest() {
+      OnConstruction();
+    }
+
+    partial void OnConstruction();
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public UpdateRequest(UpdateRequest other) : this() {
+      components_ = other.components_.Clone();
+      _unknownFields = pb::UnknownFieldSet.Clone(other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public UpdateRequest Clone() {
+      return new UpdateRequest(this);
+    }
+
+    /// <summary>Field number for the "components" field.</summary>
+    public const int ComponentsFieldNumber = 1;
+    private static readonly pb::FieldCodec<global::Orrb.RendererComponent> _repeated_components_codec
+        = pb::FieldCodec.ForMessage(10, global::Orrb.RendererComponent.Parser);
+    private readonly pbc::RepeatedField<global::Orrb.RendererComponent> components_ = new pbc::RepeatedField<global::Orrb.RendererComponent>();
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public pbc::RepeatedField<global::Orrb.RendererComponent> Components {
+      get { return components_; }
+    }
 
     [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
     public override bool Equals(object other) {
@@ -1757,7 +2685,7 @@ namespace Orrb {
 
     [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
     public static pbr::MessageDescriptor Descriptor {
-      get { return global::Orrb.RenderServiceReflection.Descriptor.MessageTypes[3]; }
+      get { return global::Orrb.RenderServiceReflection.Descriptor.MessageTypes[4]; }
     }
 
     [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
@@ -1870,6 +2798,858 @@ namespace Orrb {
 
   }
 
+  public sealed partial class HealthRequest : pb::IMessage<HealthRequest> {
+    private static readonly pb::MessageParser<HealthRequest> _parser = new pb::MessageParser<HealthRequest>(() => new HealthRequest());
+    private pb::UnknownFieldSet _unknownFields;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public static pb::MessageParser<HealthRequest> Parser { get { return _parser; } }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public static pbr::MessageDescriptor Descriptor {
+      get { return global::Orrb.RenderServiceReflection.Descriptor.MessageTypes[5]; }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    pbr::MessageDescriptor pb::IMessage.Descriptor {
+      get { return Descriptor; }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public HealthRequest() {
+      OnConstruction();
+    }
+
+    partial void OnConstruction();
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public HealthRequest(HealthRequest other) : this() {
+      _unknownFields = pb::UnknownFieldSet.Clone(other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public HealthRequest Clone() {
+      return new HealthRequest(this);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public override bool Equals(object other) {
+      return Equals(other as HealthRequest);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public bool Equals(HealthRequest other) {
+      if (ReferenceEquals(other, null)) {
+        return false;
+      }
+      if (ReferenceEquals(other, this)) {
+        return true;
+      }
+      return Equals(_unknownFields, other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public override int GetHashCode() {
+      int hash = 1;
+      if (_unknownFields != null) {
+        hash ^= _unknownFields.GetHashCode();
+      }
+      return hash;
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public override string ToString() {
+      return pb::JsonFormatter.ToDiagnosticString(this);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public void WriteTo(pb::CodedOutputStream output) {
+      if (_unknownFields != null) {
+        _unknownFields.WriteTo(output);
+      }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public int CalculateSize() {
+      int size = 0;
+      if (_unknownFields != null) {
+        size += _unknownFields.CalculateSize();
+      }
+      return size;
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public void MergeFrom(HealthRequest other) {
+      if (other == null) {
+        return;
+      }
+      _unknownFields = pb::UnknownFieldSet.MergeFrom(_unknownFields, other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public void MergeFrom(pb::CodedInputStream input) {
+      uint tag;
+      while ((tag = input.ReadTag()) != 0) {
+        switch(tag) {
+          default:
+            _unknownFields = pb::UnknownFieldSet.MergeFieldFrom(_unknownFields, input);
+            break;
+        }
+      }
+    }
+
+  }
+
+  public sealed partial class HealthResponse : pb::IMessage<HealthResponse> {
+    private static readonly pb::MessageParser<HealthResponse> _parser = new pb::MessageParser<HealthResponse>(() => new HealthResponse());
+    private pb::UnknownFieldSet _unknownFields;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public static pb::MessageParser<HealthResponse> Parser { get { return _parser; } }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public static pbr::MessageDescriptor Descriptor {
+      get { return global::Orrb.RenderServiceReflection.Descriptor.MessageTypes[6]; }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    pbr::MessageDescriptor pb::IMessage.Descriptor {
+      get { return Descriptor; }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public HealthResponse() {
+      OnConstruction();
+    }
+
+    partial void OnConstruction();
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public HealthResponse(HealthResponse other) : this() {
+      serving_ = other.serving_;
+      queuedWorkloads_ = other.queuedWorkloads_;
+      _unknownFields = pb::UnknownFieldSet.Clone(other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public HealthResponse Clone() {
+      return new HealthResponse(this);
+    }
+
+    /// <summary>Field number for the "serving" field.</summary>
+    public const int ServingFieldNumber = 1;
+    private bool serving_;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public bool Serving {
+      get { return serving_; }
+      set {
+        serving_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "queued_workloads" field.</summary>
+    public const int QueuedWorkloadsFieldNumber = 2;
+    private int queuedWorkloads_;
+    /// <summary>
+    /// Render batch and update requests waiting for the main loop.
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public int QueuedWorkloads {
+      get { return queuedWorkloads_; }
+      set {
+        queuedWorkloads_ = value;
+      }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public override bool Equals(object other) {
+      return Equals(other as HealthResponse);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public bool Equals(HealthResponse other) {
+      if (ReferenceEquals(other, null)) {
+        return false;
+      }
+      if (ReferenceEquals(other, this)) {
+        return true;
+      }
+      if (Serving != other.Serving) return false;
+      if (QueuedWorkloads != other.QueuedWorkloads) return false;
+      return Equals(_unknownFields, other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public override int GetHashCode() {
+      int hash = 1;
+      if (Serving != false) hash ^= Serving.GetHashCode();
+      if (QueuedWorkloads != 0) hash ^= QueuedWorkloads.GetHashCode();
+      if (_unknownFields != null) {
+        hash ^= _unknownFields.GetHashCode();
+      }
+      return hash;
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public override string ToString() {
+      return pb::JsonFormatter.ToDiagnosticString(this);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public void WriteTo(pb::CodedOutputStream output) {
+      if (Serving != false) {
+        output.WriteRawTag(8);
+        output.WriteBool(Serving);
+      }
+      if (QueuedWorkloads != 0) {
+        output.WriteRawTag(16);
+        output.WriteInt32(QueuedWorkloads);
+      }
+      if (_unknownFields != null) {
+        _unknownFields.WriteTo(output);
+      }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public int CalculateSize() {
+      int size = 0;
+      if (Serving != false) {
+        size += 1 + 1;
+      }
+      if (QueuedWorkloads != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeInt32Size(QueuedWorkloads);
+      }
+      if (_unknownFields != null) {
+        size += _unknownFields.CalculateSize();
+      }
+      return size;
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public void MergeFrom(HealthResponse other) {
+      if (other == null) {
+        return;
+      }
+      if (other.Serving != false) {
+        Serving = other.Serving;
+      }
+      if (other.QueuedWorkloads != 0) {
+        QueuedWorkloads = other.QueuedWorkloads;
+      }
+      _unknownFields = pb::UnknownFieldSet.MergeFrom(_unknownFields, other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public void MergeFrom(pb::CodedInputStream input) {
+      uint tag;
+      while ((tag = input.ReadTag()) != 0) {
+        switch(tag) {
+          default:
+            _unknownFields = pb::UnknownFieldSet.MergeFieldFrom(_unknownFields, input);
+            break;
+          case 8: {
+            Serving = input.ReadBool();
+            break;
+          }
+          case 16: {
+            QueuedWorkloads = input.ReadInt32();
+            break;
+          }
+        }
+      }
+    }
+
+  }
+
+  public sealed partial class ComponentStatsRequest : pb::IMessage<ComponentStatsRequest> {
+    private static readonly pb::MessageParser<ComponentStatsRequest> _parser = new pb::MessageParser<ComponentStatsRequest>(() => new ComponentStatsRequest());
+    private pb::UnknownFieldSet _unknownFields;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public static pb::MessageParser<ComponentStatsRequest> Parser { get { return _parser; } }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public static pbr::MessageDescriptor Descriptor {
+      get { return global::Orrb.RenderServiceReflection.Descriptor.MessageTypes[7]; }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    pbr::MessageDescriptor pb::IMessage.Descriptor {
+      get { return Descriptor; }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public ComponentStatsRequest() {
+      OnConstruction();
+    }
+
+    partial void OnConstruction();
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public ComponentStatsRequest(ComponentStatsRequest other) : this() {
+      setProfiling_ = other.setProfiling_;
+      profiling_ = other.profiling_;
+      reset_ = other.reset_;
+      _unknownFields = pb::UnknownFieldSet.Clone(other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public ComponentStatsRequest Clone() {
+      return new ComponentStatsRequest(this);
+    }
+
+    /// <summary>Field number for the "set_profiling" field.</summary>
+    public const int SetProfilingFieldNumber = 1;
+    private bool setProfiling_;
+    /// <summary>
+    /// Turn the profiling to the profiling value, otherwise it is left as it is.
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public bool SetProfiling {
+      get { return setProfiling_; }
+      set {
+        setProfiling_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "profiling" field.</summary>
+    public const int ProfilingFieldNumber = 2;
+    private bool profiling_;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public bool Profiling {
+      get { return profiling_; }
+      set {
+        profiling_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "reset" field.</summary>
+    public const int ResetFieldNumber = 3;
+    private bool reset_;
+    /// <summary>
+    /// Clear the stats, after they are returned.
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public bool Reset {
+      get { return reset_; }
+      set {
+        reset_ = value;
+      }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public override bool Equals(object other) {
+      return Equals(other as ComponentStatsRequest);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public bool Equals(ComponentStatsRequest other) {
+      if (ReferenceEquals(other, null)) {
+        return false;
+      }
+      if (ReferenceEquals(other, this)) {
+        return true;
+      }
+      if (SetProfiling != other.SetProfiling) return false;
+      if (Profiling != other.Profiling) return false;
+      if (Reset != other.Reset) return false;
+      return Equals(_unknownFields, other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public override int GetHashCode() {
+      int hash = 1;
+      if (SetProfiling != false) hash ^= SetProfiling.GetHashCode();
+      if (Profiling != false) hash ^= Profiling.GetHashCode();
+      if (Reset != false) hash ^= Reset.GetHashCode();
+      if (_unknownFields != null) {
+        hash ^= _unknownFields.GetHashCode();
+      }
+      return hash;
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public override string ToString() {
+      return pb::JsonFormatter.ToDiagnosticString(this);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public void WriteTo(pb::CodedOutputStream output) {
+      if (SetProfiling != false) {
+        output.WriteRawTag(8);
+        output.WriteBool(SetProfiling);
+      }
+      if (Profiling != false) {
+        output.WriteRawTag(16);
+        output.WriteBool(Profiling);
+      }
+      if (Reset != false) {
+        output.WriteRawTag(24);
+        output.WriteBool(Reset);
+      }
+      if (_unknownFields != null) {
+        _unknownFields.WriteTo(output);
+      }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public int CalculateSize() {
+      int size = 0;
+      if (SetProfiling != false) {
+        size += 1 + 1;
+      }
+      if (Profiling != false) {
+        size += 1 + 1;
+      }
+      if (Reset != false) {
+        size += 1 + 1;
+      }
+      if (_unknownFields != null) {
+        size += _unknownFields.CalculateSize();
+      }
+      return size;
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public void MergeFrom(ComponentStatsRequest other) {
+      if (other == null) {
+        return;
+      }
+      if (other.SetProfiling != false) {
+        SetProfiling = other.SetProfiling;
+      }
+      if (other.Profiling != false) {
+        Profiling = other.Profiling;
+      }
+      if (other.Reset != false) {
+        Reset = other.Reset;
+      }
+      _unknownFields = pb::UnknownFieldSet.MergeFrom(_unknownFields, other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public void MergeFrom(pb::CodedInputStream input) {
+      uint tag;
+      while ((tag = input.ReadTag()) != 0) {
+        switch(tag) {
+          default:
+            _unknownFields = pb::UnknownFieldSet.MergeFieldFrom(_unknownFields, input);
+            break;
+          case 8: {
+            SetProfiling = input.ReadBool();
+            break;
+          }
+          case 16: {
+            Profiling = input.ReadBool();
+            break;
+          }
+          case 24: {
+            Reset = input.ReadBool();
+            break;
+          }
+        }
+      }
+    }
+
+  }
+
+  public sealed partial class ComponentStatsResponse : pb::IMessage<ComponentStatsResponse> {
+    private static readonly pb::MessageParser<ComponentStatsResponse> _parser = new pb::MessageParser<ComponentStatsResponse>(() => new ComponentStatsResponse());
+    private pb::UnknownFieldSet _unknownFields;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public static pb::MessageParser<ComponentStatsResponse> Parser { get { return _parser; } }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public static pbr::MessageDescriptor Descriptor {
+      get { return global::Orrb.RenderServiceReflection.Descriptor.MessageTypes[8]; }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    pbr::MessageDescriptor pb::IMessage.Descriptor {
+      get { return Descriptor; }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public ComponentStatsResponse() {
+      OnConstruction();
+    }
+
+    partial void OnConstruction();
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public ComponentStatsResponse(ComponentStatsResponse other) : this() {
+      profiling_ = other.profiling_;
+      components_ = other.components_.Clone();
+      _unknownFields = pb::UnknownFieldSet.Clone(other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public ComponentStatsResponse Clone() {
+      return new ComponentStatsResponse(this);
+    }
+
+    /// <summary>Field number for the "profiling" field.</summary>
+    public const int ProfilingFieldNumber = 1;
+    private bool profiling_;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public bool Profiling {
+      get { return profiling_; }
+      set {
+        profiling_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "components" field.</summary>
+    public const int ComponentsFieldNumber = 2;
+    private static readonly pb::FieldCodec<global::Orrb.ComponentStatsResponse.Types.ComponentStats> _repeated_components_codec
+        = pb::FieldCodec.ForMessage(18, global::Orrb.ComponentStatsResponse.Types.ComponentStats.Parser);
+    private readonly pbc::RepeatedField<global::Orrb.ComponentStatsResponse.Types.ComponentStats> components_ = new pbc::RepeatedField<global::Orrb.ComponentStatsResponse.Types.ComponentStats>();
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public pbc::RepeatedField<global::Orrb.ComponentStatsResponse.Types.ComponentStats> Components {
+      get { return components_; }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public override bool Equals(object other) {
+      return Equals(other as ComponentStatsResponse);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public bool Equals(ComponentStatsResponse other) {
+      if (ReferenceEquals(other, null)) {
+        return false;
+      }
+      if (ReferenceEquals(other, this)) {
+        return true;
+      }
+      if (Profiling != other.Profiling) return false;
+      if(!components_.Equals(other.components_)) return false;
+      return Equals(_unknownFields, other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public override int GetHashCode() {
+      int hash = 1;
+      if (Profiling != false) hash ^= Profiling.GetHashCode();
+      hash ^= components_.GetHashCode();
+      if (_unknownFields != null) {
+        hash ^= _unknownFields.GetHashCode();
+      }
+      return hash;
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public override string ToString() {
+      return pb::JsonFormatter.ToDiagnosticString(this);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public void WriteTo(pb::CodedOutputStream output) {
+      if (Profiling != false) {
+        output.WriteRawTag(8);
+        output.WriteBool(Profiling);
+      }
+      components_.WriteTo(output, _repeated_components_codec);
+      if (_unknownFields != null) {
+        _unknownFields.WriteTo(output);
+      }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public int CalculateSize() {
+      int size = 0;
+      if (Profiling != false) {
+        size += 1 + 1;
+      }
+      size += components_.CalculateSize(_repeated_components_codec);
+      if (_unknownFields != null) {
+        size += _unknownFields.CalculateSize();
+      }
+      return size;
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public void MergeFrom(ComponentStatsResponse other) {
+      if (other == null) {
+        return;
+      }
+      if (other.Profiling != false) {
+        Profiling = other.Profiling;
+      }
+      components_.Add(other.components_);
+      _unknownFields = pb::UnknownFieldSet.MergeFrom(_unknownFields, other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public void MergeFrom(pb::CodedInputStream input) {
+      uint tag;
+      while ((tag = input.ReadTag()) != 0) {
+        switch(tag) {
+          default:
+            _unknownFields = pb::UnknownFieldSet.MergeFieldFrom(_unknownFields, input);
+            break;
+          case 8: {
+            Profiling = input.ReadBool();
+            break;
+          }
+          case 18: {
+            components_.AddEntriesFrom(input, _repeated_components_codec);
+            break;
+          }
+        }
+      }
+    }
+
+    #region Nested types
+    /// <summary>Container for nested types declared in the ComponentStatsResponse message type.</summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    public static partial class Types {
+      /// <summary>
+      /// The RunComponent calls of one component, while profiling.
+      /// </summary>
+      public sealed partial class ComponentStats : pb::IMessage<ComponentStats> {
+        private static readonly pb::MessageParser<ComponentStats> _parser = new pb::MessageParser<ComponentStats>(() => new ComponentStats());
+        private pb::UnknownFieldSet _unknownFields;
+        [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+        public static pb::MessageParser<ComponentStats> Parser { get { return _parser; } }
+
+        [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+        public static pbr::MessageDescriptor Descriptor {
+          get { return global::Orrb.ComponentStatsResponse.Descriptor.NestedTypes[0]; }
+        }
+
+        [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+        pbr::MessageDescriptor pb::IMessage.Descriptor {
+          get { return Descriptor; }
+        }
+
+        [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+        public ComponentStats() {
+          OnConstruction();
+        }
+
+        partial void OnConstruction();
+
+        [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+        public ComponentStats(ComponentStats other) : this() {
+          name_ = other.name_;
+          type_ = other.type_;
+          calls_ = other.calls_;
+          totalSeconds_ = other.totalSeconds_;
+          maxSeconds_ = other.maxSeconds_;
+          _unknownFields = pb::UnknownFieldSet.Clone(other._unknownFields);
+        }
+
+        [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+        public ComponentStats Clone() {
+          return new ComponentStats(this);
+        }
+
+        /// <summary>Field number for the "name" field.</summary>
+        public const int NameFieldNumber = 1;
+        private string name_ = "";
+        [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+        public string Name {
+          get { return name_; }
+          set {
+            name_ = pb::ProtoPreconditions.CheckNotNull(value, "value");
+          }
+        }
+
+        /// <summary>Field number for the "type" field.</summary>
+        public const int TypeFieldNumber = 2;
+        private string type_ = "";
+        [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+        public string Type {
+          get { return type_; }
+          set {
+            type_ = pb::ProtoPreconditions.CheckNotNull(value, "value");
+          }
+        }
+
+        /// <summary>Field number for the "calls" field.</summary>
+        public const int CallsFieldNumber = 3;
+        private long calls_;
+        [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+        public long Calls {
+          get { return calls_; }
+          set {
+            calls_ = value;
+          }
+        }
+
+        /// <summary>Field number for the "total_seconds" field.</summary>
+        public const int TotalSecondsFieldNumber = 4;
+        private double totalSeconds_;
+        [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+        public double TotalSeconds {
+          get { return totalSeconds_; }
+          set {
+            totalSeconds_ = value;
+          }
+        }
+
+        /// <summary>Field number for the "max_seconds" field.</summary>
+        public const int MaxSecondsFieldNumber = 5;
+        private double maxSeconds_;
+        [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+        public double MaxSeconds {
+          get { return maxSeconds_; }
+          set {
+            maxSeconds_ = value;
+          }
+        }
+
+        [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+        public override bool Equals(object other) {
+          return Equals(other as ComponentStats);
+        }
+
+        [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+        public bool Equals(ComponentStats other) {
+          if (ReferenceEquals(other, null)) {
+            return false;
+          }
+          if (ReferenceEquals(other, this)) {
+            return true;
+          }
+          if (Name != other.Name) return false;
+          if (Type != other.Type) return false;
+          if (Calls != other.Calls) return false;
+          if (!pbc::ProtobufEqualityComparers.BitwiseDoubleEqualityComparer.Equals(TotalSeconds, other.TotalSeconds)) return false;
+          if (!pbc::ProtobufEqualityComparers.BitwiseDoubleEqualityComparer.Equals(MaxSeconds, other.MaxSeconds)) return false;
+          return Equals(_unknownFields, other._unknownFields);
+        }
+
+        [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+        public override int GetHashCode() {
+          int hash = 1;
+          if (Name.Length != 0) hash ^= Name.GetHashCode();
+          if (Type.Length != 0) hash ^= Type.GetHashCode();
+          if (Calls != 0L) hash ^= Calls.GetHashCode();
+          if (TotalSeconds != 0D) hash ^= pbc::ProtobufEqualityComparers.BitwiseDoubleEqualityComparer.GetHashCode(TotalSeconds);
+          if (MaxSeconds != 0D) hash ^= pbc::ProtobufEqualityComparers.BitwiseDoubleEqualityComparer.GetHashCode(MaxSeconds);
+          if (_unknownFields != null) {
+            hash ^= _unknownFields.GetHashCode();
+          }
+          return hash;
+        }
+
+        [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+        public override string ToString() {
+          return pb::JsonFormatter.ToDiagnosticString(this);
+        }
+
+        [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+        public void WriteTo(pb::CodedOutputStream output) {
+          if (Name.Length != 0) {
+            output.WriteRawTag(10);
+            output.WriteString(Name);
+          }
+          if (Type.Length != 0) {
+            output.WriteRawTag(18);
+            output.WriteString(Type);
+          }
+          if (Calls != 0L) {
+            output.WriteRawTag(24);
+            output.WriteInt64(Calls);
+          }
+          if (TotalSeconds != 0D) {
+            output.WriteRawTag(33);
+            output.WriteDouble(TotalSeconds);
+          }
+          if (MaxSeconds != 0D) {
+            output.WriteRawTag(41);
+            output.WriteDouble(MaxSeconds);
+          }
+          if (_unknownFields != null) {
+            _unknownFields.WriteTo(output);
+          }
+        }
+
+        [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+        public int CalculateSize() {
+          int size = 0;
+          if (Name.Length != 0) {
+            size += 1 + pb::CodedOutputStream.ComputeStringSize(Name);
+          }
+          if (Type.Length != 0) {
+            size += 1 + pb::CodedOutputStream.ComputeStringSize(Type);
+          }
+          if (Calls != 0L) {
+            size += 1 + pb::CodedOutputStream.ComputeInt64Size(Calls);
+          }
+          if (TotalSeconds != 0D) {
+            size += 1 + 8;
+          }
+          if (MaxSeconds != 0D) {
+            size += 1 + 8;
+          }
+          if (_unknownFields != null) {
+            size += _unknownFields.CalculateSize();
+          }
+          return size;
+        }
+
+        [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+        public void MergeFrom(ComponentStats other) {
+          if (other == null) {
+            return;
+          }
+          if (other.Name.Length != 0) {
+            Name = other.Name;
+          }
+          if (other.Type.Length != 0) {
+            Type = other.Type;
+          }
+          if (other.Calls != 0L) {
+            Calls = other.Calls;
+          }
+          if (other.TotalSeconds != 0D) {
+            TotalSeconds = other.TotalSeconds;
+          }
+          if (other.MaxSeconds != 0D) {
+            MaxSeconds = other.MaxSeconds;
+          }
+          _unknownFields = pb::UnknownFieldSet.MergeFrom(_unknownFields, other._unknownFields);
+        }
+
+        [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+        public void MergeFrom(pb::CodedInputStream input) {
+          uint tag;
+          while ((tag = input.ReadTag()) != 0) {
+            switch(tag) {
+              default:
+                _unknownFields = pb::UnknownFieldSet.MergeFieldFrom(_unknownFields, input);
+                break;
+              case 10: {
+                Name = input.ReadString();
+                break;
+              }
+              case 18: {
+                Type = input.ReadString();
+                break;
+              }
+              case 24: {
+                Calls = input.ReadInt64();
+                break;
+              }
+              case 33: {
+                TotalSeconds = input.ReadDouble();
+                break;
+              }
+              case 41: {
+                MaxSeconds = input.ReadDouble();
+                break;
+              }
+            }
+          }
+        }
+
+      }
+
+    }
+    #endregion
+
+  }
+
   #endregion
 
 }
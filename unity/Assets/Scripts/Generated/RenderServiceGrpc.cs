@@ -16,6 +16,10 @@ namespace Orrb {
     static readonly grpc::Marshaller<global::Orrb.RenderBatchResponse> __Marshaller_orrb_RenderBatchResponse = grpc::Marshallers.Create((arg) => global::Google.Protobuf.MessageExtensions.ToByteArray(arg), global::Orrb.RenderBatchResponse.Parser.ParseFrom);
     static readonly grpc::Marshaller<global::Orrb.UpdateRequest> __Marshaller_orrb_UpdateRequest = grpc::Marshallers.Create((arg) => global::Google.Protobuf.MessageExtensions.ToByteArray(arg), global::Orrb.UpdateRequest.Parser.ParseFrom);
     static readonly grpc::Marshaller<global::Orrb.UpdateResponse> __Marshaller_orrb_UpdateResponse = grpc::Marshallers.Create((arg) => global::Google.Protobuf.MessageExtensions.ToByteArray(arg), global::Orrb.UpdateResponse.Parser.ParseFrom);
+    static readonly grpc::Marshaller<global::Orrb.HealthRequest> __Marshaller_orrb_HealthRequest = grpc::Marshallers.Create((arg) => global::Google.Protobuf.MessageExtensions.ToByteArray(arg), global::Orrb.HealthRequest.Parser.ParseFrom);
+    static readonly grpc::Marshaller<global::Orrb.HealthResponse> __Marshaller_orrb_HealthResponse = grpc::Marshallers.Create((arg) => global::Google.Protobuf.MessageExtensions.ToByteArray(arg), global::Orrb.HealthResponse.Parser.ParseFrom);
+    static readonly grpc::Marshaller<global::Orrb.ComponentStatsRequest> __Marshaller_orrb_ComponentStatsRequest = grpc::Marshallers.Create((arg) => global::Google.Protobuf.MessageExtensions.ToByteArray(arg), global::Orrb.ComponentStatsRequest.Parser.ParseFrom);
+    static readonly grpc::Marshaller<global::Orrb.ComponentStatsResponse> __Marshaller_orrb_ComponentStatsResponse = grpc::Marshallers.Create((arg) => global::Google.Protobuf.MessageExtensions.ToByteArray(arg), global::Orrb.ComponentStatsResponse.Parser.ParseFrom);
 
     static readonly grpc::Method<global::Orrb.RenderBatchRequest, global::Orrb.RenderBatchResponse> __Method_RenderBatch = new grpc::Method<global::Orrb.RenderBatchRequest, global::Orrb.RenderBatchResponse>(
         grpc::MethodType.Unary,
@@ -24,6 +28,13 @@ namespace Orrb {
         __Marshaller_orrb_RenderBatchRequest,
         __Marshaller_orrb_RenderBatchResponse);
 
+    static readonly grpc::Method<global::Orrb.RenderBatchRequest, global::Orrb.RenderBatchResponse> __Method_RenderBatchStream = new grpc::Method<global::Orrb.RenderBatchRequest, global::Orrb.RenderBatchResponse>(
+        grpc::MethodType.ServerStreaming,
+        __ServiceName,
+        "RenderBatchStream",
+        __Marshaller_orrb_RenderBatchRequest,
+        __Marshaller_orrb_RenderBatchResponse);
+
     static readonly grpc::Method<global::Orrb.UpdateRequest, global::Orrb.UpdateResponse> __Method_Update = new grpc::Method<global::Orrb.UpdateRequest, global::Orrb.UpdateResponse>(
         grpc::MethodType.Unary,
         __ServiceName,
@@ -31,6 +42,20 @@ namespace Orrb {
         __Marshaller_orrb_UpdateRequest,
         __Marshaller_orrb_UpdateResponse);
 
+    static readonly grpc::Method<global::Orrb.HealthRequest, global::Orrb.HealthResponse> __Method_Health = new grpc::Method<global::Orrb.HealthRequest, global::Orrb.HealthResponse>(
+        grpc::MethodType.Unary,
+        __ServiceName,
+        "Health",
+        __Marshaller_orrb_HealthRequest,
+        __Marshaller_orrb_HealthResponse);
+
+    static readonly grpc::Method<global::Orrb.ComponentStatsRequest, global::Orrb.ComponentStatsResponse> __Method_ComponentStats = new grpc::Method<global::Orrb.ComponentStatsRequest, global::Orrb.ComponentStatsResponse>(
+        grpc::MethodType.Unary,
+        __ServiceName,
+        "ComponentStats",
+        __Marshaller_orrb_ComponentStatsRequest,
+        __Marshaller_orrb_ComponentStatsResponse);
+
     /// <summary>Service descriptor</summary>
     public static global::Google.Protobuf.Reflection.ServiceDescriptor Descriptor
     {
@@ -45,11 +70,45 @@ namespace Orrb {
         throw new grpc::RpcException(new grpc::Status(grpc::StatusCode.Unimplemented, ""));
       }
 
+      /// <summary>
+      /// Renders the batch in chunks and streams them back as they become ready.
+      /// </summary>
+      /// <param name="request">The request received from the client.</param>
+      /// <param name="responseStream">Used for sending responses back to the client.</param>
+      /// <param name="context">The context of the server-side call handler being invoked.</param>
+      /// <returns>A task indicating completion of the handler.</returns>
+      public virtual global::System.Threading.Tasks.Task RenderBatchStream(global::Orrb.RenderBatchRequest request, grpc::IServerStreamWriter<global::Orrb.RenderBatchResponse> responseStream, grpc::ServerCallContext context)
+      {
+        throw new grpc::RpcException(new grpc::Status(grpc::StatusCode.Unimplemented, ""));
+      }
+
       public virtual global::System.Threading.Tasks.Task<global::Orrb.UpdateResponse> Update(global::Orrb.UpdateRequest request, grpc::ServerCallContext context)
       {
         throw new grpc::RpcException(new grpc::Status(grpc::StatusCode.Unimplemented, ""));
       }
 
+      /// <summary>
+      /// Answered right away, bypassing the workload queue, to probe if the server is alive.
+      /// </summary>
+      /// <param name="request">The request received from the client.</param>
+      /// <param name="context">The context of the server-side call handler being invoked.</param>
+      /// <returns>The response to send back to the client (wrapped by a task).</returns>
+      public virtual global::System.Threading.Tasks.Task<global::Orrb.HealthResponse> Health(global::Orrb.HealthRequest request, grpc::ServerCallContext context)
+      {
+        throw new grpc::RpcException(new grpc::Status(grpc::StatusCode.Unimplemented, ""));
+      }
+
+      /// <summary>
+      /// Turns the per component profiling on or off, and returns the stats collected so far.
+      /// </summary>
+      /// <param name="request">The request received from the client.</param>
+      /// <param name="context">The context of the server-side call handler being invoked.</param>
+      /// <returns>The response to send back to the client (wrapped by a task).</returns>
+      public virtual global::System.Threading.Tasks.Task<global::Orrb.ComponentStatsResponse> ComponentStats(global::Orrb.ComponentStatsRequest request, grpc::ServerCallContext context)
+      {
+        throw new grpc::RpcException(new grpc::Status(grpc::StatusCode.Unimplemented, ""));
+      }
+
     }
 
     /// <summary>Client for RenderService</summary>
@@ -91,6 +150,28 @@ namespace Orrb {
       {
         return CallInvoker.AsyncUnaryCall(__Method_RenderBatch, null, options, request);
       }
+      /// <summary>
+      /// Renders the batch in chunks and streams them back as they become ready.
+      /// </summary>
+      /// <param name="request">The request to send to the server.</param>
+      /// <param name="headers">The initial metadata to send with the call. This parameter is optional.</param>
+      /// <param name="deadline">An optional deadline for the call. The call will be cancelled if deadline is hit.</param>
+      /// <param name="cancellationToken">An optional token for canceling the call.</param>
+      /// <returns>The call object.</returns>
+      public virtual grpc::AsyncServerStreamingCall<global::Orrb.RenderBatchResponse> RenderBatchStream(global::Orrb.RenderBatchRequest request, grpc::Metadata headers = null, global::System.DateTime? deadline = null, global::System.Threading.CancellationToken cancellationToken = default(global::System.Threading.CancellationToken))
+      {
+        return RenderBatchStream(request, new grpc::CallOptions(headers, deadline, cancellationToken));
+      }
+      /// <summary>
+      /// Renders the batch in chunks and streams them back as they become ready.
+      /// </summary>
+      /// <param name="request">The request to send to the server.</param>
+      /// <param name="options">The options for the call.</param>
+      /// <returns>The call object.</returns>
+      public virtual grpc::AsyncServerStreamingCall<global::Orrb.RenderBatchResponse> RenderBatchStream(global::Orrb.RenderBatchRequest request, grpc::CallOptions options)
+      {
+        return CallInvoker.AsyncServerStreamingCall(__Method_RenderBatchStream, null, options, request);
+      }
       public virtual global::Orrb.UpdateResponse Update(global::Orrb.UpdateRequest request, grpc::Metadata headers = null, global::System.DateTime? deadline = null, global::System.Threading.CancellationToken cancellationToken = default(global::System.Threading.CancellationToken))
       {
         return Update(request, new grpc::CallOptions(headers, deadline, cancellationToken));
@@ -107,6 +188,44 @@ namespace Orrb {
       {
         return CallInvoker.AsyncUnaryCall(__Method_Update, null, options, request);
       }
+      /// <summary>
+      /// Answered right away, bypassing the workload queue, to probe if the server is alive.
+      /// </summary>
+      public virtual global::Orrb.HealthResponse Health(global::Orrb.HealthRequest request, grpc::Metadata headers = null, global::System.DateTime? deadline = null, global::System.Threading.CancellationToken cancellationToken = default(global::System.Threading.CancellationToken))
+      {
+        return Health(request, new grpc::CallOptions(headers, deadline, cancellationToken));
+      }
+      public virtual global::Orrb.HealthResponse Health(global::Orrb.HealthRequest request, grpc::CallOptions options)
+      {
+        return CallInvoker.BlockingUnaryCall(__Method_Health, null, options, request);
+      }
+      public virtual grpc::AsyncUnaryCall<global::Orrb.HealthResponse> HealthAsync(global::Orrb.HealthRequest request, grpc::Metadata headers = null, global::System.DateTime? deadline = null, global::System.Threading.CancellationToken cancellationToken = default(global::System.Threading.CancellationToken))
+      {
+        return HealthAsync(request, new grpc::CallOptions(headers, deadline, cancellationToken));
+      }
+      public virtual grpc::AsyncUnaryCall<global::Orrb.HealthResponse> HealthAsync(global::Orrb.HealthRequest request, grpc::CallOptions options)
+      {
+        return CallInvoker.AsyncUnaryCall(__Method_Health, null, options, request);
+      }
+      /// <summary>
+      /// Turns the per component profiling on or off, and returns the stats collected so far.
+      /// </summary>
+      public virtual global::Orrb.ComponentStatsResponse ComponentStats(global::Orrb.ComponentStatsRequest request, grpc::Metadata headers = null, global::System.DateTime? deadline = null, global::System.Threading.CancellationToken cancellationToken = default(global::System.Threading.CancellationToken))
+      {
+        return ComponentStats(request, new grpc::CallOptions(headers, deadline, cancellationToken));
+      }
+      public virtual global::Orrb.ComponentStatsResponse ComponentStats(global::Orrb.ComponentStatsRequest request, grpc::CallOptions options)
+      {
+        return CallInvoker.BlockingUnaryCall(__Method_ComponentStats, null, options, request);
+      }
+      public virtual grpc::AsyncUnaryCall<global::Orrb.ComponentStatsResponse> ComponentStatsAsync(global::Orrb.ComponentStatsRequest request, grpc::Metadata headers = null, global::System.DateTime? deadline = null, global::System.Threading.CancellationToken cancellationToken = default(global::System.Threading.CancellationToken))
+      {
+        return ComponentStatsAsync(request, new grpc::CallOptions(headers, deadline, cancellationToken));
+      }
+      public virtual grpc::AsyncUnaryCall<global::Orrb.ComponentStatsResponse> ComponentStatsAsync(global::Orrb.ComponentStatsRequest request, grpc::CallOptions options)
+      {
+        return CallInvoker.AsyncUnaryCall(__Method_ComponentStats, null, options, request);
+      }
       /// <summary>Creates a new instance of client from given <c>ClientBaseConfiguration</c>.</summary>
       protected override RenderServiceClient NewInstance(ClientBaseConfiguration configuration)
       {
@@ -120,7 +239,10 @@ namespace Orrb {
     {
       return grpc::ServerServiceDefinition.CreateBuilder()
           .AddMethod(__Method_RenderBatch, serviceImpl.RenderBatch)
-          .AddMethod(__Method_Update, serviceImpl.Update).Build();
+          .AddMethod(__Method_RenderBatchStream, serviceImpl.RenderBatchStream)
+          .AddMethod(__Method_Update, serviceImpl.Update)
+          .AddMethod(__Method_Health, serviceImpl.Health)
+          .AddMethod(__Method_ComponentStats, serviceImpl.ComponentStats).Build();
     }
 
   }
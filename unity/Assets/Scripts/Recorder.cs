@@ -53,6 +53,9 @@ public class Recorder : MonoBehaviour {
 
     public RenderTexture last_render_ = null;
 
+    // Times reading the current batch back from the GPU, reset with every batch.
+    private System.Diagnostics.Stopwatch readback_watch_ = new System.Diagnostics.Stopwatch();
+
     private int render_texture_rgb_index_ = -1;
     private int render_texture_depth_index_ = -1;
     private int capture_count_ = 0;
@@ -79,6 +82,9 @@ public class Recorder : MonoBehaviour {
         private int height_ = 0;
         private int batch_size_ = 0;
         private bool alpha_ = false;
+        // The capture textures of every shape used so far, so that alternating
+        // between resolutions does not reallocate them.
+        private Dictionary<string, List<Texture2D>> captured_images_pool_ = new Dictionary<string, List<Texture2D>>();
 
         public CameraSetup(Camera camera, int batch_size, int width, int height,
                            bool alpha, CameraType camera_type) {
@@ -89,10 +95,21 @@ public class Recorder : MonoBehaviour {
             camera_type_ = camera_type;
             camera_name_ = camera.name;
             camera_ = PrepareCamera(camera);
+            captured_images_ = GetCapturedImages(width, height, alpha);
 
             ResetBatch(camera, batch_size, width, height, alpha, camera_type);
         }
 
+        private List<Texture2D> GetCapturedImages(int width, int height, bool alpha) {
+            string shape = string.Format("{0}x{1}x{2}", width, height, alpha);
+            List<Texture2D> captured_images = null;
+            if (!captured_images_pool_.TryGetValue(shape, out captured_images)) {
+                captured_images = new List<Texture2D>();
+                captured_images_pool_.Add(shape, captured_images);
+            }
+            return captured_images;
+        }
+
         // Set the current render texture.
         public void UpdateRenderTexture(RenderTexture next_render_texture) {
             camera_.targetTexture = next_render_texture;
@@ -126,7 +143,7 @@ public class Recorder : MonoBehaviour {
         public void ResetBatch(Camera camera, int batch_size, int width, int height,
                                bool alpha, CameraSetup.CameraType camera_type) {
             if (width != width_ || height != height_ || alpha != alpha_) {
-                captured_images_.Clear();
+                captured_images_ = GetCapturedImages(width, height, alpha);
                 width_ = width;
                 height_ = height;
                 alpha_ = alpha;
@@ -159,6 +176,8 @@ public class Recorder : MonoBehaviour {
 
         public void CleanUp() {
             captured_images_.Clear();
+            captured_images_pool_.Clear();
+            captured_images_pool_.Add(string.Format("{0}x{1}x{2}", width_, height_, alpha_), captured_images_);
             batch_size_ = 0;
         }
 
@@ -211,6 +230,9 @@ public class Recorder : MonoBehaviour {
     public List<RenderTexture> render_textures_rgb_ = new List<RenderTexture>();
     // Depth textures used for depth and surface normals
     public List<RenderTexture> render_textures_depth_ = new List<RenderTexture>();
+    // The render texture lists above, for every capture resolution used so far.
+    private Dictionary<string, List<RenderTexture>> render_textures_rgb_pool_ = new Dictionary<string, List<RenderTexture>>();
+    private Dictionary<string, List<RenderTexture>> render_textures_depth_pool_ = new Dictionary<string, List<RenderTexture>>();
 
     // Use this for initialization
     void Start() {
@@ -279,11 +301,30 @@ public class Recorder : MonoBehaviour {
 
         capture_count_ = 0;
         capture_next_frame_ = false;
+        readback_watch_.Reset();
+    }
+
+    // Seconds spent reading the current batch back from the GPU.
+    public float ReadbackTime() {
+        return (float)readback_watch_.Elapsed.TotalSeconds;
     }
 
     private void PrepareRenderTextures() {
-        PrepareRenderTextures(30, render_textures_rgb_, RenderTextureFormat.Default);
-        PrepareRenderTextures(30, render_textures_depth_, RenderTextureFormat.ARGBFloat);
+        render_textures_rgb_ = GetRenderTextures(render_textures_rgb_pool_, RenderTextureFormat.Default);
+        render_textures_depth_ = GetRenderTextures(render_textures_depth_pool_, RenderTextureFormat.ARGBFloat);
+    }
+
+    // Reuse the render textures prepared for the current capture resolution before.
+    private List<RenderTexture> GetRenderTextures(Dictionary<string, List<RenderTexture>> pool,
+                                                  RenderTextureFormat format) {
+        string shape = string.Format("{0}x{1}", capture_width_, capture_height_);
+        List<RenderTexture> texture_list = null;
+        if (!pool.TryGetValue(shape, out texture_list)) {
+            texture_list = new List<RenderTexture>();
+            PrepareRenderTextures(30, texture_list, format);
+            pool.Add(shape, texture_list);
+        }
+        return texture_list;
     }
 
     // Prepare a pool of render textures.
@@ -341,7 +382,9 @@ public class Recorder : MonoBehaviour {
             }
             capture_next_frame_ = false;
 
+            readback_watch_.Start();
             CaptureRenderTextures();
+            readback_watch_.Stop();
             RoundRobinRenderTextures();
 
             // The whole batch is done, apply, DMA and inform the consumers.
@@ -363,6 +406,7 @@ public class Recorder : MonoBehaviour {
     }
 
     private void ProcessBatch() {
+        readback_watch_.Start();
         RenderBatch batch = new RenderBatch();
 
         foreach (List<CameraSetup> camera_setups in camera_setups_.Values) {
@@ -396,6 +440,7 @@ public class Recorder : MonoBehaviour {
             }
         }
 
+        readback_watch_.Stop();
         batch_consumer_.ConsumeImageBatch(batch);
 
         capture_count_ = 0;
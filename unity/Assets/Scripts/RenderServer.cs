@@ -5,6 +5,7 @@ using UnityEngine;
 
 using StreamEntry = Orrb.RenderBatchResponse.Types.StreamEntry;
 using BatchResponseEntry = Orrb.RenderBatchResponse.Types.StreamEntry.Types.BatchResponseEntry;
+using PackedData = Orrb.RenderBatchResponse.Types.StreamEntry.Types.PackedData;
 using Google.Protobuf;
 using System.Threading;
 using System.IO;
@@ -32,6 +33,19 @@ using System;
 
 public class RenderServer : MonoBehaviour, IImageBatchConsumer {
 
+    // High resolution timestamps, for the ServerTimings returned with the batches.
+    private static long Now() {
+        return System.Diagnostics.Stopwatch.GetTimestamp();
+    }
+
+    private static float Seconds(long start, long end) {
+        return (float)(end - start) / System.Diagnostics.Stopwatch.Frequency;
+    }
+
+    private static float SecondsSince(long start) {
+        return Seconds(start, Now());
+    }
+
     private interface IRenderServerWorkload {
         void InitializeWorkload();
 
@@ -173,48 +187,192 @@ public class RenderServer : MonoBehaviour, IImageBatchConsumer {
         }
     }
 
-    // This workload runs the work triggered by a RenderBatch RPC.
+    // This workload runs the work triggered by a RenderBatch RPC. When
+    // streaming (RenderBatchStream RPC) the batch is rendered in chunks,
+    // and a response is emitted as soon as each chunk is recorded.
     private class RenderBatchWorkload : QueuedWorkloadRequest<Orrb.RenderBatchRequest, Orrb.RenderBatchResponse>, IRenderServerWorkload, IImageBatchConsumer {
 
         private float start_time_ = 0.0f;
         private int current_batch_entry_ = 0;
+        private int batch_size_ = 0;
+        private float[] packed_qpos_ = null;
+        private int packed_qpos_dim_ = 0;
+        private int[] packed_seeds_ = null;
+        private List<Camera> cameras_ = null;
+        private int chunk_size_ = 0;
+        private int chunk_start_ = 0;
+        private int chunk_length_ = 0;
+        private int frames_ = 0;
+        private List<TaskCompletionSource<Orrb.RenderBatchResponse>> chunk_promises_ = null;
         private BatchOutputContext output_context_ = null;
+        private List<Orrb.RendererComponent> overridden_configs_ = null;
         private bool done_ = false;
+        // The workload is created right before it is enqueued.
+        private long enqueued_time_ = Now();
+        private long chunk_start_time_ = 0;
+        private Orrb.ServerTimings timings_ = null;
+
+        public RenderBatchWorkload(RenderServer server, Orrb.RenderBatchRequest request, bool streaming) : base(server, request) {
+            UnpackRequest();
+            chunk_size_ = batch_size_;
+            if (streaming) {
+                chunk_size_ = request_.StreamChunkSize > 0 ? request_.StreamChunkSize : 1;
+                chunk_promises_ = new List<TaskCompletionSource<Orrb.RenderBatchResponse>>();
+                for (int i = 0; i < batch_size_; i += chunk_size_) {
+                    chunk_promises_.Add(new TaskCompletionSource<Orrb.RenderBatchResponse>());
+                }
+            }
+        }
+
+        // The streaming GRPC handler awaits these, one per chunk, in order.
+        public List<TaskCompletionSource<Orrb.RenderBatchResponse>> GetChunkPromises() {
+            return chunk_promises_;
+        }
+
+        // Decode the packed qpos and seeds tensors, if the request uses them
+        // instead of the per entry messages.
+        private void UnpackRequest() {
+            batch_size_ = request_.Entries.Count;
+            if (request_.PackedQpos.Length == 0) {
+                return;
+            }
 
-        public RenderBatchWorkload(RenderServer server, Orrb.RenderBatchRequest request) : base(server, request) { }
+            batch_size_ = request_.PackedQposShape[0];
+            packed_qpos_dim_ = request_.PackedQposShape.Count > 1 ? request_.PackedQposShape[1] : 0;
+            packed_qpos_ = new float[batch_size_ * packed_qpos_dim_];
+            Buffer.BlockCopy(request_.PackedQpos.ToByteArray(), 0, packed_qpos_, 0, packed_qpos_.Length * 4);
+
+            if (request_.PackedSeeds.Length > 0) {
+                packed_seeds_ = new int[batch_size_];
+                Buffer.BlockCopy(request_.PackedSeeds.ToByteArray(), 0, packed_seeds_, 0, batch_size_ * 4);
+            }
+        }
+
+        private IList<float> EntryQpos(int entry) {
+            if (packed_qpos_ != null) {
+                return new ArraySegment<float>(packed_qpos_, entry * packed_qpos_dim_, packed_qpos_dim_);
+            }
+            return request_.Entries[entry].Qpos;
+        }
+
+        private int EntrySeed(int entry) {
+            if (packed_qpos_ != null) {
+                return packed_seeds_ != null ? packed_seeds_[entry] : 0;
+            }
+            return request_.Entries[entry].Seed;
+        }
 
         public void InitializeWorkload() {
             Logger.Info("RenderBatchWorkload::InitializeWorkload::New render request.");
+            long initialize_time = Now();
             start_time_ = Time.realtimeSinceStartup;
-            output_context_ = new BatchOutputContext(request_.Entries.Count);
             current_batch_entry_ = 0;
+            chunk_start_ = 0;
+            frames_ = 0;
 
-            List<Camera> cameras = server_.scene_instance_.GetCameras(request_.CameraNames);
+            cameras_ = server_.scene_instance_.GetCameras(request_.CameraNames);
 
             // Make sure we can find all the requested cameras in the scene.
-            if (cameras.Count != request_.CameraNames.Count) {
+            if (cameras_ == null || cameras_.Count != request_.CameraNames.Count) {
                 Logger.Error("RenderServer::RenderBatchWorkload::InitializeWorkload::Cannot find all requested cameras.");
-                done_ = true;
+                Fail("Cannot find all requested cameras.");
+                return;
+            }
+
+            if (batch_size_ == 0) {
+                Logger.Error("RenderServer::RenderBatchWorkload::InitializeWorkload::Empty batch.");
+                Fail("Empty batch.");
+                return;
+            }
+
+            ApplyConfigOverrides();
+            StartChunk();
+            timings_.QueueWait = Seconds(enqueued_time_, initialize_time);
+            chunk_start_time_ = initialize_time;
+        }
+
+        // Apply the per batch component configs, remember the current configs of
+        // the overridden components so that they can be restored after the batch.
+        private void ApplyConfigOverrides() {
+            if (request_.ConfigOverrides.Count == 0) {
                 return;
             }
 
-            // Prepare the recorder, so that it has buffers ready.
-            server_.recorder_.ResetBatch(cameras, request_.Entries.Count, request_.Width, request_.Height,
+            ComponentManager manager = server_.scene_instance_.GetComponentManager();
+            overridden_configs_ = new List<Orrb.RendererComponent>();
+            foreach (Orrb.RendererComponent config_override in request_.ConfigOverrides) {
+                Orrb.RendererComponentConfig current_config = manager.GetComponentConfig(config_override.Name);
+                if (current_config == null) {
+                    Logger.Warning("RenderBatchWorkload::ApplyConfigOverrides::Cannot find component: {0}.",
+                                   config_override.Name);
+                    continue;
+                }
+                Orrb.RendererComponent overridden_config = new Orrb.RendererComponent();
+                overridden_config.Name = config_override.Name;
+                overridden_config.Config = current_config;
+                overridden_configs_.Add(overridden_config);
+                manager.UpdateComponent(config_override.Name, config_override.Config);
+            }
+        }
+
+        // Called once the whole batch is recorded, or if it failed.
+        private void RestoreConfigOverrides() {
+            if (overridden_configs_ == null) {
+                return;
+            }
+
+            ComponentManager manager = server_.scene_instance_.GetComponentManager();
+            foreach (Orrb.RendererComponent overridden_config in overridden_configs_) {
+                manager.UpdateComponent(overridden_config.Name, overridden_config.Config);
+            }
+            overridden_configs_ = null;
+        }
+
+        // Prepare the recorder, so that it has buffers ready for the next chunk.
+        private void StartChunk() {
+            chunk_start_time_ = Now();
+            timings_ = new Orrb.ServerTimings();
+            chunk_length_ = Math.Min(chunk_size_, batch_size_ - chunk_start_);
+            output_context_ = new BatchOutputContext(chunk_length_);
+            server_.recorder_.ResetBatch(cameras_, chunk_length_, request_.Width, request_.Height,
                                          request_.RenderAlpha, request_.RenderDepth, request_.RenderNormals,
                                          request_.RenderSegmentation);
         }
 
+        private void Fail(string message) {
+            RpcException error = new RpcException(new Status(StatusCode.InvalidArgument, message));
+            response_promise_.TrySetException(error);
+            if (chunk_promises_ != null) {
+                foreach (TaskCompletionSource<Orrb.RenderBatchResponse> chunk_promise in chunk_promises_) {
+                    chunk_promise.TrySetException(error);
+                }
+            }
+            RestoreConfigOverrides();
+            done_ = true;
+        }
+
         // Render one state (frame).
         public void ProcessWorkload() {
+            // Wait for the recorder to finish the current chunk.
+            if (done_ || current_batch_entry_ >= chunk_start_ + chunk_length_) {
+                return;
+            }
+
             int seed = request_.BatchSeed + current_batch_entry_;
             if (request_.UseEntrySeeds) {
-                seed = request_.Entries[current_batch_entry_].Seed;
+                seed = EntrySeed(current_batch_entry_);
             }
             UnityEngine.Random.InitState(seed);
-            server_.scene_instance_.UpdateState(request_.Entries[current_batch_entry_].Qpos);
+            long update_start = Now();
+            server_.scene_instance_.UpdateState(EntryQpos(current_batch_entry_));
+            long components_start = Now();
+            timings_.UpdateState += Seconds(update_start, components_start);
             server_.scene_instance_.GetComponentManager().RunComponents(output_context_);
             output_context_.Advance();
+            long capture_start = Now();
+            timings_.RunComponents += Seconds(components_start, capture_start);
             server_.recorder_.Capture();
+            timings_.Capture += SecondsSince(capture_start);
             current_batch_entry_++;
         }
 
@@ -225,32 +383,56 @@ public class RenderServer : MonoBehaviour, IImageBatchConsumer {
         // The RenderBatchWorkload is also an ImageBatchConsumer, when the
         // Recorder is done it will send the batch here (through the RenderServer).
         public void ConsumeImageBatch(RenderBatch batch) {
+            long build_start = Now();
+            timings_.Readback = server_.recorder_.ReadbackTime();
 
             Orrb.RenderBatchResponse response = new Orrb.RenderBatchResponse();
+            response.EntriesOffset = chunk_start_;
+            response.EntriesCount = chunk_length_;
 
             // Build the GRPC response from the recorded images...
-            int frames = 0;
             foreach (KeyValuePair<string, RenderBatch.CameraBatch> pair in batch.camera_batches_) {
-                Tuple<int, StreamEntry> stream_info = StreamFromBatch(pair.Key, pair.Value);
+                Tuple<int, StreamEntry> stream_info = StreamFromBatch(pair.Key, pair.Value, request_.PackedImages);
                 response.Streams.Add(stream_info.Item2);
-                frames += stream_info.Item1;
+                frames_ += stream_info.Item1;
             }
 
             // ... and the auxiliary outputs.
             output_context_.BuildResponseStreams(response);
 
+            timings_.BuildResponse = SecondsSince(build_start);
+            timings_.Total = SecondsSince(chunk_start_time_);
+            timings_.Frames = chunk_length_;
+            response.ServerTimings = timings_;
+
+            if (chunk_promises_ != null) {
+                chunk_promises_[chunk_start_ / chunk_size_].SetResult(response);
+                chunk_start_ += chunk_length_;
+                if (chunk_start_ < batch_size_) {
+                    StartChunk();
+                    return;
+                }
+            } else {
+                response_promise_.SetResult(response);
+            }
+
             float delta_time = Time.realtimeSinceStartup - start_time_;
-            response_promise_.SetResult(response);
             Logger.Info("RenderBatchWorkload::ConsumeImageBatch::Batch finished: {0} images in {1} ({2}).",
-                        frames, delta_time, frames / delta_time);
+                        frames_, delta_time, frames_ / delta_time);
 
+            RestoreConfigOverrides();
             done_ = true;
         }
 
-        private static Tuple<int, StreamEntry> StreamFromBatch(string name, RenderBatch.CameraBatch batch_stream) {
+        private static Tuple<int, StreamEntry> StreamFromBatch(string name, RenderBatch.CameraBatch batch_stream,
+                                                               bool packed) {
             StreamEntry stream = new StreamEntry();
             stream.Name = name;
 
+            if (packed) {
+                return PackedStreamFromBatch(stream, batch_stream);
+            }
+
             int count = 0;
             foreach (KeyValuePair<RenderBatch.CameraBatch.RenderType, List<Texture2D>> pair in batch_stream.images_) {
                 int i = 0;
@@ -291,41 +473,148 @@ public class RenderServer : MonoBehaviour, IImageBatchConsumer {
             return stream_info;
         }
 
+        // The scratch buffer for packing, grown to the biggest blob packed so far, only its
+        // first size bytes are used. The workloads run on the main thread only, and the data
+        // is copied into the response, so it can be reused.
+        private static byte[] packed_buffer_ = new byte[0];
+
+        private static byte[] GetPackedBuffer(int size) {
+            if (packed_buffer_.Length < size) {
+                packed_buffer_ = new byte[size];
+            }
+            return packed_buffer_;
+        }
+
+        // Pack all the frames of a given type into one blob, this is much
+        // cheaper to parse on the client side than per entry messages.
+        private static Tuple<int, StreamEntry> PackedStreamFromBatch(StreamEntry stream,
+                                                                     RenderBatch.CameraBatch batch_stream) {
+            int count = 0;
+            foreach (KeyValuePair<RenderBatch.CameraBatch.RenderType, List<Texture2D>> pair in batch_stream.images_) {
+                count = pair.Value.Count;
+                if (count == 0) {
+                    continue;
+                }
+
+                Texture2D first = pair.Value[0];
+                int pixels = first.width * first.height;
+                int channels = 0;
+                int pixel_size = 0;
+                switch (pair.Key) {
+                    case RenderBatch.CameraBatch.RenderType.RGB:
+                        channels = first.GetRawTextureData().Length / pixels;
+                        pixel_size = channels;
+                        break;
+                    case RenderBatch.CameraBatch.RenderType.DEPTH:
+                        pixel_size = 4;
+                        break;
+                    case RenderBatch.CameraBatch.RenderType.NORMALS:
+                        channels = 3;
+                        pixel_size = 12;
+                        break;
+                    case RenderBatch.CameraBatch.RenderType.SEGMENTATION:
+                        pixel_size = 1;
+                        break;
+                    default:
+                        Logger.Error("Unsupported Batch.Stream.Type {0}", pair.Key);
+                        continue;
+                }
+
+                int frame_size = pixels * pixel_size;
+                byte[] packed_array = GetPackedBuffer(count * frame_size);
+                for (int i = 0; i < count; ++i) {
+                    Texture2D image = pair.Value[i];
+                    switch (pair.Key) {
+                        case RenderBatch.CameraBatch.RenderType.RGB:
+                            Array.Copy(image.GetRawTextureData(), 0, packed_array, i * frame_size, frame_size);
+                            break;
+                        case RenderBatch.CameraBatch.RenderType.DEPTH:
+                            ReadDepth(image, packed_array, i * frame_size);
+                            break;
+                        case RenderBatch.CameraBatch.RenderType.NORMALS:
+                            ReadNormals(image, packed_array, i * frame_size);
+                            break;
+                        case RenderBatch.CameraBatch.RenderType.SEGMENTATION:
+                            ReadSegmentation(image, packed_array, i * frame_size);
+                            break;
+                    }
+                }
+
+                PackedData packed = new PackedData();
+                packed.Data = ByteString.CopyFrom(packed_array, 0, count * frame_size);
+                packed.Shape.Add(count);
+                packed.Shape.Add(first.height);
+                packed.Shape.Add(first.width);
+                if (channels > 0) {
+                    packed.Shape.Add(channels);
+                }
+
+                switch (pair.Key) {
+                    case RenderBatch.CameraBatch.RenderType.RGB:
+                        stream.PackedImageData = packed;
+                        break;
+                    case RenderBatch.CameraBatch.RenderType.DEPTH:
+                        stream.PackedDepthData = packed;
+                        break;
+                    case RenderBatch.CameraBatch.RenderType.NORMALS:
+                        stream.PackedNormalsData = packed;
+                        break;
+                    case RenderBatch.CameraBatch.RenderType.SEGMENTATION:
+                        stream.PackedSegmentationData = packed;
+                        break;
+                }
+            }
+
+            return new Tuple<int, StreamEntry>(count, stream);
+        }
+
         private static ByteString ReadDepth(Texture2D texture) {
+            byte[] depth_array = new byte[texture.width * texture.height * 4];  // float32, so 4 bytes
+            ReadDepth(texture, depth_array, 0);
+            return ByteString.CopyFrom(depth_array);
+        }
+
+        private static void ReadDepth(Texture2D texture, byte[] depth_array, int offset) {
             // Read depth from RGBAFloat texture where its stored in R channel
             int size = texture.width * texture.height;
-            byte[] depth_array = new byte[size * 4];  // float32, so 4 bytes
             byte[] texture_array = texture.GetRawTextureData();
             for (int i = 0; i < size; ++i) {
                 for (int j = 0; j < 4; ++j) {
-                    depth_array[i * 4 + j] = texture_array[i * 16 + j];
+                    depth_array[offset + i * 4 + j] = texture_array[i * 16 + j];
                 }
             }
-            return ByteString.CopyFrom(depth_array);
         }
 
         private static ByteString ReadNormals(Texture2D texture) {
+            byte[] normals_array = new byte[texture.width * texture.height * 3 * 4];  // 3 times float32, so 3 * 4 bytes
+            ReadNormals(texture, normals_array, 0);
+            return ByteString.CopyFrom(normals_array);
+        }
+
+        private static void ReadNormals(Texture2D texture, byte[] normals_array, int offset) {
             // Read surface normals from RGBAFloat texture where they're stored in GBA channels
             int size = texture.width * texture.height;
-            byte[] normals_array = new byte[size * 3 * 4];  // 3 times float32, so 3 * 4 bytes
             byte[] texture_array = texture.GetRawTextureData();
             for (int i = 0; i < size; ++i) {
                 for (int j = 0; j < 12; ++j) {
                     // offset by 4 since first channel is depth
-                    normals_array[i * 12 + j] = texture_array[i * 16 + 4 + j];
+                    normals_array[offset + i * 12 + j] = texture_array[i * 16 + 4 + j];
                 }
             }
-            return ByteString.CopyFrom(normals_array);
         }
 
         private static ByteString ReadSegmentation(Texture2D texture) {
+            byte[] segmentation_array = new byte[texture.width * texture.height];
+            ReadSegmentation(texture, segmentation_array, 0);
+            return ByteString.CopyFrom(segmentation_array);
+        }
+
+        private static void ReadSegmentation(Texture2D texture, byte[] segmentation_array, int offset) {
             int size = texture.width * texture.height;
-            byte[] segmentation_array = new byte[size];
             byte[] texture_array = texture.GetRawTextureData();
             for (int i = 0; i < size; ++i) {
-                segmentation_array[i] = texture_array[i * 3]; // 3 RGB channels
+                segmentation_array[offset + i] = texture_array[i * 3]; // 3 RGB channels
             }
-            return ByteString.CopyFrom(segmentation_array);
         }
     }
 
@@ -342,8 +631,9 @@ public class RenderServer : MonoBehaviour, IImageBatchConsumer {
             foreach (Orrb.RendererComponent config in request_.Components) {
                 manager.UpdateComponent(config.Name, config.Config);
             }
+            // The updates carry just the changed properties, log them instead of the whole config.
             JsonFormatter formatter = new JsonFormatter(JsonFormatter.Settings.Default);
-            Logger.Info("UpdateWorkload::ProcessWorkload::New config after update: {0}", formatter.Format(manager.GetConfig()));
+            Logger.Info("UpdateWorkload::ProcessWorkload::Updated: {0}", formatter.Format(request_));
             response_promise_.SetResult(new Orrb.UpdateResponse());
         }
 
@@ -352,6 +642,32 @@ public class RenderServer : MonoBehaviour, IImageBatchConsumer {
         }
     }
 
+    // This instant workload switches the per component profiling, and
+    // returns the stats. It runs on the main loop, like the components.
+    private class ComponentStatsWorkload : QueuedWorkloadRequest<Orrb.ComponentStatsRequest, Orrb.ComponentStatsResponse>, IRenderServerWorkload {
+
+        public ComponentStatsWorkload(RenderServer server, Orrb.ComponentStatsRequest request) : base(server, request) { }
+
+        public void InitializeWorkload() { }
+
+        public void ProcessWorkload() {
+            ComponentManager manager = server_.scene_instance_.GetComponentManager();
+            if (request_.SetProfiling) {
+                Logger.Info("ComponentStatsWorkload::ProcessWorkload::Profiling: {0}", request_.Profiling);
+                manager.SetProfiling(request_.Profiling);
+            }
+            Orrb.ComponentStatsResponse response = manager.GetComponentStats();
+            if (request_.Reset) {
+                manager.ResetProfiles();
+            }
+            response_promise_.SetResult(response);
+        }
+
+        public bool WorkloadDone() {
+            return true;
+        }
+    }
+
     // GRPC RenderService implementation, just a proxy that that delegates
     // to the parent RenderServer class.
     private class RenderServiceImpl : Orrb.RenderService.RenderServiceBase {
@@ -363,16 +679,41 @@ public class RenderServer : MonoBehaviour, IImageBatchConsumer {
         }
 
         public override Task<Orrb.RenderBatchResponse> RenderBatch(Orrb.RenderBatchRequest request, ServerCallContext context) {
-            RenderBatchWorkload workload = new RenderBatchWorkload(server_, request);
+            RenderBatchWorkload workload = new RenderBatchWorkload(server_, request, false);
             server_.EnqueueWorkload(workload);
             return workload.response_promise_.Task;
         }
 
+        public override async Task RenderBatchStream(Orrb.RenderBatchRequest request,
+                                                     IServerStreamWriter<Orrb.RenderBatchResponse> response_stream,
+                                                     ServerCallContext context) {
+            RenderBatchWorkload workload = new RenderBatchWorkload(server_, request, true);
+            server_.EnqueueWorkload(workload);
+            foreach (TaskCompletionSource<Orrb.RenderBatchResponse> chunk_promise in workload.GetChunkPromises()) {
+                await response_stream.WriteAsync(await chunk_promise.Task);
+            }
+        }
+
         public override Task<Orrb.UpdateResponse> Update(Orrb.UpdateRequest request, ServerCallContext context) {
             UpdateWorkload workload = new UpdateWorkload(server_, request);
             server_.EnqueueWorkload(workload);
             return workload.response_promise_.Task;
         }
+
+        // Does not wait for the main loop, a server busy rendering is still healthy.
+        public override Task<Orrb.HealthResponse> Health(Orrb.HealthRequest request, ServerCallContext context) {
+            Orrb.HealthResponse response = new Orrb.HealthResponse();
+            response.Serving = true;
+            response.QueuedWorkloads = server_.QueuedWorkloadsCount();
+            return Task.FromResult(response);
+        }
+
+        public override Task<Orrb.ComponentStatsResponse> ComponentStats(Orrb.ComponentStatsRequest request,
+                                                                         ServerCallContext context) {
+            ComponentStatsWorkload workload = new ComponentStatsWorkload(server_, request);
+            server_.EnqueueWorkload(workload);
+            return workload.response_promise_.Task;
+        }
     }
 
     [SerializeField]
@@ -463,6 +804,12 @@ public class RenderServer : MonoBehaviour, IImageBatchConsumer {
         }
     }
 
+    private int QueuedWorkloadsCount() {
+        lock (queue_) {
+            return queue_.Count;
+        }
+    }
+
     // The main loop will use this to pull a new workload from the queue,
     // or wait (in a blocking fashion) till next one comes.
     private IRenderServerWorkload GetNextWorkload() {